@@ -5,7 +5,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils.html import format_html
 from django.contrib import messages
 from django.contrib.auth.models import User
-from apps.account.models import UserProfile
+from apps.account.models import UserProfile, AccountDeactivationJob
 from apps.notification.utils import send_verification_notification, send_verification_failure_email
 from django.utils.safestring import mark_safe
 
@@ -72,3 +72,11 @@ class UserProfileAdmin(admin.ModelAdmin):
             self.message_user(request, f"알림 전송 실패: {e}", messages.ERROR)
 
         return redirect(f'../../{user_id}/change/')
+
+
+@admin.register(AccountDeactivationJob)
+class AccountDeactivationJobAdmin(admin.ModelAdmin):
+    list_display = ('user', 'status', 'step', 'progress', 'created_at', 'updated_at', 'finished_at')
+    list_filter = ('status',)
+    search_fields = ('user__username', 'user__email')
+    readonly_fields = ('user', 'status', 'step', 'progress', 'last_error', 'created_at', 'updated_at', 'finished_at')
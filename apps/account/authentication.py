@@ -0,0 +1,79 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import UserProfile
+
+AUTH_USER_CACHE_TTL = 60
+AUTH_USER_KEY = "account:auth_user:{}"
+
+
+def _concrete_fields(model, exclude=()):
+    # Model.from_db 에 넘길 값 순서 (모델 필드 선언 순서)
+    return tuple(f.attname for f in model._meta.concrete_fields if f.attname not in exclude)
+
+
+# 캐시에 담는 필드: 비밀번호 해시는 캐시에 두지 않음 (check_password 등 필요할 때만 조회)
+CACHED_USER_FIELDS = _concrete_fields(User, exclude={"password"})
+CACHED_PROFILE_FIELDS = _concrete_fields(UserProfile)
+
+
+def invalidate_auth_user(user_id):
+    cache.delete(AUTH_USER_KEY.format(user_id))
+
+
+def _load_auth_user(user_id):
+    """
+    - DB에서 유저/프로필 조회 (유저 1 + 프로필 1 쿼리)
+    - 반환: {"user": [...], "profile": [...] 또는 None}, 유저가 없으면 None
+    """
+    user_values = User.objects.filter(id=user_id).values_list(*CACHED_USER_FIELDS).first()
+    if user_values is None:
+        return None
+    profile_values = UserProfile.objects.filter(user_id=user_id).values_list(*CACHED_PROFILE_FIELDS).first()
+    return {"user": list(user_values), "profile": list(profile_values) if profile_values else None}
+
+
+def _build_user(data):
+    """
+    - 캐시 값으로 User/UserProfile 인스턴스 구성 (from_db, password 만 지연 로딩)
+    - user.profile 은 미리 연결해 두어 프로필 조회 쿼리 없음
+    - 지연 필드가 있는 User 의 save() 는 로드된 필드만 저장하므로 쓰기 뷰에서도 안전
+    """
+    user = User.from_db(DEFAULT_DB_ALIAS, CACHED_USER_FIELDS, data["user"])
+    if data["profile"] is not None:
+        profile = UserProfile.from_db(DEFAULT_DB_ALIAS, CACHED_PROFILE_FIELDS, data["profile"])
+        profile._state.fields_cache["user"] = user
+        user._state.fields_cache["profile"] = profile
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    - JWTAuthentication 과 같은 토큰 검증, 유저는 짧은 TTL 의 유저별 캐시에서 복원
+    - 캐시 적중 시 유저/프로필 조회 쿼리 없음, 미스 시 DB 조회 후 저장
+    - 프로필 변경/탈퇴/인증 승인 등 User·UserProfile 저장 시 signals 에서 무효화
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = AUTH_USER_KEY.format(user_id)
+        data = cache.get(key)
+        if data is None:
+            data = _load_auth_user(user_id)
+            if data is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, data, AUTH_USER_CACHE_TTL)
+
+        user = _build_user(data)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,65 @@
+from bisect import bisect_left
+
+from django.core.cache import cache
+
+from .models import UserProfile
+
+BLOCKED_USER_IDS_CACHE_TTL = 60 * 60 * 24
+BLOCKED_USER_IDS_KEY = "account:blocked_user_ids:{}"
+
+
+def _load_blocked_user_ids(user_id):
+    """
+    - DB에서 차단 관계 조회 (내가 차단한 유저 + 나를 차단한 유저)
+    """
+    through = UserProfile.blocked_users.through
+    i_blocked = through.objects.filter(userprofile__user_id=user_id).values_list("user_id", flat=True)
+    blocked_me = through.objects.filter(user_id=user_id).values_list("userprofile__user_id", flat=True)
+    return tuple(sorted(set(i_blocked) | set(blocked_me)))
+
+
+def get_blocked_user_ids(user):
+    """
+    - user 와 서로 보이지 않아야 하는 유저 id (양방향 차단, 정렬된 tuple)
+    - 요청 간에는 캐시, 요청 안에서는 user 객체에 저장해서 한 번만 조회
+    - 비로그인 유저는 ()
+    """
+    if not user or not user.is_authenticated:
+        return ()
+
+    blocked_ids = getattr(user, "_blocked_user_ids", None)
+    if blocked_ids is None:
+        key = BLOCKED_USER_IDS_KEY.format(user.id)
+        blocked_ids = cache.get(key)
+        if blocked_ids is None:
+            blocked_ids = _load_blocked_user_ids(user.id)
+            cache.set(key, blocked_ids, BLOCKED_USER_IDS_CACHE_TTL)
+        user._blocked_user_ids = blocked_ids
+    return blocked_ids
+
+
+def is_blocked(user, other_user_id):
+    """
+    - 두 유저 사이에 (어느 쪽이든) 차단 관계가 있는지
+    """
+    blocked_ids = get_blocked_user_ids(user)
+    index = bisect_left(blocked_ids, other_user_id)
+    return index < len(blocked_ids) and blocked_ids[index] == other_user_id
+
+
+def exclude_blocked(queryset, user, field="author"):
+    """
+    - queryset 에서 차단 관계 유저(field)가 작성한 항목 제외
+    - 서브쿼리 대신 캐시된 id 목록으로 필터링
+    """
+    blocked_ids = get_blocked_user_ids(user)
+    if not blocked_ids:
+        return queryset
+    return queryset.exclude(**{f"{field}_id__in": blocked_ids})
+
+
+def invalidate_blocked_user_ids(user_ids):
+    """
+    - 차단 관계가 바뀐 유저들의 캐시 삭제 (차단한 쪽, 차단당한 쪽 모두)
+    """
+    cache.delete_many([BLOCKED_USER_IDS_KEY.format(user_id) for user_id in set(user_ids)])
@@ -0,0 +1,142 @@
+import re
+import threading
+import time
+
+import jwt
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+GOOGLE_ID_TOKEN_ALGORITHMS = ["RS256"]
+# Cache-Control 이 없을 때 JWKS 를 재사용할 시간(초)
+DEFAULT_JWKS_MAX_AGE = 60 * 5
+# 모르는 kid 때문에 JWKS 를 다시 받는 최소 간격(초) — 위조 토큰으로 인증서 서버를 두드리지 못하게
+JWKS_MIN_REFRESH_INTERVAL = 60
+JWKS_REQUEST_TIMEOUT = 5
+# 서버 간 시계 오차 허용(초)
+CLOCK_SKEW_LEEWAY = 30
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def cache_max_age(response):
+    """
+    - JWKS 응답의 HTTP 캐시 헤더로 재사용 가능한 시간(초) 계산
+    - Cache-Control max-age 에서 Age 를 뺀 값, no-store/no-cache 면 0
+    """
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    if not match:
+        return DEFAULT_JWKS_MAX_AGE
+    try:
+        age = int(response.headers.get("Age", 0))
+    except ValueError:
+        age = 0
+    return max(int(match.group(1)) - age, 0)
+
+
+class GoogleIdTokenVerifier:
+    """
+    - Google ID Token 서명/클레임을 로컬에서 검증 (PyJWT)
+    - 서명 키(JWKS)는 캐시 헤더가 허용하는 동안 메모리에 보관, 세션(커넥션 풀)은 재사용
+    - 키를 새로 받지 못하면 이전에 받은 키로 계속 검증 (인증서 서버 장애가 로그인 장애로 번지지 않도록)
+    - 검증 실패는 ValueError (google.oauth2.id_token.verify_oauth2_token 과 동일)
+    """
+
+    def __init__(self, audience, jwks_url, session=None):
+        self.audience = audience
+        self.jwks_url = jwks_url
+        self.session = session or self._build_session()
+        self._keys = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_session():
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=1))
+        return session
+
+    def _refresh_keys(self):
+        response = self.session.get(self.jwks_url, timeout=JWKS_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        keys = {}
+        for jwk in jwt.PyJWKSet.from_dict(response.json()).keys:
+            if jwk.key_id:
+                keys[jwk.key_id] = jwk
+        now = time.monotonic()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + cache_max_age(response)
+
+    def get_signing_key(self, kid):
+        """
+        - kid 에 해당하는 서명 키 (캐시 만료 또는 모르는 kid 면 JWKS 재조회)
+        """
+        now = time.monotonic()
+        if kid in self._keys and now < self._expires_at:
+            return self._keys[kid]
+
+        with self._lock:
+            now = time.monotonic()
+            expired = now >= self._expires_at
+            # 키 교체 직후의 새 kid 는 캐시가 남아 있어도 다시 받되, 너무 자주 받지는 않음
+            unknown = kid not in self._keys and now - self._fetched_at >= JWKS_MIN_REFRESH_INTERVAL
+            if expired or unknown:
+                try:
+                    self._refresh_keys()
+                except (requests.RequestException, ValueError, jwt.PyJWTError) as e:
+                    if not self._keys:
+                        raise ValueError(f"Could not fetch Google certificates: {e}")
+                    print(f"[WARNING] Google 인증서 갱신 실패, 이전 키 사용: {e}")
+                    # 장애 중에는 요청마다 재시도하지 않음
+                    self._fetched_at = now
+                    self._expires_at = now + JWKS_MIN_REFRESH_INTERVAL
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise ValueError("Unknown Google certificate key id.")
+        return key
+
+    def verify(self, token):
+        """
+        - 서명, aud, iss, exp/iat 검증 후 클레임 반환
+        """
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = self.get_signing_key(kid)
+            return jwt.decode(
+                token,
+                key.key,
+                algorithms=GOOGLE_ID_TOKEN_ALGORITHMS,
+                audience=self.audience,
+                issuer=GOOGLE_ISSUERS,
+                leeway=CLOCK_SKEW_LEEWAY,
+                options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+            )
+        except jwt.PyJWTError as e:
+            raise ValueError(f"Invalid Google ID Token: {e}")
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_google_id_token_verifier():
+    """
+    - 프로세스 전체에서 공유하는 검증기 (JWKS 캐시/세션 공유)
+    """
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = GoogleIdTokenVerifier(settings.GOOGLE_CLIENT_ID, settings.GOOGLE_JWKS_URL)
+    return _verifier
+
+
+def verify_google_id_token(token):
+    return get_google_id_token_verifier().verify(token)
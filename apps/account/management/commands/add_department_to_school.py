@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from apps.account.models import School, Department
+from core.bulk import bulk_load
 
 DEPARTMENTS = [
     "College of Humanities",
@@ -102,20 +103,19 @@ class Command(BaseCommand):
     help = "Add departments to all schools"
 
     def handle(self, *args, **kwargs):
-        schools = School.objects.all()
-        total_added = 0
+        school_ids = list(School.objects.values_list("id", flat=True))
 
-        if not schools.exists():
+        if not school_ids:
             self.stdout.write(self.style.ERROR("❌ No schools found in the database. Please add schools first."))
             return
 
-        for school in schools:
-            count = 0
-            for dept_name in DEPARTMENTS:
-                _, created = Department.objects.get_or_create(school=school, name=dept_name)
-                if created:
-                    count += 1
-            self.stdout.write(self.style.SUCCESS(f"✅ {count} departments added for {school.name}"))
-            total_added += count
-        
-        self.stdout.write(self.style.SUCCESS(f"🎉 Total {total_added} departments added to all schools."))
+        # 학교 × 학과 조합을 한 번에 비교/삽입
+        result = bulk_load(
+            Department,
+            ({"school_id": school_id, "name": dept_name} for school_id in school_ids for dept_name in DEPARTMENTS),
+            key_fields=("school_id", "name"),
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 {result.inserted} departments added to {len(school_ids)} schools ({result.skipped} skipped)."
+        ))
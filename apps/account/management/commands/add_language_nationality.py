@@ -1,5 +1,7 @@
 from django.core.management.base import BaseCommand
 from apps.account.models import Language, Nationality
+from core.bulk import bulk_load
+from core.reference_data import invalidate_reference_data
 
 class Command(BaseCommand):
     help = "Populate initial Language and Nationality data"
@@ -21,13 +23,12 @@ class Command(BaseCommand):
             "Uzbekistan", "Vietnam", "Zimbabwe"
         ]
 
-        created_languages = Language.objects.bulk_create(
-            [Language(language=l) for l in languages],
-            ignore_conflicts=True
-        )
-        created_nationalities = Nationality.objects.bulk_create(
-            [Nationality(name=c) for c in countries],
-            ignore_conflicts=True
-        )
+        language_result = bulk_load(Language, ({"language": l} for l in languages), key_fields=("language",))
+        nationality_result = bulk_load(Nationality, ({"name": c} for c in countries), key_fields=("name",))
+        # bulk_create 는 post_save 시그널이 없으므로 목록 캐시를 직접 무효화
+        invalidate_reference_data("languages", "nationalities")
 
-        self.stdout.write(self.style.SUCCESS(f"✅ {len(languages)} languages and {len(countries)} nationalities inserted (duplicates ignored)."))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {language_result.inserted} languages and {nationality_result.inserted} nationalities inserted "
+            f"({language_result.skipped + nationality_result.skipped} skipped)."
+        ))
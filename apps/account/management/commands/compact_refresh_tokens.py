@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.account.tokens import compact_refresh_tokens, compactable_tokens
+
+
+class Command(BaseCommand):
+    help = "블랙리스트/만료/탈퇴 유저의 refresh 토큰 행을 삭제해 토큰 테이블 정리"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 수만 출력")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            count = compactable_tokens().count()
+            self.stdout.write(self.style.WARNING(f"{count} compactable tokens found (dry run)."))
+            return
+
+        deleted = compact_refresh_tokens()
+        self.stdout.write(self.style.SUCCESS(f"✅ {deleted} tokens deleted."))
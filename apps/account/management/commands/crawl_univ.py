@@ -2,6 +2,8 @@ import requests
 from bs4 import BeautifulSoup
 from django.core.management.base import BaseCommand
 from apps.account.models import School
+from core.bulk import bulk_load
+from core.reference_data import invalidate_reference_data
 
 class Command(BaseCommand):
     help = "Crawl universities from Wikipedia..."
@@ -17,6 +19,7 @@ class Command(BaseCommand):
         # mw-parser-output 안의 <ul> -> <li> 목록을 찾는다
         lis = soup.select("div.mw-parser-output > ul > li")
 
+        college_names = []
         for li in lis:
             # li 내 첫 번째 a 태그 찾기
             first_link = li.find("a")
@@ -29,6 +32,11 @@ class Command(BaseCommand):
             # (혹은 'University' 등 다른 조건을 추가해도 됨)
             if "College" in college_name or "University" in college_name:
                 print(college_name)
-                School.objects.get_or_create(name=college_name)
+                college_names.append(college_name)
 
-        self.stdout.write(self.style.SUCCESS("Crawling completed!"))
\ No newline at end of file
+        result = bulk_load(School, ({"name": name} for name in college_names), key_fields=("name",))
+        # bulk_create 는 post_save 시그널이 없으므로 목록 캐시를 직접 무효화
+        invalidate_reference_data("schools")
+        self.stdout.write(self.style.SUCCESS(
+            f"Crawling completed! {result.inserted} schools added ({result.skipped} skipped)."
+        ))
\ No newline at end of file
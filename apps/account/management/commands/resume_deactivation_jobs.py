@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.account.models import AccountDeactivationJob
+from apps.account.tasks import run_account_deactivation
+
+
+class Command(BaseCommand):
+    help = "끝나지 않은 회원탈퇴 후처리 작업을 중단된 단계부터 다시 실행"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-minutes", type=int, default=30,
+            help="마지막 진행 후 이 시간(분)이 지난 작업만 재개 (진행 중인 작업 중복 실행 방지)",
+        )
+        parser.add_argument("--inline", action="store_true", help="큐에 넣지 않고 이 프로세스에서 바로 실행")
+        parser.add_argument("--dry-run", action="store_true", help="재개하지 않고 대상만 출력")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options["stale_minutes"])
+        jobs = AccountDeactivationJob.objects.exclude(
+            status=AccountDeactivationJob.Status.DONE
+        ).filter(updated_at__lt=cutoff).order_by("id")
+
+        count = 0
+        for job in jobs:
+            count += 1
+            self.stdout.write(
+                f"job={job.id} user={job.user_id} status={job.status} step={job.step or '-'} "
+                f"progress={job.progress} error={job.last_error or '-'}"
+            )
+            if options["dry_run"]:
+                continue
+            if options["inline"]:
+                run_account_deactivation.apply(args=(job.id,))
+            else:
+                run_account_deactivation.delay(job.id)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{count} unfinished jobs found (dry run)."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✅ {count} jobs resumed."))
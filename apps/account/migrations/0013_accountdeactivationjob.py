@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-19 14:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0012_remove_userprofile_language_userprofile_languages'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountDeactivationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('RUNNING', '진행 중'), ('DONE', '완료'), ('FAILED', '실패')], default='PENDING', max_length=10)),
+                ('step', models.CharField(blank=True, max_length=50)),
+                ('progress', models.JSONField(blank=True, default=dict)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='deactivation_job', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.5 on 2026-10-19 14:13
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0013_accountdeactivationjob'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='nationality',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='nationality_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='school',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='school_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
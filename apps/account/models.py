@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.contrib.auth.models import User
 from fcm_django.models import FCMDevice
@@ -9,6 +10,12 @@ class School(models.Model):
     """
     name = models.CharField(max_length=200, unique=True)
 
+    class Meta:
+        indexes = [
+            # 검색어 자동완성의 trigram 보충 검색용
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='school_name_trgm_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -45,6 +52,11 @@ class Language(models.Model):
 class Nationality(models.Model):
     name = models.CharField(max_length=100, unique=True)  # 영어 국가명
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='nationality_name_trgm_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -88,3 +100,29 @@ class UserProfile(models.Model):
         return self.nickname or self.user.username
 
 
+
+
+class AccountDeactivationJob(models.Model):
+    """
+    회원탈퇴 후처리 작업 (백그라운드 태스크에서 단계별로 진행)
+    - step: 진행 중(또는 다음에 실행할) 단계, 완료 시 빈 문자열
+    - progress: {단계 이름: 처리한 행 수}
+    - 각 단계는 여러 번 실행해도 결과가 같으므로 실패/중단 시 step 부터 다시 실행
+    """
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', '대기'
+        RUNNING = 'RUNNING', '진행 중'
+        DONE = 'DONE', '완료'
+        FAILED = 'FAILED', '실패'
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='deactivation_job')
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    step = models.CharField(max_length=50, blank=True)
+    progress = models.JSONField(default=dict, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"DeactivationJob({self.user_id}) {self.status} {self.step}"
@@ -0,0 +1,82 @@
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.board.models import Comment, Post
+from apps.meetup.models import Meeting
+from apps.meetup.serializers import HostedMeetingSummarySerializer
+from .models import UserProfile
+from .serializers import OtherUserProfileSerializer
+
+# 다가오는/지난 이벤트 구분이 시간에 따라 바뀌므로 TTL 로 상한
+PROFILE_SUMMARY_CACHE_TTL = 60 * 5
+PROFILE_SUMMARY_KEY = "account:profile_summary:{}"
+# 주최 이벤트 미리보기 개수
+HOSTED_MEETING_PREVIEW_SIZE = 3
+
+
+def invalidate_profile_summary(*user_ids):
+    cache.delete_many([PROFILE_SUMMARY_KEY.format(user_id) for user_id in user_ids if user_id])
+
+
+def _hosted_meetings(user_id, now):
+    """
+    - 주최 이벤트 수(다가오는/지난)는 조건부 집계 한 번, 미리보기는 각 1 쿼리
+    """
+    counts = Meeting.objects.filter(creator_id=user_id).aggregate(
+        upcoming=Count("id", filter=Q(start_time__gte=now)),
+        past=Count("id", filter=Q(start_time__lt=now)),
+    )
+    meetings = Meeting.objects.filter(creator_id=user_id).annotate(participant_count=Count("participants"))
+    upcoming = meetings.filter(start_time__gte=now).order_by("start_time")[:HOSTED_MEETING_PREVIEW_SIZE]
+    past = meetings.filter(start_time__lt=now).order_by("-start_time")[:HOSTED_MEETING_PREVIEW_SIZE]
+    return {
+        "upcoming": {
+            "count": counts["upcoming"],
+            "items": list(HostedMeetingSummarySerializer(upcoming, many=True).data),
+        },
+        "past": {
+            "count": counts["past"],
+            "items": list(HostedMeetingSummarySerializer(past, many=True).data),
+        },
+    }
+
+
+def build_profile_summary(profile):
+    """
+    - 프로필 + 활동(게시글/댓글 수, 받은 좋아요) + 주최 이벤트 요약
+    - 게시글/댓글은 각각 한 번의 집계 쿼리로 개수와 받은 좋아요 수를 함께 계산
+    """
+    user_id = profile.user_id
+    posts = Post.objects.filter(author_id=user_id).aggregate(
+        count=Count("id", distinct=True), likes=Count("likes"),
+    )
+    comments = Comment.objects.filter(author_id=user_id, is_deleted=False).aggregate(
+        count=Count("id", distinct=True), likes=Count("likes"),
+    )
+
+    data = dict(OtherUserProfileSerializer(profile).data)
+    data["activity"] = {
+        "post_count": posts["count"],
+        "comment_count": comments["count"],
+        "likes_received": posts["likes"] + comments["likes"],
+    }
+    data["hosted_meetings"] = _hosted_meetings(user_id, timezone.now())
+    return data
+
+
+def get_profile_summary(user_id):
+    """
+    - 유저별 캐시된 프로필 요약, 없으면 만들어 저장 (프로필이 없으면 None)
+    """
+    key = PROFILE_SUMMARY_KEY.format(user_id)
+    summary = cache.get(key)
+    if summary is not None:
+        return summary
+
+    profile = UserProfile.objects.select_related("school", "nationality").filter(user_id=user_id).first()
+    if profile is None:
+        return None
+    summary = build_profile_summary(profile)
+    cache.set(key, summary, PROFILE_SUMMARY_CACHE_TTL)
+    return summary
@@ -0,0 +1,113 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from core.reference_data import invalidate_reference_data
+from apps.board.models import Comment, CommentLike, Post, PostLike
+from apps.meetup.models import Meeting
+from .authentication import invalidate_auth_user
+from .profile_summary import invalidate_profile_summary
+from .blocking import invalidate_blocked_user_ids
+from .models import Language, Nationality, School, UserProfile
+
+# 참조 데이터 모델 → 목록 API 의 reference_name
+REFERENCE_DATA_NAMES = {
+    School: "schools",
+    Language: "languages",
+    Nationality: "nationalities",
+}
+
+
+@receiver(m2m_changed, sender=UserProfile.blocked_users.through)
+def invalidate_on_block_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    - 차단/차단해제(BlockUserView, admin 등) 시 양쪽 유저의 차단 목록 캐시 삭제
+    - reverse=False: instance=UserProfile, pk_set=차단당한 User id
+    - reverse=True : instance=User(blocked_by 쪽), pk_set=차단한 UserProfile id
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if action == "pre_clear":
+        # clear 는 pk_set 이 없으므로 지워지기 전 관계를 조회
+        if reverse:
+            rows = sender.objects.filter(user=instance)
+            user_ids = rows.values_list("userprofile__user_id", flat=True)
+        else:
+            user_ids = sender.objects.filter(userprofile=instance).values_list("user_id", flat=True)
+    elif reverse:
+        user_ids = UserProfile.objects.filter(pk__in=pk_set).values_list("user_id", flat=True)
+    else:
+        user_ids = pk_set
+
+    own_id = instance.id if reverse else instance.user_id
+    invalidate_blocked_user_ids([own_id, *user_ids])
+
+
+@receiver(post_save, sender=School)
+@receiver(post_delete, sender=School)
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+@receiver(post_save, sender=Nationality)
+@receiver(post_delete, sender=Nationality)
+def invalidate_on_reference_data_change(sender, **kwargs):
+    # admin/관리 명령에서 생성·수정·삭제 (bulk_create 등 시그널이 없는 경로는 직접 호출)
+    invalidate_reference_data(REFERENCE_DATA_NAMES[sender])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_auth_user_on_user_change(sender, instance, **kwargs):
+    # 탈퇴(is_active), 권한 변경 등
+    invalidate_auth_user(instance.id)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_auth_user_on_profile_change(sender, instance, **kwargs):
+    # 프로필 수정, 유학생 인증 승인(is_verified)
+    invalidate_auth_user(instance.user_id)
+    invalidate_profile_summary(instance.user_id)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_summary_on_content_change(sender, instance, **kwargs):
+    # 작성자의 게시글/댓글 수
+    invalidate_profile_summary(instance.author_id)
+
+
+@receiver(post_save, sender=PostLike)
+@receiver(post_delete, sender=PostLike)
+def invalidate_summary_on_post_like(sender, instance, **kwargs):
+    # 게시글 작성자가 받은 좋아요 수
+    author_id = Post.objects.filter(pk=instance.post_id).values_list("author_id", flat=True).first()
+    invalidate_profile_summary(author_id)
+
+
+@receiver(post_save, sender=CommentLike)
+@receiver(post_delete, sender=CommentLike)
+def invalidate_summary_on_comment_like(sender, instance, **kwargs):
+    author_id = Comment.objects.filter(pk=instance.comment_id).values_list("author_id", flat=True).first()
+    invalidate_profile_summary(author_id)
+
+
+@receiver(post_save, sender=Meeting)
+@receiver(post_delete, sender=Meeting)
+def invalidate_summary_on_meeting_change(sender, instance, **kwargs):
+    # 주최 이벤트 수/미리보기
+    invalidate_profile_summary(instance.creator_id)
+
+
+@receiver(m2m_changed, sender=Meeting.participants.through)
+def invalidate_summary_on_participation(sender, instance, action, reverse, pk_set, **kwargs):
+    # 미리보기의 참여 인원 (reverse=True 면 instance 는 User, pk_set 은 Meeting id)
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        creator_ids = Meeting.objects.filter(pk__in=pk_set or ()).values_list("creator_id", flat=True)
+        invalidate_profile_summary(*creator_ids)
+    else:
+        invalidate_profile_summary(instance.creator_id)
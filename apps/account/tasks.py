@@ -0,0 +1,249 @@
+from celery import shared_task
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from fcm_django.models import FCMDevice
+
+from apps.board.models import Comment, CommentLike, Post, PostLike
+from apps.meetup.cache import invalidate_meeting_list_cache
+from apps.meetup.models import Meeting
+from apps.notification.models import Notification
+from .models import AccountDeactivationJob, UserProfile
+from .profile_summary import invalidate_profile_summary
+from .tokens import compact_refresh_tokens
+
+# 한 번의 UPDATE 로 바꾸는 최대 행 수 (긴 잠금/큰 트랜잭션 방지)
+NICKNAME_UPDATE_CHUNK_SIZE = 500
+# 탈퇴 후처리에서 한 번에 삭제하는 최대 행 수
+DEACTIVATION_CHUNK_SIZE = 500
+DELETED_USER_NICKNAME = "Deleted User"
+
+
+def _update_author_nickname_chunk(model, user_id, nickname, last_pk=0):
+    """
+    - author_id 인덱스로 작성자 행만 찾아 pk 순서대로 최대 NICKNAME_UPDATE_CHUNK_SIZE 개 갱신
+    - 이미 같은 닉네임인 행은 건너뜀 (재시도/중복 실행 시 추가 쓰기 없음)
+    - 반환: 갱신한 pk 목록 (없으면 [])
+    """
+    ids = list(
+        model.objects.filter(author_id=user_id, pk__gt=last_pk)
+        .exclude(author_nickname=nickname)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:NICKNAME_UPDATE_CHUNK_SIZE]
+    )
+    if ids:
+        model.objects.filter(pk__in=ids).update(author_nickname=nickname)
+    return ids
+
+
+def _update_author_nickname(model, user_id, nickname):
+    last_pk = 0
+    while True:
+        ids = _update_author_nickname_chunk(model, user_id, nickname, last_pk)
+        if not ids:
+            return
+        last_pk = ids[-1]
+
+
+@shared_task
+def propagate_nickname_change(user_id):
+    """
+    - 프로필 닉네임 변경을 게시글/댓글의 author_nickname 에 반영
+    - 태스크 실행 시점의 닉네임을 DB에서 다시 읽음 → 연속 변경 시 마지막 닉네임으로 수렴
+    - 알림은 sender 를 참조해 조회 시점에 닉네임을 채우므로 갱신하지 않음
+    """
+    nickname = UserProfile.objects.filter(user_id=user_id).values_list("nickname", flat=True).first()
+    if nickname is None:
+        return
+
+    _update_author_nickname(Post, user_id, nickname)
+    _update_author_nickname(Comment, user_id, nickname)
+
+
+def enqueue_nickname_propagation(user_id):
+    """
+    - 트랜잭션 커밋 후 닉네임 반영 태스크 등록
+    - 브로커 장애가 프로필 수정 요청을 실패시키지 않도록 예외는 로그만 남김
+    """
+    def enqueue():
+        try:
+            propagate_nickname_change.delay(user_id)
+        except Exception as e:
+            print(f"[WARNING] 닉네임 반영 태스크 등록 실패: {e}")
+
+    transaction.on_commit(enqueue)
+
+
+def _delete_chunk(queryset):
+    """
+    - queryset 의 앞부분(pk 순서) 최대 DEACTIVATION_CHUNK_SIZE 개 삭제, 삭제한 개수 반환
+    """
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True)[:DEACTIVATION_CHUNK_SIZE])
+    if ids:
+        queryset.model.objects.filter(pk__in=ids).delete()
+    return len(ids)
+
+
+def _anonymize_posts(user_id):
+    return len(_update_author_nickname_chunk(Post, user_id, DELETED_USER_NICKNAME))
+
+
+def _anonymize_comments(user_id):
+    return len(_update_author_nickname_chunk(Comment, user_id, DELETED_USER_NICKNAME))
+
+
+def _remove_devices(user_id):
+    return _delete_chunk(FCMDevice.objects.filter(user_id=user_id))
+
+
+def _invalidate_creator_summaries(meeting_ids):
+    """
+    - 모임 주최자의 프로필 요약 캐시 무효화 (커밋 후)
+    - through 행을 직접 삭제하면 m2m_changed 가 발생하지 않아 signals 의 무효화가 실행되지 않음
+    """
+    creator_ids = set(Meeting.objects.filter(pk__in=meeting_ids).values_list("creator_id", flat=True))
+    transaction.on_commit(lambda: invalidate_profile_summary(*creator_ids))
+
+
+def _leave_meetups(user_id):
+    """
+    - 모임 참여 행 삭제 + 주최자 프로필 요약(참여 인원) 캐시 무효화
+    """
+    rows = list(
+        Meeting.participants.through.objects.filter(user_id=user_id)
+        .order_by("pk")
+        .values_list("pk", "meeting_id")[:DEACTIVATION_CHUNK_SIZE]
+    )
+    if not rows:
+        return 0
+    Meeting.participants.through.objects.filter(pk__in=[pk for pk, _ in rows]).delete()
+    _invalidate_creator_summaries([meeting_id for _, meeting_id in rows])
+    return len(rows)
+
+
+def _remove_post_likes(user_id):
+    return _delete_chunk(PostLike.objects.filter(user_id=user_id))
+
+
+def _remove_comment_likes(user_id):
+    return _delete_chunk(CommentLike.objects.filter(user_id=user_id))
+
+
+def _remove_meeting_likes(user_id):
+    """
+    - 모임 좋아요 삭제 + Meeting.like_count 감소
+    - 행 잠금 후 삭제/감소를 같은 트랜잭션에서 처리 → 재실행되어도 두 번 감소하지 않음
+    - 주최자 프로필 요약 캐시 무효화
+    """
+    rows = list(
+        Meeting.liked_users.through.objects.select_for_update()
+        .filter(user_id=user_id)
+        .order_by("pk")
+        .values_list("pk", "meeting_id")[:DEACTIVATION_CHUNK_SIZE]
+    )
+    if not rows:
+        return 0
+    Meeting.liked_users.through.objects.filter(pk__in=[pk for pk, _ in rows]).delete()
+    meeting_ids = [meeting_id for _, meeting_id in rows]
+    Meeting.objects.filter(pk__in=meeting_ids, like_count__gt=0).update(like_count=F("like_count") - 1)
+    _invalidate_creator_summaries(meeting_ids)
+    return len(rows)
+
+
+def _remove_scraps(user_id):
+    return _delete_chunk(Post.scrapped_by.through.objects.filter(user_id=user_id))
+
+
+def _remove_notifications(user_id):
+    return _delete_chunk(Notification.objects.filter(user_id=user_id))
+
+
+# 실행 순서대로 (단계 이름, 한 덩어리 처리 함수 → 처리한 행 수, 0 이면 단계 완료)
+DEACTIVATION_STEPS = (
+    ("anonymize_posts", _anonymize_posts),
+    ("anonymize_comments", _anonymize_comments),
+    ("remove_devices", _remove_devices),
+    ("leave_meetups", _leave_meetups),
+    ("remove_post_likes", _remove_post_likes),
+    ("remove_comment_likes", _remove_comment_likes),
+    ("remove_meeting_likes", _remove_meeting_likes),
+    ("remove_scraps", _remove_scraps),
+    ("remove_notifications", _remove_notifications),
+)
+DEACTIVATION_STEP_NAMES = tuple(name for name, _ in DEACTIVATION_STEPS)
+
+
+def _run_deactivation_step(job, name, process_chunk):
+    """
+    - 처리할 행이 없을 때까지 한 덩어리씩 처리
+    - 덩어리 처리와 진행 상황 기록을 같은 트랜잭션으로 커밋
+    """
+    while True:
+        with transaction.atomic():
+            count = process_chunk(job.user_id)
+            if not count:
+                return
+            job.progress[name] = job.progress.get(name, 0) + count
+            job.save(update_fields=["progress", "updated_at"])
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def run_account_deactivation(self, job_id):
+    """
+    - 탈퇴한 유저의 게시글/댓글 익명화, 기기/모임 참여/좋아요/스크랩/알림 삭제
+    - job.step 부터 이어서 실행 (앞 단계는 이미 완료)
+    - 실패 시 FAILED 로 기록 후 재시도, 재시도를 모두 쓰면 resume_deactivation_jobs 로 재개
+    """
+    job = AccountDeactivationJob.objects.filter(pk=job_id).exclude(
+        status=AccountDeactivationJob.Status.DONE
+    ).first()
+    if job is None:
+        return
+
+    job.status = AccountDeactivationJob.Status.RUNNING
+    job.last_error = ""
+    job.save(update_fields=["status", "last_error", "updated_at"])
+
+    start = DEACTIVATION_STEP_NAMES.index(job.step) if job.step in DEACTIVATION_STEP_NAMES else 0
+    try:
+        for name, process_chunk in DEACTIVATION_STEPS[start:]:
+            job.step = name
+            job.save(update_fields=["step", "updated_at"])
+            _run_deactivation_step(job, name, process_chunk)
+    except Exception as e:
+        job.status = AccountDeactivationJob.Status.FAILED
+        job.last_error = str(e)
+        job.save(update_fields=["status", "last_error", "updated_at"])
+        raise self.retry(exc=e)
+    finally:
+        # 참여/좋아요 행을 직접 삭제해 m2m_changed 가 발생하지 않으므로 모임 목록 캐시를 직접 무효화
+        invalidate_meeting_list_cache()
+
+    job.status = AccountDeactivationJob.Status.DONE
+    job.step = ""
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "step", "finished_at", "updated_at"])
+
+
+def enqueue_account_deactivation(job_id):
+    """
+    - 트랜잭션 커밋 후 탈퇴 후처리 태스크 등록
+    - 등록에 실패해도 작업은 PENDING 으로 남으므로 resume_deactivation_jobs 로 재개 가능
+    """
+    def enqueue():
+        try:
+            run_account_deactivation.delay(job_id)
+        except Exception as e:
+            print(f"[WARNING] 회원탈퇴 후처리 태스크 등록 실패: {e}")
+
+    transaction.on_commit(enqueue)
+
+
+@shared_task
+def compact_outstanding_tokens():
+    """
+    - 주기 실행: 더 이상 유효할 수 없는 refresh 토큰 행 정리 (토큰 테이블/로그아웃 비용 상한 유지)
+    """
+    deleted = compact_refresh_tokens()
+    print(f"[INFO] refresh 토큰 {deleted}개 정리")
+    return deleted
@@ -1,3 +1,453 @@
-from django.test import TestCase
+import json
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import jwt
+import requests
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from django.utils import timezone
+from jwt.algorithms import RSAAlgorithm
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from apps.account import google_auth, tasks
+from apps.account.google_auth import JWKS_MIN_REFRESH_INTERVAL, GoogleIdTokenVerifier, cache_max_age
+from apps.account.blocking import BLOCKED_USER_IDS_KEY, exclude_blocked, get_blocked_user_ids, is_blocked
+from apps.account.models import AccountDeactivationJob, UserProfile
+from apps.account.profile_summary import PROFILE_SUMMARY_KEY
+from apps.account.tokens import AllowlistRefreshToken, compact_refresh_tokens
+from apps.board.models import Board, Post
+from apps.meetup.models import Meeting
+
+CLIENT_ID = "kickit-test.apps.googleusercontent.com"
+JWKS_URL = "https://jwks.test/oauth2/v3/certs"
+
+
+def generate_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def public_jwk(private_key, kid):
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid=kid, alg="RS256", use="sig")
+    return jwk
+
+
+class FakeJWKSSession:
+    """
+    - Google 인증서 서버 대체 (GET 마다 현재 keys 를 JWKS 로 응답, 호출 수 기록)
+    """
+
+    def __init__(self, keys, max_age=300):
+        self.keys = keys
+        self.max_age = max_age
+        self.calls = 0
+        self.down = False
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        if self.down:
+            raise requests.ConnectionError("JWKS server is down")
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers["Cache-Control"] = f"public, max-age={self.max_age}"
+        response._content = json.dumps({"keys": self.keys}).encode()
+        return response
+
+
+class GoogleIdTokenVerifierTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # RSA 키 생성은 느리므로 한 번만
+        cls.key = generate_key()
+        cls.other_key = generate_key()
+
+    def setUp(self):
+        self.session = FakeJWKSSession([public_jwk(self.key, "key-1")])
+        self.verifier = GoogleIdTokenVerifier(CLIENT_ID, JWKS_URL, session=self.session)
+        # 캐시 만료/재조회 간격을 시계를 움직여 확인
+        self.now = 1000.0
+        patcher = mock.patch.object(google_auth.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_token(self, key=None, kid="key-1", algorithm="RS256", **claims):
+        issued_at = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": CLIENT_ID,
+            "sub": "1234567890",
+            "email": "user@example.com",
+            "iat": issued_at,
+            "exp": issued_at + 600,
+        }
+        payload.update(claims)
+        return jwt.encode(payload, key or self.key, algorithm=algorithm, headers={"kid": kid})
+
+    def test_valid_token(self):
+        claims = self.verifier.verify(self.make_token())
+
+        self.assertEqual(claims["sub"], "1234567890")
+        self.assertEqual(claims["email"], "user@example.com")
+
+    def test_issuer_without_scheme(self):
+        self.assertEqual(self.verifier.verify(self.make_token(iss="accounts.google.com"))["sub"], "1234567890")
+
+    def test_rejects_invalid_claims(self):
+        expired = int(time.time()) - 3600
+        for claims in (
+            {"iss": "https://evil.example.com"},
+            {"aud": "another-client"},
+            {"iat": expired - 600, "exp": expired},
+        ):
+            with self.subTest(claims=claims), self.assertRaises(ValueError):
+                self.verifier.verify(self.make_token(**claims))
+
+    def test_rejects_missing_subject(self):
+        token = self.make_token()
+        payload = jwt.decode(token, options={"verify_signature": False})
+        del payload["sub"]
+        with self.assertRaises(ValueError):
+            self.verifier.verify(jwt.encode(payload, self.key, algorithm="RS256", headers={"kid": "key-1"}))
+
+    def test_rejects_wrong_signature(self):
+        with self.assertRaises(ValueError):
+            self.verifier.verify(self.make_token(key=self.other_key))
+
+    def test_rejects_hs256_token(self):
+        # 공개키(JWK)를 HMAC 비밀키로 쓰는 알고리즘 혼동 공격
+        secret = json.dumps(public_jwk(self.key, "key-1"))
+        with self.assertRaises(ValueError):
+            self.verifier.verify(self.make_token(key=secret, algorithm="HS256"))
+
+    def test_caches_keys_until_max_age(self):
+        for _ in range(5):
+            self.verifier.verify(self.make_token())
+        self.assertEqual(self.session.calls, 1)
+
+        self.now += self.session.max_age - 1
+        self.verifier.verify(self.make_token())
+        self.assertEqual(self.session.calls, 1)
+
+        self.now += 1
+        self.verifier.verify(self.make_token())
+        self.assertEqual(self.session.calls, 2)
+
+    def test_unknown_kid_refetch_is_rate_limited(self):
+        self.verifier.verify(self.make_token())
+
+        # 키 교체: 캐시가 남아 있어도 모르는 kid 는 다시 받지만, 최소 간격 안에서는 받지 않음
+        self.session.keys.append(public_jwk(self.other_key, "key-2"))
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                self.verifier.verify(self.make_token(key=self.other_key, kid="key-2"))
+        self.assertEqual(self.session.calls, 1)
+
+        self.now += JWKS_MIN_REFRESH_INTERVAL
+        self.assertEqual(self.verifier.verify(self.make_token(key=self.other_key, kid="key-2"))["sub"], "1234567890")
+        self.assertEqual(self.session.calls, 2)
+
+        # 위조 kid 를 계속 보내도 간격마다 한 번만 조회
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                self.verifier.verify(self.make_token(kid="forged"))
+        self.assertEqual(self.session.calls, 2)
+
+    @mock.patch("builtins.print")
+    def test_uses_cached_keys_when_server_is_down(self, _print):
+        self.verifier.verify(self.make_token())
+        self.session.down = True
+
+        self.now += self.session.max_age
+        self.assertEqual(self.verifier.verify(self.make_token())["sub"], "1234567890")
+        # 장애 중에는 최소 간격 동안 다시 조회하지 않음
+        self.verifier.verify(self.make_token())
+        self.assertEqual(self.session.calls, 2)
+
+    def test_fails_without_any_keys(self):
+        self.session.down = True
+        with self.assertRaises(ValueError):
+            self.verifier.verify(self.make_token())
+
+
+class CacheMaxAgeTests(SimpleTestCase):
+    def response(self, **headers):
+        response = requests.Response()
+        response.headers.update(headers)
+        return response
+
+    def test_max_age_minus_age(self):
+        self.assertEqual(cache_max_age(self.response(**{"Cache-Control": "public, max-age=600", "Age": "100"})), 500)
+
+    def test_no_cache(self):
+        self.assertEqual(cache_max_age(self.response(**{"Cache-Control": "no-cache, max-age=600"})), 0)
+
+    def test_default(self):
+        self.assertEqual(cache_max_age(self.response()), google_auth.DEFAULT_JWKS_MAX_AGE)
+
+
+@mock.patch.object(tasks, "DEACTIVATION_CHUNK_SIZE", 2)
+@mock.patch.object(tasks, "NICKNAME_UPDATE_CHUNK_SIZE", 2)
+class AccountDeactivationTests(TestCase):
+    """
+    - 덩어리 크기를 2로 줄여 3행짜리 단계를 두 번에 나눠 처리
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user("leaver@example.com")
+        self.creator = User.objects.create_user("host@example.com")
+        board = Board.objects.create(name="free")
+        for _ in range(3):
+            Post.objects.create(board=board, author=self.user, author_nickname="leaver", content="post")
+            meeting = Meeting.objects.create(
+                creator=self.creator, title="Hike", description="Weekend hike",
+                start_time=timezone.now() + timedelta(days=2), capacity=5, category_id=0,
+                lat=0, lng=0, location_name="Seoul Forest", address="Seoul", rlg="Seoul", like_count=5,
+            )
+            meeting.participants.add(self.user)
+            meeting.liked_users.add(self.user)
+        self.job = AccountDeactivationJob.objects.create(user=self.user)
+        self.summary_key = PROFILE_SUMMARY_KEY.format(self.creator.id)
+        self.addCleanup(cache.delete, self.summary_key)
+
+    def run_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tasks.run_account_deactivation(self.job.id)
+        self.job.refresh_from_db()
+
+    def like_counts(self):
+        return sorted(Meeting.objects.values_list("like_count", flat=True))
+
+    def failing_steps(self, failing_step):
+        """
+        - failing_step 단계가 첫 덩어리를 처리한 뒤 실패하도록 바꾼 DEACTIVATION_STEPS
+        """
+        def wrap(process_chunk):
+            calls = []
+
+            def run(user_id):
+                if calls:
+                    raise RuntimeError("worker lost")
+                calls.append(user_id)
+                return process_chunk(user_id)
+            return run
+
+        return tuple(
+            (name, wrap(process_chunk) if name == failing_step else process_chunk)
+            for name, process_chunk in tasks.DEACTIVATION_STEPS
+        )
+
+    def test_resumes_from_failed_chunk(self):
+        with mock.patch.object(tasks, "DEACTIVATION_STEPS", self.failing_steps("remove_meeting_likes")):
+            with self.assertRaises(RuntimeError):
+                self.run_job()
+        self.job.refresh_from_db()
+
+        self.assertEqual(self.job.status, AccountDeactivationJob.Status.FAILED)
+        self.assertEqual(self.job.step, "remove_meeting_likes")
+        self.assertEqual(self.job.progress["remove_meeting_likes"], 2)
+        self.assertEqual(self.like_counts(), [4, 4, 5])
+
+        self.run_job()
+
+        self.assertEqual(self.job.status, AccountDeactivationJob.Status.DONE)
+        self.assertEqual(self.job.progress["remove_meeting_likes"], 3)
+        # 앞 단계는 다시 실행하지 않음
+        self.assertEqual(self.job.progress["anonymize_posts"], 3)
+        self.assertEqual(self.like_counts(), [4, 4, 4])
+        self.assertFalse(Meeting.liked_users.through.objects.filter(user=self.user).exists())
+
+    def test_rerun_is_idempotent(self):
+        self.run_job()
+        progress = dict(self.job.progress)
+
+        # 완료된 작업 재실행은 무시, 처음부터 다시 돌려도 추가로 바뀌는 행 없음
+        self.run_job()
+        AccountDeactivationJob.objects.filter(pk=self.job.pk).update(status=AccountDeactivationJob.Status.PENDING)
+        self.run_job()
+
+        self.assertEqual(self.job.status, AccountDeactivationJob.Status.DONE)
+        self.assertEqual(self.job.progress, progress)
+        self.assertEqual(self.like_counts(), [4, 4, 4])
+        self.assertEqual(set(Post.objects.values_list("author_nickname", flat=True)), {tasks.DELETED_USER_NICKNAME})
+        self.assertFalse(Meeting.participants.through.objects.filter(user=self.user).exists())
+
+    def test_invalidates_meeting_creator_summary(self):
+        for step in ("leave_meetups", "remove_meeting_likes"):
+            with self.subTest(step=step):
+                cache.set(self.summary_key, {"cached": True})
+                process_chunk = dict(tasks.DEACTIVATION_STEPS)[step]
+
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.assertEqual(process_chunk(self.user.id), 2)
+
+                self.assertIsNone(cache.get(self.summary_key))
+
+
+class BlockingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.blocker, self.blocked, self.other = (
+            User.objects.create_user(f"{name}@example.com") for name in ("blocker", "blocked", "other")
+        )
+        for user in (self.blocker, self.blocked, self.other):
+            UserProfile.objects.create(user=user, nickname=user.username.split("@")[0])
+
+    def fresh(self, user):
+        # 요청마다 새 user 객체 (요청 안 메모이즈(_blocked_user_ids) 없이 캐시/DB 에서 조회)
+        return User.objects.get(pk=user.pk)
+
+    def block(self, action="block", user=None, target=None):
+        client = APIClient()
+        client.force_authenticate(user or self.blocker)
+        response = client.post(f"/account/block/{(target or self.blocked).id}/", {"action": action})
+        self.assertEqual(response.status_code, 200)
+
+    def test_blocking_hides_both_directions(self):
+        self.block()
+
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocker)), (self.blocked.id,))
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocked)), (self.blocker.id,))
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.other)), ())
+        self.assertTrue(is_blocked(self.fresh(self.blocker), self.blocked.id))
+        self.assertTrue(is_blocked(self.fresh(self.blocked), self.blocker.id))
+        self.assertFalse(is_blocked(self.fresh(self.other), self.blocker.id))
+
+        board = Board.objects.create(name="free")
+        posts = {
+            user.id: Post.objects.create(board=board, author=user, content="post")
+            for user in (self.blocker, self.blocked, self.other)
+        }
+        for viewer, hidden in ((self.blocker, self.blocked), (self.blocked, self.blocker)):
+            with self.subTest(viewer=viewer.username):
+                visible = exclude_blocked(Post.objects.all(), self.fresh(viewer)).values_list("author_id", flat=True)
+                self.assertEqual(set(visible), set(posts) - {hidden.id})
+
+                client = APIClient()
+                client.force_authenticate(self.fresh(viewer))
+                self.assertEqual(client.get(f"/board/{board.id}/posts/{posts[hidden.id].id}/").status_code, 404)
+                self.assertEqual(client.get(f"/board/{board.id}/posts/{posts[self.other.id].id}/").status_code, 200)
+
+    def test_meeting_detail_hidden_from_blocked_user(self):
+        meeting = Meeting.objects.create(
+            creator=self.blocker, title="Hike", description="Weekend hike",
+            start_time=timezone.now() + timedelta(days=2), capacity=5, category_id=0,
+            lat=0, lng=0, location_name="Seoul Forest", address="Seoul", rlg="Seoul",
+        )
+        self.block()
+
+        for viewer, expected in ((self.blocked, 404), (self.other, 200)):
+            with self.subTest(viewer=viewer.username):
+                client = APIClient()
+                client.force_authenticate(self.fresh(viewer))
+                self.assertEqual(client.get(f"/meetup/{meeting.id}/").status_code, expected)
+
+    def test_block_and_unblock_invalidate_both_users(self):
+        keys = [BLOCKED_USER_IDS_KEY.format(user.id) for user in (self.blocker, self.blocked)]
+        # 두 유저 모두 캐시가 채워진 상태에서 차단
+        for user in (self.blocker, self.blocked):
+            self.assertEqual(get_blocked_user_ids(self.fresh(user)), ())
+        self.assertEqual(len(cache.get_many(keys)), 2)
+
+        self.block()
+        self.assertEqual(cache.get_many(keys), {})
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocked)), (self.blocker.id,))
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocker)), (self.blocked.id,))
+
+        self.block("unblock")
+        self.assertEqual(cache.get_many(keys), {})
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocked)), ())
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocker)), ())
+
+    def test_reverse_side_changes_invalidate_both_users(self):
+        self.block()
+        for user in (self.blocker, self.blocked):
+            get_blocked_user_ids(self.fresh(user))
+
+        # 차단당한 쪽에서 관계 정리 (admin/탈퇴 처리 등)
+        self.blocked.blocked_by.clear()
+
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocker)), ())
+        self.assertEqual(get_blocked_user_ids(self.fresh(self.blocked)), ())
+
+
+class RefreshTokenAllowlistTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("token@example.com")
+        self.other = User.objects.create_user("other@example.com")
+
+    def assert_rejected(self, token):
+        with self.assertRaises(TokenError):
+            AllowlistRefreshToken(str(token))
+
+    def refresh(self, token):
+        client = APIClient()
+        client.cookies["refresh_token"] = str(token)
+        return client.post("/account/token-refresh/")
+
+    def test_rotated_token_is_rejected(self):
+        token = AllowlistRefreshToken.for_user(self.user)
+        self.assertEqual(self.refresh(token).status_code, 200)
+
+        # 회전(BLACKLIST_AFTER_ROTATION): 이전 토큰은 블랙리스트 → 새 토큰으로 대체
+        token.blacklist()
+        replacement = AllowlistRefreshToken.for_user(self.user)
+
+        self.assert_rejected(token)
+        self.assertEqual(self.refresh(token).status_code, 401)
+        AllowlistRefreshToken(str(replacement))
+
+        # 정리 작업으로 행이 지워져도 다시 유효해지지 않음
+        self.assertEqual(compact_refresh_tokens(), 1)
+        self.assert_rejected(token)
+        AllowlistRefreshToken(str(replacement))
+
+    def test_logout_revokes_all_devices(self):
+        tokens = [AllowlistRefreshToken.for_user(self.user) for _ in range(3)]
+        tokens[0].blacklist()
+        other_token = AllowlistRefreshToken.for_user(self.other)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.post("/account/logout/", {"refresh_token": str(tokens[1])})
+
+        self.assertEqual(response.status_code, 200)
+        for token in tokens:
+            self.assert_rejected(token)
+            self.assertEqual(self.refresh(token).status_code, 401)
+        self.assertEqual(BlacklistedToken.objects.filter(token__user=self.user).count(), 3)
+        AllowlistRefreshToken(str(other_token))
+
+    @mock.patch("apps.account.tokens.TOKEN_COMPACTION_CHUNK_SIZE", 2)
+    def test_compaction_keeps_live_tokens(self):
+        live = [AllowlistRefreshToken.for_user(self.user) for _ in range(3)]
+        revoked = [AllowlistRefreshToken.for_user(self.user) for _ in range(3)]
+        for token in revoked:
+            token.blacklist()
+        expired = AllowlistRefreshToken.for_user(self.other)
+        OutstandingToken.objects.filter(jti=expired["jti"]).update(expires_at=timezone.now() - timedelta(seconds=1))
+        inactive = User.objects.create_user("inactive@example.com")
+        AllowlistRefreshToken.for_user(inactive)
+        User.objects.filter(pk=inactive.pk).update(is_active=False)
+        deleted_user = User.objects.create_user("deleted@example.com")
+        AllowlistRefreshToken.for_user(deleted_user)
+        deleted_user.delete()
+
+        # 덩어리 크기 2 → 여러 번 나눠서 삭제
+        self.assertEqual(compact_refresh_tokens(), 6)
+
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("jti", flat=True)),
+            {token["jti"] for token in live},
+        )
+        self.assertFalse(BlacklistedToken.objects.exists())
+        for token in live:
+            AllowlistRefreshToken(str(token))
+        self.assertEqual(compact_refresh_tokens(), 0)
@@ -0,0 +1,77 @@
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# 정리 작업에서 한 번에 삭제하는 최대 토큰 수
+TOKEN_COMPACTION_CHUNK_SIZE = 1000
+
+
+class AllowlistRefreshToken(RefreshToken):
+    """
+    - OutstandingToken 에 남아 있고 블랙리스트에 없는 토큰만 유효 (허용 목록 방식)
+    - 블랙리스트에 오른 토큰은 행을 삭제해도 다시 유효해지지 않으므로 토큰 테이블을 정리할 수 있음
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if not OutstandingToken.objects.filter(jti=jti, blacklistedtoken__isnull=True).exists():
+            raise TokenError(_("Token is blacklisted"))
+
+
+def revoke_refresh_tokens(user):
+    """
+    - 유저에게 발급된 refresh 토큰 중 아직 블랙리스트에 없는 것을 INSERT ... SELECT 한 번으로 등록
+    - 토큰마다 RefreshToken(...).blacklist() 를 호출하지 않음 (토큰 디코딩/개별 조회·INSERT 없음)
+    - 반환: 새로 블랙리스트에 등록한 토큰 수
+    """
+    blacklisted = connection.ops.quote_name(BlacklistedToken._meta.db_table)
+    outstanding = connection.ops.quote_name(OutstandingToken._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {blacklisted} (token_id, blacklisted_at)
+            SELECT o.id, %s FROM {outstanding} o
+            WHERE o.user_id = %s
+              AND NOT EXISTS (SELECT 1 FROM {blacklisted} b WHERE b.token_id = o.id)
+            ON CONFLICT (token_id) DO NOTHING
+            """,
+            [timezone.now(), user.pk],
+        )
+        return cursor.rowcount
+
+
+def compactable_tokens(now=None):
+    """
+    - 더 이상 유효할 수 없는 OutstandingToken
+    - 블랙리스트에 오른 토큰(로그아웃/회전으로 대체됨), 만료된 토큰, 탈퇴(비활성)·삭제된 유저의 토큰
+    """
+    now = now or timezone.now()
+    return OutstandingToken.objects.filter(
+        Q(blacklistedtoken__isnull=False)
+        | Q(expires_at__lt=now)
+        | Q(user__isnull=True)
+        | Q(user__is_active=False)
+    )
+
+
+def compact_refresh_tokens(now=None):
+    """
+    - compactable_tokens() 를 pk 순서로 나눠서 블랙리스트 행과 함께 삭제
+    - AllowlistRefreshToken 은 행이 없는 토큰을 거부하므로 삭제해도 토큰이 되살아나지 않음
+    - 반환: 삭제한 OutstandingToken 수
+    """
+    deleted = 0
+    while True:
+        ids = list(
+            compactable_tokens(now).order_by("pk").values_list("pk", flat=True)[:TOKEN_COMPACTION_CHUNK_SIZE]
+        )
+        if not ids:
+            return deleted
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        OutstandingToken.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
@@ -6,7 +6,8 @@ from .views import (
     SchoolListView,
     PasswordResetRequestView, TokenRefreshView, RegisterFCMTokenView,
     VerificationStatusView, PasswordResetView, BlockedUsersListView,
-    LanguageListView, NationalityListView, OtherUserProfileView
+    LanguageListView, NationalityListView, OtherUserProfileView,
+    SchoolTypeaheadView, NationalityTypeaheadView
 )
 
 urlpatterns = [
@@ -33,6 +34,7 @@ urlpatterns = [
 
     # 학교/학과/입학연도 검색
     path('schools/', SchoolListView.as_view(), name='school-list'),
+    path('schools/search/', SchoolTypeaheadView.as_view(), name='school-typeahead'),
     # path('departments/', DepartmentListView.as_view(), name='department-list'),
     # path('admission_year/', AdmissionYearListView.as_view(), name='admission-year-list'),
 
@@ -52,6 +54,7 @@ urlpatterns = [
 
     path('languages/', LanguageListView.as_view(), name='language-list'),
     path('nationalities/', NationalityListView.as_view(), name='nationality-list'),
+    path('nationalities/search/', NationalityTypeaheadView.as_view(), name='nationality-typeahead'),
 
     path("profile/user_id=<int:user_id>/", OtherUserProfileView.as_view(), name="user-profile-view"),
 ]
\ No newline at end of file
@@ -15,17 +15,20 @@ import random
 import string
 import json
 from fcm_django.models import FCMDevice
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from .supabase_utils import upload_verification_image_to_supabase
+from django.core.files.uploadedfile import UploadedFile
+from core.uploads import VERIFICATION_IMAGE_POLICY, upload_files, validate_uploads, uploaded_urls, upload_errors, discard_uploads
+from core.async_views import AsyncUploadMixin
+from core.reference_data import ReferenceDataListMixin
+from core.typeahead import DEFAULT_TYPEAHEAD_LIMIT, MAX_TYPEAHEAD_LIMIT, get_typeahead_index, trigram_matches
 
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
+from .google_auth import verify_google_id_token
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
-from django.core.mail import send_mail
-from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
-from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from apps.notification.tasks import send_email_async
+from rest_framework_simplejwt.tokens import AccessToken
+from .tokens import AllowlistRefreshToken, revoke_refresh_tokens
+from .profile_summary import get_profile_summary
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework.parsers import MultiPartParser
 from django.db import transaction
@@ -45,7 +48,6 @@ from .serializers import (
     LanguageSerializer, NationalitySerializer, IntroduceUpdateSerializer, OtherUserProfileSerializer
 )
 
-GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
 FRONTEND_HOST = os.getenv('FRONTEND_HOST')
 
 class VerificationStatusView(APIView):
@@ -93,7 +95,7 @@ def set_token_on_response_cookie(user: User, status_code=200) -> Response:
         user_profile_serializer = UserProfileSerializer(user_profile)
 
         # RefreshToken 생성
-        token = RefreshToken.for_user(user)
+        token = AllowlistRefreshToken.for_user(user)
         print(f"Generated refresh token: {token}")
         
         res = Response(user_profile_serializer.data, status=status_code)
@@ -123,9 +125,7 @@ class GoogleAuthCheckView(APIView):
         id_token_value = serializer.validated_data['id_token']
 
         try:
-            idinfo = id_token.verify_oauth2_token(
-                id_token_value, google_requests.Request(), GOOGLE_CLIENT_ID
-            )
+            idinfo = verify_google_id_token(id_token_value)
             google_sub = idinfo['sub']
             email = idinfo.get('email')
 
@@ -139,7 +139,7 @@ class GoogleAuthCheckView(APIView):
         except ValueError:
             return Response({"error": "Invalid Google ID Token."}, status=400)
 
-class UserSignupView(APIView):
+class UserSignupView(AsyncUploadMixin, APIView):
     """
     통합 회원가입 (일반 + Google 로그인)
     1) 일반 회원가입 → email + password 필수
@@ -147,6 +147,7 @@ class UserSignupView(APIView):
     """
     permission_classes = [permissions.AllowAny]
     parser_classes = [MultiPartParser]
+    upload_fields = {"verification_image": VERIFICATION_IMAGE_POLICY}
 
     def post(self, request):
         serializer = UserSignupSerializer(data=request.data)
@@ -196,28 +197,26 @@ class UserSignupView(APIView):
                 return Response({"password": [str(e)]}, status=400)
         
         
-        # 파일 형식 검증 (JPG, PNG만 허용)
-        allowed_extensions = ["jpg", "jpeg", "png", "webp"]
-        max_size = 5 * 1024 * 1024
-        
-        image_urls = []
+        # 파일 형식/크기/실제 내용 검증 (JPG, PNG, WEBP만 허용) - 업로드 전에 전부 확인
+        # (큰 파일은 디스크 임시 파일(TemporaryUploadedFile)로 들어오므로 UploadedFile 전체 허용)
         for image_file in verification_images:
-            if not isinstance(image_file, InMemoryUploadedFile):
+            if not isinstance(image_file, UploadedFile):
                 return Response({"error": "Invalid uploaded file."}, status=400)
-            file_ext = image_file.name.split('.')[-1].lower()
-
-            if file_ext not in allowed_extensions:
-                return Response({"error": "Unsupported file format. Only JPG and PNG and WEBP are allowed."}, status=status.HTTP_400_BAD_REQUEST)
-
-            if image_file.size > max_size:
-                return Response({"error": "File size cannot exceed 5MB."}, status=status.HTTP_400_BAD_REQUEST)
-
-            # Supabase Storage에 업로드
-            image_url = upload_verification_image_to_supabase(image_file)
-            if not image_url:
-                return Response({"error": "Image upload failed."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        errors = validate_uploads(verification_images, VERIFICATION_IMAGE_POLICY)
+        if errors:
+            return Response({"error": errors[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Supabase Storage에 동시 업로드 (하나라도 실패하면 올라간 파일은 정리하고 실패 처리)
+        results = upload_files(verification_images, VERIFICATION_IMAGE_POLICY)
+        failures = upload_errors(results)
+        if failures:
+            discard_uploads(results)
+            return Response(
+                {"error": "Image upload failed.", "failed_uploads": failures},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
-            image_urls.append(image_url)  # 업로드된 URL 저장
+        image_urls = uploaded_urls(results)  # 업로드된 URL 저장 (요청 순서 유지)
 
         user = User.objects.create(username=email, email=email)
         if password:
@@ -322,21 +321,13 @@ class LogoutView(APIView):
         if not refresh_token:
             return Response({"error": "No Refresh token"}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            tokens = OutstandingToken.objects.filter(user=request.user)
-
-            for token in tokens:
-                # 각 토큰을 블랙리스트에 추가
-                RefreshToken(token.token).blacklist()
-
-
-            response = Response({"detail": "You have been logged out in all devices."}, status=status.HTTP_200_OK)
-            response.delete_cookie("access_token")
-            response.delete_cookie("refresh_token")
-            return response
+        # 모든 기기의 토큰을 한 번에 블랙리스트에 추가
+        revoke_refresh_tokens(request.user)
 
-        except TokenError:
-            return Response({"error": "Invalid token."}, status=status.HTTP_400_BAD_REQUEST)
+        response = Response({"detail": "You have been logged out in all devices."}, status=status.HTTP_200_OK)
+        response.delete_cookie("access_token")
+        response.delete_cookie("refresh_token")
+        return response
 
 class TokenRefreshView(APIView):
     """
@@ -350,7 +341,7 @@ class TokenRefreshView(APIView):
             return Response({"error": "No refresh_token"}, status=status.HTTP_401_UNAUTHORIZED)
 
         try:
-            refresh = RefreshToken(refresh_token)
+            refresh = AllowlistRefreshToken(refresh_token)
             new_access_token = str(refresh.access_token)
 
             response = Response({"message": "Access token has been refreshed."}, status=status.HTTP_200_OK)
@@ -361,13 +352,14 @@ class TokenRefreshView(APIView):
             return Response({"error": "Invalid refresh token. Please log in again."}, status=status.HTTP_401_UNAUTHORIZED)
         
 
-class SchoolListView(generics.ListAPIView):
+class SchoolListView(ReferenceDataListMixin, generics.ListAPIView):
     """
     /accounts/schools/
     => 전체 학교 목록을 반환
     """
     queryset = School.objects.all().order_by('id')
     serializer_class = SchoolSerializer
+    reference_name = "schools"
 
 
 # class DepartmentListView(generics.ListAPIView):
@@ -392,17 +384,66 @@ class SchoolListView(generics.ListAPIView):
 #     queryset = AdmissionYear.objects.all().order_by('id')
 #     serializer_class = AdmissionYearSerializer
 
-class LanguageListView(generics.ListAPIView):
-    queryset = Language.objects.all()
+class LanguageListView(ReferenceDataListMixin, generics.ListAPIView):
+    queryset = Language.objects.all().order_by('id')
     serializer_class = LanguageSerializer
+    reference_name = "languages"
     permission_classes = [permissions.AllowAny]
 
-class NationalityListView(generics.ListAPIView):
-    queryset = Nationality.objects.all()
+class NationalityListView(ReferenceDataListMixin, generics.ListAPIView):
+    queryset = Nationality.objects.all().order_by('id')
     serializer_class = NationalitySerializer
+    reference_name = "nationalities"
     permission_classes = [permissions.AllowAny]
 
 
+class NameTypeaheadView(APIView):
+    """
+    이름 자동완성 공통 (GET ?q=검색어&limit=개수&fuzzy=1)
+    - 메모리 인덱스에서 대소문자 무시 접두어 → 단어 시작 → 부분 문자열 순으로 최대 limit 개 (DB 조회 없음)
+    - 인덱스 결과가 없을 때만 Postgres trigram 유사도 검색 (오타 대응, 3글자 이상)
+    - fuzzy=1 이면 인덱스 결과가 limit 보다 적을 때도 trigram 결과로 보충
+    - 응답: [{"id", "name"}]
+    """
+    permission_classes = [permissions.AllowAny]
+    model = None
+    reference_name = None
+    trigram_min_length = 3
+
+    def get(self, request):
+        query = request.query_params.get("q", "")
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_TYPEAHEAD_LIMIT))
+        except ValueError:
+            limit = DEFAULT_TYPEAHEAD_LIMIT
+        limit = min(max(limit, 1), MAX_TYPEAHEAD_LIMIT)
+
+        index = get_typeahead_index(
+            self.reference_name,
+            lambda: list(self.model.objects.values_list("id", "name")),
+        )
+        matches = index.search(query, limit)
+        fuzzy = request.query_params.get("fuzzy") in ("1", "true")
+        needs_fallback = not matches or (fuzzy and len(matches) < limit)
+        if needs_fallback and len(query.strip()) >= self.trigram_min_length:
+            matches += trigram_matches(
+                self.model.objects.all(), "name", query.strip(), limit - len(matches),
+                exclude_ids=[entry_id for entry_id, _ in matches],
+            )
+
+        return Response([{"id": entry_id, "name": name} for entry_id, name in matches])
+
+
+class SchoolTypeaheadView(NameTypeaheadView):
+    model = School
+    reference_name = "schools"
+
+
+class NationalityTypeaheadView(NameTypeaheadView):
+    model = Nationality
+    reference_name = "nationalities"
+
+
 class ProfileUpdateView(generics.UpdateAPIView):
     """
     PATCH /accounts/profile/
@@ -488,8 +529,8 @@ class PasswordResetRequestView(APIView):
         reset_link = f"{FRONTEND_HOST}/reset-password/{uidb64}/{token}/"
 
         try:
-            # 이메일로 비밀번호 재설정 링크 전송
-            send_mail(
+            # 이메일로 비밀번호 재설정 링크 전송 (email 큐, SMTP 오류는 태스크에서 재시도)
+            send_email_async.delay(
                 subject="Password Reset Request",
                 message=(
                     "You requested to reset your Squibble password.\n\n"
@@ -498,9 +539,7 @@ class PasswordResetRequestView(APIView):
                     "⚠️ This link is intended for use on mobile devices only.\n"
                     "If you didn't request this, you can safely ignore this email."
                 ),
-                from_email="no-reply@squible.net",
                 recipient_list=[email],
-                fail_silently=False,
             )
         except Exception:
             return Response({"error": "An error occurred while sending the email. Please try again."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -576,12 +615,15 @@ class OtherUserProfileView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        user = get_object_or_404(User, id=user_id, is_active=True)
-        profile = getattr(user, 'profile', None)
-
-        if not profile:
+        """
+        - 프로필 + 활동 요약 + 주최 이벤트(다가오는/지난) 수와 미리보기
+        - 유저별 캐시 (게시글/댓글/좋아요/이벤트/프로필 변경 시 signals 에서 무효화)
+        """
+        if not User.objects.filter(id=user_id, is_active=True).exists():
+            return Response({"error": "User not found."}, status=404)
+
+        summary = get_profile_summary(user_id)
+        if summary is None:
             return Response({"error": "Profile not found."}, status=404)
 
-        serializer = OtherUserProfileSerializer(profile)
-        # 추후 meetup 연동 필요 시 created_meetups 추가
-        return Response(serializer.data, status=200)
\ No newline at end of file
+        return Response(summary, status=200)
\ No newline at end of file
@@ -23,12 +23,14 @@ class Post(models.Model):
     - hidden_by: 글을 숨긴 유저들 (내 피드에서 이 글을 안 보이게 하려면 필터링)
     - 추천/비추천 : Like 테이블에서 관리 (PostLike)
     - 스크랩 : M2M (scrapped_by) 로 관리
+    - image_renditions: {원본 이미지 URL: {"full": url, "feed": url, "thumbnail": url}}
     """
     board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='posts')
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     author_nickname = models.CharField(max_length=50, blank=True)
     content = models.TextField()
     images = models.JSONField(default=list, blank=True)
+    image_renditions = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     scrapped_by = models.ManyToManyField(User, related_name='scrapped_posts', blank=True)
     hidden_by = models.ManyToManyField(User, related_name='hidden_posts', blank=True)
@@ -4,6 +4,9 @@ from django.contrib.auth.models import User
 from .models import Board, Post, Comment, PostLike, LikeType, CommentLike, SearchHistory
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.conf import settings
+from core.images import serialize_renditions
+from apps.account.blocking import exclude_blocked
+from core.uploads import POST_IMAGE_POLICY, upload_files, validate_uploads, uploaded_urls, upload_errors
 
 DEFAULT_DELETED_USER_IMAGE = (
     f"{settings.SUPABASE_URL}"
@@ -82,8 +85,7 @@ class CommentSerializer(serializers.ModelSerializer):
         user = self.context.get('request').user
         qs = obj.replies.all()
         if user and user.is_authenticated:
-            blocked = user.profile.blocked_users.all()
-            qs = qs.exclude(author__in=blocked)
+            qs = exclude_blocked(qs, user)
             qs = qs.exclude(hidden_by=user)
         return CommentSerializer(qs, many=True, context=self.context).data
     
@@ -96,18 +98,24 @@ class PostSerializer(serializers.ModelSerializer):
     comments = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
     content_images = serializers.SerializerMethodField()
+    content_image_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = [
             'id', 'board_id', 'board_name',
             'author', 'created_at', 'content',
-            'content_images', 'like_count', 'comment_count', 'is_liked', 'comments'
+            'content_images', 'content_image_renditions',
+            'like_count', 'comment_count', 'is_liked', 'comments'
         ]
     
     def get_content_images(self, obj):
         """ 게시글에 첨부된 이미지 반환 (없을 경우 빈 배열) """
         return obj.images if obj.images else []
+
+    def get_content_image_renditions(self, obj):
+        """ 이미지별 사이즈(full/feed/thumbnail) URL (생성 전이면 원본 URL) """
+        return serialize_renditions(obj.images, obj.image_renditions)
     
     def get_like_count(self, obj):
         return obj.likes.count()
@@ -136,8 +144,7 @@ class PostSerializer(serializers.ModelSerializer):
         qs = obj.comments.all()
 
         if user:
-            blocked_users = user.profile.blocked_users.all()
-            qs = qs.exclude(author__in=blocked_users).exclude(hidden_by=user)
+            qs = exclude_blocked(qs, user).exclude(hidden_by=user)
 
         return qs.count()
     
@@ -148,8 +155,7 @@ class PostSerializer(serializers.ModelSerializer):
         # 최상위 댓글만 가져오고 필터링
         comments_qs = obj.comments.filter(parent__isnull=True).order_by('-created_at')
         if user:
-            blocked_users = user.profile.blocked_users.all()
-            comments_qs = comments_qs.exclude(author__in=blocked_users).exclude(hidden_by=user)
+            comments_qs = exclude_blocked(comments_qs, user).exclude(hidden_by=user)
 
         return CommentSerializer(comments_qs, many=True, context=self.context).data
     
@@ -184,6 +190,11 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
 
         if not content and not files:
             raise serializers.ValidationError("At least one of content or image must be provided for the post.")
+
+        # 확장자/크기는 파일을 읽기 전에 검증
+        errors = validate_uploads(files, POST_IMAGE_POLICY)
+        if errors:
+            raise serializers.ValidationError({"images": errors})
         return data
 
     def create(self, validated_data):
@@ -193,24 +204,25 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
 
         # 이미지 수집
         images = self.context['request'].FILES.getlist("images")
-        from .supabase_utils import upload_image_to_supabase
+        from .tasks import enqueue_post_image_renditions
 
-        image_urls = []
-        for image_file in images:
-            image_url = upload_image_to_supabase(image_file)
-            print("[DEBUG] Image upload result:", image_url)
-            if image_url:
-                image_urls.append(image_url)
+        # 동시 업로드 (순서 유지), 실패한 이미지는 응답에 따로 알림
+        results = upload_files(images, POST_IMAGE_POLICY)
+        image_urls = uploaded_urls(results)
+        self.upload_failures = upload_errors(results)
 
         print("[DEBUG] Uploaded image URLs:", image_urls)
 
         # 저장
-        return Post.objects.create(
+        post = Post.objects.create(
             board=board,
             author=user,
             images=image_urls,
             **validated_data
         )
+        # 리사이즈 렌디션은 백그라운드에서 생성
+        enqueue_post_image_renditions(post.id, image_urls)
+        return post
 
 class SearchHistorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.reference_data import invalidate_reference_data
+from .models import Board
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_on_board_change(sender, **kwargs):
+    # admin 에서 게시판 생성/수정/삭제 → 게시판 목록 캐시 무효화
+    invalidate_reference_data("boards")
@@ -0,0 +1,43 @@
+from celery import shared_task
+from django.db import transaction
+
+from core.images import generate_renditions_for_urls
+from .models import Post
+
+
+@shared_task
+def generate_post_image_renditions(post_id, image_urls):
+    """
+    - 게시글 이미지의 WebP 렌디션(full/feed/thumbnail) 생성 후 Post.image_renditions 에 기록
+    - 처리 중 게시글에서 빠진 이미지는 기록하지 않음
+    """
+    renditions = generate_renditions_for_urls(image_urls)
+    if not renditions:
+        return
+
+    with transaction.atomic():
+        post = Post.objects.select_for_update().filter(id=post_id).first()
+        if post is None:
+            return
+        merged = dict(post.image_renditions or {})
+        merged.update({url: sizes for url, sizes in renditions.items() if url in post.images})
+        # save() 대신 update() → 다른 필드를 덮어쓰지 않음
+        Post.objects.filter(id=post_id).update(image_renditions=merged)
+
+
+def enqueue_post_image_renditions(post_id, image_urls):
+    """
+    - 트랜잭션 커밋 후 렌디션 생성 태스크 등록
+    - 브로커 장애가 게시글 작성/수정 요청을 실패시키지 않도록 예외는 로그만 남김
+    """
+    image_urls = list(image_urls)
+    if not image_urls:
+        return
+
+    def enqueue():
+        try:
+            generate_post_image_renditions.delay(post_id, image_urls)
+        except Exception as e:
+            print(f"[WARNING] 게시글 이미지 렌디션 태스크 등록 실패: {e}")
+
+    transaction.on_commit(enqueue)
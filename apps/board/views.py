@@ -4,6 +4,7 @@ from django.shortcuts import render
 import re
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.db.models import Q
 from rest_framework.exceptions import ValidationError, PermissionDenied
@@ -14,11 +15,16 @@ from django.db.models import Count
 import json
 
 from apps.notification.utils import handle_comment_notification, handle_like_notification, handle_mention_notification
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from .supabase_utils import upload_image_to_supabase, delete_image_from_supabase
+from core.uploads import POST_IMAGE_POLICY, upload_files, validate_uploads, uploaded_urls, upload_errors
+from core.async_views import AsyncUploadMixin
+from core.replica import ReplicaReadMixin
+from .tasks import enqueue_post_image_renditions
+from core.tasks import delete_images_later
+from core.reference_data import ReferenceDataListMixin
 
 from .models import Board, Post, Comment, PostLike, CommentLike, SearchHistory
 from apps.settings_app.models import UserSetting
+from apps.account.blocking import exclude_blocked, is_blocked
 from .pagination import PostCursorPagination
 from .serializers import (
     BoardSerializer, PostSerializer, CommentSerializer, PostCreateUpdateSerializer, SearchHistorySerializer
@@ -27,15 +33,16 @@ from .serializers import (
 from apps.notification.utils import send_notification
 from django.contrib.auth.models import User
 
-class BoardListView(generics.ListAPIView):
+class BoardListView(ReferenceDataListMixin, generics.ListAPIView):
     """
     게시판(Board) 목록 조회
     """
-    queryset = Board.objects.all()
+    queryset = Board.objects.all().order_by('id')
     serializer_class = BoardSerializer
+    reference_name = "boards"
     permission_classes = [permissions.AllowAny]
 
-class PopularPostView(generics.RetrieveAPIView):
+class PopularPostView(ReplicaReadMixin, generics.RetrieveAPIView):
     """
     특정 게시판의 인기 게시물 조회 API
     - 최근 10분 내 작성된 게시물 중 최고 좋아요 게시물 반환
@@ -54,7 +61,7 @@ class PopularPostView(generics.RetrieveAPIView):
 
         if user.is_authenticated:
             posts_qs = posts_qs.exclude(hidden_by=user)
-            posts_qs = posts_qs.exclude(author__in=user.profile.blocked_users.all())
+            posts_qs = exclude_blocked(posts_qs, user)
         
         recent_popular_post = (
             posts_qs
@@ -68,7 +75,7 @@ class PopularPostView(generics.RetrieveAPIView):
             posts_qs = Post.objects.filter(board=board)
             if user.is_authenticated:
                 posts_qs = posts_qs.exclude(hidden_by=user)
-                posts_qs = posts_qs.exclude(author__in=user.profile.blocked_users.all())
+                posts_qs = exclude_blocked(posts_qs, user)
 
             recent_popular_post = (
                 posts_qs
@@ -83,7 +90,7 @@ class PopularPostView(generics.RetrieveAPIView):
         serializer = self.get_serializer(recent_popular_post, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
     
-class PostListView(generics.ListAPIView):
+class PostListView(ReplicaReadMixin, generics.ListAPIView):
     """
     전체 게시물 목록
     - 검색 기능 (search 파라미터로 제목/본문 검색)
@@ -93,6 +100,11 @@ class PostListView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
     pagination_class = PostCursorPagination
 
+    @property
+    def throttle_scope(self):
+        # 검색 요청만 제한 (일반 목록 조회는 제한 없음)
+        return "search" if self.request.query_params.get('search', '').strip() else None
+
     def get_queryset(self):
         user = self.request.user
         search = self.request.query_params.get('search', '').strip()
@@ -114,12 +126,11 @@ class PostListView(generics.ListAPIView):
         # 로그인 유저라면 숨긴 글 / 차단 유저 필터링
         if user.is_authenticated:
             queryset = queryset.exclude(hidden_by=user)
-            blocked_users = user.profile.blocked_users.all()
-            queryset = queryset.exclude(author__in=blocked_users)
+            queryset = exclude_blocked(queryset, user)
 
         return queryset
 
-class PostListCreateView(generics.ListCreateAPIView):
+class PostListCreateView(AsyncUploadMixin, ReplicaReadMixin, generics.ListCreateAPIView):
     """
     특정 Board에 속한 Post 목록 조회 & 작성
     - GET: PostSerializer (읽기 전용)
@@ -127,6 +138,7 @@ class PostListCreateView(generics.ListCreateAPIView):
     """
     queryset = Post.objects.all()
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    upload_fields = {"images": POST_IMAGE_POLICY}
     pagination_class = PostCursorPagination
 
     def get_serializer_class(self):
@@ -147,8 +159,7 @@ class PostListCreateView(generics.ListCreateAPIView):
         queryset = Post.objects.filter(board_id=board_id).order_by('-created_at')
         if user.is_authenticated:
             queryset = queryset.exclude(hidden_by=user)
-            blocked_users = user.profile.blocked_users.all()
-            queryset = queryset.exclude(author__in=blocked_users)
+            queryset = exclude_blocked(queryset, user)
         return queryset
     
     # def perform_create(self, serializer):
@@ -162,8 +173,12 @@ class PostListCreateView(generics.ListCreateAPIView):
         self.perform_create(serializer)
 
         post = serializer.instance
-        read_serializer = PostSerializer(post, context=self.get_serializer_context())
-        return Response(read_serializer.data, status=status.HTTP_201_CREATED)
+        data = PostSerializer(post, context=self.get_serializer_context()).data
+        # 일부 이미지 업로드 실패 시 어떤 파일이 빠졌는지 알림
+        failures = getattr(serializer, "upload_failures", None)
+        if failures:
+            data["failed_uploads"] = failures
+        return Response(data, status=status.HTTP_201_CREATED)
 
 class PostDetailView(generics.RetrieveAPIView):
     """
@@ -180,7 +195,14 @@ class PostDetailView(generics.RetrieveAPIView):
         get_object_or_404(Board, id=board_id)
         return Post.objects.filter(board_id=board_id)
 
-class PostUpdateView(generics.UpdateAPIView):
+    def get_object(self):
+        post = super().get_object()
+        # 차단 관계(양방향) 유저의 글은 목록과 마찬가지로 상세에서도 보이지 않음
+        if is_blocked(self.request.user, post.author_id):
+            raise Http404
+        return post
+
+class PostUpdateView(AsyncUploadMixin, generics.UpdateAPIView):
     """
     특정 Post 수정
     PUT /board/<board_id>/posts/<post_id>/
@@ -188,6 +210,7 @@ class PostUpdateView(generics.UpdateAPIView):
     """
     serializer_class = PostCreateUpdateSerializer
     permission_classes = [permissions.IsAuthenticated]
+    upload_fields = {"new_images": POST_IMAGE_POLICY}
     lookup_field = 'id'
     lookup_url_kwarg = 'post_id'
 
@@ -223,30 +246,42 @@ class PostUpdateView(generics.UpdateAPIView):
 
         new_images = self.request.FILES.getlist('new_images')  # MultipartFile 리스트
 
+        # 기존 이미지를 지우기 전에 새 이미지 확장자/크기 검증
+        errors = validate_uploads(new_images, POST_IMAGE_POLICY)
+        if errors:
+            raise ValidationError({"new_images": errors})
+
         # 기존 DB의 이미지 URL 가져오기
         current_images = post.images or []
+        renditions = post.image_renditions or {}
 
-        # 삭제할 이미지 확인 후 Supabase에서 제거
-        images_to_delete = set(current_images) - set(existing_images)
-        for image_url in images_to_delete:
-            delete_image_from_supabase(image_url)
+        # 빠진 이미지 확인 (저장 후 렌디션과 함께 백그라운드에서 삭제)
+        images_to_delete = [url for url in current_images if url not in existing_images]
 
-        # 새로운 이미지 업로드 후 URL 저장
-        uploaded_image_urls = []
-        for image_file in new_images:
-            if isinstance(image_file, InMemoryUploadedFile):
-                image_url = upload_image_to_supabase(image_file)
-                if image_url:
-                    uploaded_image_urls.append(image_url)
+        # 새로운 이미지 동시 업로드 후 URL 저장 (순서 유지)
+        results = upload_files(new_images, POST_IMAGE_POLICY)
+        uploaded_image_urls = uploaded_urls(results)
+        self.upload_failures = upload_errors(results)
 
         # 기존 이미지 + 새로운 이미지 합쳐서 저장
-        serializer.save(images=existing_images + uploaded_image_urls)
+        serializer.save(
+            images=existing_images + uploaded_image_urls,
+            image_renditions={
+                url: sizes for url, sizes in renditions.items() if url in existing_images
+            },
+        )
+        # 새 이미지의 리사이즈 렌디션은 백그라운드에서 생성
+        enqueue_post_image_renditions(post.id, uploaded_image_urls)
+        delete_images_later(images_to_delete, renditions)
 
     def update(self, request, *args, **kwargs):
         super().update(request, *args, **kwargs)       
         post = self.get_object()
-        detailed_serializer = PostSerializer(post, context={'request': request})
-        return Response(detailed_serializer.data)
+        data = PostSerializer(post, context={'request': request}).data
+        failures = getattr(self, "upload_failures", None)
+        if failures:
+            data["failed_uploads"] = failures
+        return Response(data)
 
 class PostDeleteView(generics.DestroyAPIView):
     """
@@ -266,6 +301,8 @@ class PostDeleteView(generics.DestroyAPIView):
         if instance.author != self.request.user:
             raise PermissionDenied("You can only delete your own posts.")
         instance.delete()
+        # 게시글 이미지(렌디션 포함)도 저장소에서 삭제
+        delete_images_later(instance.images or [], instance.image_renditions)
 
 class HidePostView(generics.GenericAPIView):
     """
@@ -292,7 +329,7 @@ class HidePostView(generics.GenericAPIView):
             post.hidden_by.add(user)
             return Response({"detail": "The post has been hidden."}, status=status.HTTP_200_OK)
 
-class CommentListCreateView(generics.ListCreateAPIView):
+class CommentListCreateView(ReplicaReadMixin, generics.ListCreateAPIView):
     """
     Post에 달린 댓글/대댓글 목록 & 작성
     /board/<board_id>/posts/<post_id>/comments/
@@ -300,6 +337,11 @@ class CommentListCreateView(generics.ListCreateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    @property
+    def throttle_scope(self):
+        # 작성(알림 발송)만 제한
+        return "comment" if self.request.method == "POST" else None
+
     def get_queryset(self):
         user = self.request.user
         post_id = self.kwargs['post_id']
@@ -307,9 +349,8 @@ class CommentListCreateView(generics.ListCreateAPIView):
         # parent가 없는 최상위 댓글만 조회 (대댓글은 replies 필드에서)
 
         if user.is_authenticated:
-            # 차단한 유저의 댓글 제외
-            blocked_users = user.profile.blocked_users.all()
-            queryset = queryset.exclude(author__in=blocked_users)
+            # 차단한/나를 차단한 유저의 댓글 제외
+            queryset = exclude_blocked(queryset, user)
 
             # 숨김 처리한 댓글 제외
             queryset = queryset.exclude(hidden_by=user)
@@ -358,6 +399,7 @@ class CommentLikeToggleView(generics.GenericAPIView):
     POST /board/<board_id>/posts/<post_id>/comments/<comment_id>/like/
     """
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "toggle"
 
     def post(self, request, board_id, post_id, comment_id):
         user = request.user
@@ -426,6 +468,7 @@ class PostLikeToggleView(generics.GenericAPIView):
     POST /board/<board_id>/posts/<post_id>/like/
     """
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "toggle"
 
     def post(self, request, board_id, post_id):
         user = request.user
@@ -463,6 +506,7 @@ class ScrapToggleView(generics.GenericAPIView):
     /board/<board_id>/posts/<post_id>/scrap/
     """
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "toggle"
 
     def post(self, request, board_id, post_id):
         post = get_object_or_404(Post, id=post_id, board_id=board_id)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class MeetupConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.meetup'
+
+    def ready(self):
+        import apps.meetup.signals
+        from apps.meetup.cache import warn_if_cache_is_process_local
+
+        warn_if_cache_is_process_local()
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+
+# 필터 조합별 이벤트 목록 캐시 TTL (초)
+MEETING_LIST_CACHE_TTL = 60
+# 무효화가 다른 프로세스(워커/다른 웹 서버)에 전달되지 않는 캐시 백엔드
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+GENERATION_KEY = "meetup:list:generation"
+HITS_KEY = "meetup:list:hits"
+MISSES_KEY = "meetup:list:misses"
+
+# 캐시 키에 들어가는 필터 (검색어는 조합이 너무 많아 캐시하지 않음)
+CACHEABLE_FILTERS = (
+    "rlg", "start_date", "end_date", "category_id",
+    "language", "nationality", "school_id",
+)
+
+
+def normalize_filters(query_params):
+    """
+    - 쿼리 파라미터에서 목록 필터만 뽑아 정렬된 (이름, 값) 튜플로 정규화
+    - 빈 값은 필터가 없는 것으로 취급
+    """
+    filters = []
+    for name in CACHEABLE_FILTERS:
+        value = (query_params.get(name) or "").strip()
+        if value:
+            filters.append((name, value))
+    return tuple(filters)
+
+
+def _incr(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # 키가 없거나 만료된 경우
+        cache.add(key, 1, timeout=None)
+        return 1
+
+
+def _generation():
+    """
+    - 무효화 세대 번호. 세대가 바뀌면 이전 세대 키는 자연스럽게 TTL로 사라짐
+    - 키가 유실돼도 이전 세대와 겹치지 않도록 현재 시각으로 초기화
+    """
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def _cache_key(filters):
+    digest = hashlib.sha1(json.dumps(filters).encode()).hexdigest()
+    # v2: 값이 id 목록 → (start_time, id, creator_id) 목록으로 바뀜
+    return f"meetup:list:v2:{_generation()}:{digest}"
+
+
+def get_cached_meetings(filters, build_entries):
+    """
+    - 정규화된 필터 조합에 해당하는 (start_time, id 순) (start_time, id, creator_id) 목록 반환
+    - 캐시에 없으면 build_entries()로 만들어 저장
+    """
+    key = _cache_key(filters)
+    entries = cache.get(key)
+    if entries is not None:
+        _incr(HITS_KEY)
+        return entries
+
+    _incr(MISSES_KEY)
+    entries = build_entries()
+    cache.set(key, entries, MEETING_LIST_CACHE_TTL)
+    return entries
+
+
+def cursor_window(entries, cursor, page_size):
+    """
+    - 캐시된 목록에서 커서 페이지 하나를 계산하는 데 필요한 이벤트 id 만 (id__in 목록을 페이지 크기로 제한)
+    - MeetingCursorPagination(start_time, id 순)과 같은 규칙: 커서 위치(start_time) 이후/이전에서
+      offset + page_size + 1 개 (다음/이전 페이지 여부 확인용 1개 포함)
+    - entries 는 이미 화면에 보일 수 있는 이벤트만 (시작 전, 차단 관계 제외) 걸러진 상태여야 함
+    """
+    offset, reverse, position = cursor if cursor is not None else (0, False, None)
+    limit = offset + page_size + 1
+    start_times = [start_time for start_time, _, _ in entries]
+    if position is None:
+        window = entries[-limit:] if reverse else entries[:limit]
+    else:
+        try:
+            position = datetime.fromisoformat(position)
+        except ValueError:
+            # 해석할 수 없는 위치 → 제한하지 않음 (페이지네이션이 DB 에서 처리)
+            return [meeting_id for _, meeting_id, _ in entries]
+        if reverse:
+            end = bisect_left(start_times, position)
+            window = entries[max(0, end - limit):end]
+        else:
+            start = bisect_right(start_times, position)
+            window = entries[start:start + limit]
+    return [meeting_id for _, meeting_id, _ in window]
+
+
+def invalidate_meeting_list_cache():
+    """
+    이벤트 생성/수정/삭제/좋아요/참여 시 호출 → 모든 필터 조합 캐시 무효화
+    """
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+def warn_if_cache_is_process_local():
+    """
+    - 운영(DEBUG=False)에서 CACHE_URL 이 없어 프로세스 로컬 캐시를 쓰면 경고
+      (이벤트 변경 시 무효화가 다른 웹 프로세스/워커에 전달되지 않아 TTL 동안 지난 목록이 보임)
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if not settings.DEBUG and backend in PROCESS_LOCAL_CACHE_BACKENDS:
+        print(f"[WARNING] 공유 캐시 미설정 ({backend}): CACHE_URL 을 설정하지 않으면 모임 목록 캐시 무효화가 프로세스 간에 전달되지 않음")
+
+
+def get_meeting_list_cache_stats():
+    hits = cache.get(HITS_KEY) or 0
+    misses = cache.get(MISSES_KEY) or 0
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
+
+
+def reset_meeting_list_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.meetup.cache import get_meeting_list_cache_stats, reset_meeting_list_cache_stats
+
+
+class Command(BaseCommand):
+    help = "이벤트 목록 캐시 적중률 조회 (공유 캐시(CACHE_URL) 사용 시 전체 워커 합산)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="조회 후 카운터 초기화")
+
+    def handle(self, *args, **options):
+        stats = get_meeting_list_cache_stats()
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} "
+            f"hit_rate={stats['hit_rate']:.1%}"
+        )
+        if options["reset"]:
+            reset_meeting_list_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters have been reset."))
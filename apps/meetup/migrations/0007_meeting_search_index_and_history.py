@@ -0,0 +1,50 @@
+# Generated by Django 5.1.5 on 2026-10-19 13:51
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+def dedupe_search_histories(apps, schema_editor):
+    """
+    unique_together 추가 전, (user, keyword) 중복 기록은 가장 최근 것만 남긴다
+    """
+    MeetingSearchHistory = apps.get_model('meetup', 'MeetingSearchHistory')
+    seen = set()
+    stale_ids = []
+    for history_id, user_id, keyword in (
+        MeetingSearchHistory.objects.order_by('-created_at', '-id')
+        .values_list('id', 'user_id', 'keyword')
+        .iterator()
+    ):
+        if (user_id, keyword) in seen:
+            stale_ids.append(history_id)
+        else:
+            seen.add((user_id, keyword))
+    MeetingSearchHistory.objects.filter(id__in=stale_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0012_remove_userprofile_language_userprofile_languages'),
+        ('meetup', '0006_meeting_is_all_languages_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_search_histories, migrations.RunPython.noop),
+        migrations.AlterModelOptions(
+            name='meetingsearchhistory',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AlterUniqueTogether(
+            name='meetingsearchhistory',
+            unique_together={('user', 'keyword')},
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='simple', weight='A'), '||', django.contrib.postgres.search.SearchVector('location_name', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig('simple')), '||', django.contrib.postgres.search.SearchVector('description', config='simple', weight='C'), django.contrib.postgres.search.SearchConfig('simple')), name='meeting_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-19 13:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetup', '0007_meeting_search_index_and_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='thumbnail_renditions',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
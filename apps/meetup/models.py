@@ -1,9 +1,27 @@
 # Create your models here.
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.utils import timezone
 from apps.account.models import Language, Nationality, School
 
+# 검색 기록은 유저당 최근 N개만 유지
+MEETING_SEARCH_HISTORY_LIMIT = 20
+
+
+def meeting_search_vector():
+    """
+    - 이벤트 검색용 tsvector (제목 > 장소명 > 설명 순으로 가중치)
+    - GIN 인덱스와 검색 쿼리가 같은 식을 써야 인덱스를 탈 수 있으므로 한 곳에서 생성
+    - 다국어 텍스트라 언어별 형태소 분석 없이 'simple' 설정 사용
+    """
+    return (
+        SearchVector("title", weight="A", config="simple")
+        + SearchVector("location_name", weight="B", config="simple")
+        + SearchVector("description", weight="C", config="simple")
+    )
+
 class RLG(models.TextChoices):
     SEOUL = "Seoul"
     BUSAN = "Busan"
@@ -43,6 +61,8 @@ class Meeting(models.Model):
     rlg = models.CharField(choices=RLG.choices, max_length=20)
 
     thumbnails = models.JSONField(default=list)
+    # {원본 썸네일 URL: {"full": url, "feed": url, "thumbnail": url}}
+    thumbnail_renditions = models.JSONField(default=dict, blank=True)
     languages = models.ManyToManyField(Language)
     nationalities = models.ManyToManyField(Nationality)
     school_ids = models.ManyToManyField(School, blank=True)
@@ -54,6 +74,10 @@ class Meeting(models.Model):
     is_all_nationalities = models.BooleanField(default=False)
     is_all_schools = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            GinIndex(meeting_search_vector(), name="meeting_search_vector_idx"),
+        ]
 
     def is_closed(self):
         return (self.participants.count() + 1) >= self.capacity or self.is_closed_manual
@@ -74,6 +98,10 @@ class MeetingSearchHistory(models.Model):
     keyword = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-created_at']
+        unique_together = ('user', 'keyword')  # 중복 방지
+
 class MeetingQnA(models.Model):
     meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name="qnas")
     author = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -1,5 +1,16 @@
 from rest_framework.pagination import CursorPagination
 
 class MeetingCursorPagination(CursorPagination):
-    ordering = 'start_time'
-    page_size = 10
\ No newline at end of file
+    """
+    목록은 시작 시간 순, 같은 시작 시간은 id 순 (캐시된 목록의 순서와 같음, apps/meetup/cache.py)
+    """
+    ordering = ('start_time', 'id')
+    page_size = 10
+
+class MeetingSearchCursorPagination(CursorPagination):
+    """
+    검색 결과는 관련도(search_rank) 순, 같은 관련도는 시작 시간 순
+    - 커서는 첫 정렬 키(관련도) + 같은 값 안의 offset 으로 위치를 기억 → 동점끼리 순서가 고정되도록 마지막에 id
+    """
+    ordering = ('-search_rank', 'start_time', 'id')
+    page_size = 10
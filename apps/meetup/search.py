@@ -0,0 +1,42 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+
+from .models import meeting_search_vector
+
+# 검색어 토큰 최대 개수 (지나치게 긴 검색어로 tsquery가 커지는 것 방지)
+MAX_SEARCH_TOKENS = 8
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def build_prefix_query(search):
+    """
+    - 검색어를 단어 단위로 쪼개 각 단어를 접두어 매칭(`단어:*`)하는 tsquery 생성
+    - 기존 icontains 검색처럼 입력 중인 단어도 걸리도록 접두어 검색 사용
+    - 유효한 단어가 없으면 None
+    """
+    tokens = TOKEN_PATTERN.findall(search.lower())[:MAX_SEARCH_TOKENS]
+    if not tokens:
+        return None
+    raw_query = " & ".join(f"{token}:*" for token in tokens)
+    return SearchQuery(raw_query, search_type="raw", config="simple")
+
+
+def search_meetings(queryset, search):
+    """
+    - 제목/장소명/설명 tsvector(GIN 인덱스)로 필터링하고 `search_rank`로 관련도 주석
+    - 정렬은 호출하는 쪽(페이지네이션)에서 `search_rank` 기준으로 처리
+    """
+    query = build_prefix_query(search)
+    if query is None:
+        return queryset.none()
+
+    return queryset.alias(
+        search_vector=meeting_search_vector()
+    ).filter(
+        search_vector=query
+    ).annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    )
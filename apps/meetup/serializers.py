@@ -5,6 +5,8 @@ from .models import (
 from apps.account.models import Language, Nationality, School
 from django.utils import timezone
 import json
+from core.images import serialize_renditions
+from core.uploads import MEETING_IMAGE_POLICY, validate_uploads
 
 class ParticipantSerializer(serializers.Serializer):
     user_id = serializers.IntegerField(source='id')
@@ -24,6 +26,7 @@ class MeetingDetailSerializer(serializers.ModelSerializer):
     nationalities = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True)
     school_names = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True, source="school_ids")
     thumbnails = serializers.ListField(child=serializers.URLField(), required=False)
+    thumbnail_renditions = serializers.SerializerMethodField()
 
     is_all_languages = serializers.BooleanField()
     is_all_nationalities = serializers.BooleanField()
@@ -36,6 +39,7 @@ class MeetingDetailSerializer(serializers.ModelSerializer):
             'languages', 'nationalities', 'school_names', 'category_id', 'description', 'thumbnails',
             'is_closed', 'is_ended', 'is_liked', 'creator', 'participants',
             'is_creator', 'is_participant', 'thumbnails', 'is_all_languages', 'is_all_nationalities', 'is_all_schools',
+            'thumbnail_renditions',
         ]
 
     def get_location(self, obj):
@@ -47,6 +51,10 @@ class MeetingDetailSerializer(serializers.ModelSerializer):
             "rlg": obj.rlg,
         }
 
+    def get_thumbnail_renditions(self, obj):
+        # 썸네일별 사이즈(full/feed/thumbnail) URL (생성 전이면 원본 URL)
+        return serialize_renditions(obj.thumbnails, obj.thumbnail_renditions)
+
     def get_is_closed(self, obj):
         return obj.is_closed()
 
@@ -116,6 +124,12 @@ class MeetingCreateSerializer(serializers.Serializer):
         loc_ser.is_valid(raise_exception=True)
         return value
 
+    def validate_thumbnails(self, value):
+        errors = validate_uploads(value, MEETING_IMAGE_POLICY)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return value
+
     def validate_languages(self, value):
         if not isinstance(value, list):
             raise serializers.ValidationError("languages must be a list")
@@ -166,3 +180,21 @@ class MeetingQnASerializer(serializers.ModelSerializer):
         model = MeetingQnA
         fields = ["id", "user_id", "user_nickname", "user_profile_image", "content", "created_at", "comments"]
 
+
+
+class HostedMeetingSummarySerializer(serializers.ModelSerializer):
+    """
+    프로필 요약용 주최 이벤트 (목록 미리보기)
+    - participant_count: 쿼리에서 annotate
+    """
+    participant_count = serializers.IntegerField(read_only=True)
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Meeting
+        fields = ['id', 'title', 'start_time', 'location_name', 'capacity', 'participant_count', 'thumbnail']
+
+    def get_thumbnail(self, obj):
+        # 첫 썸네일의 작은 사이즈 (생성 전이면 원본)
+        renditions = serialize_renditions(obj.thumbnails[:1], obj.thumbnail_renditions)
+        return renditions[0]["thumbnail"] if renditions else None
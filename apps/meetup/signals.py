@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .cache import invalidate_meeting_list_cache
+from .models import Meeting
+
+
+@receiver(post_save, sender=Meeting)
+@receiver(post_delete, sender=Meeting)
+def invalidate_on_meeting_change(sender, **kwargs):
+    # 생성/수정(좋아요 수 포함)/삭제
+    invalidate_meeting_list_cache()
+
+
+@receiver(m2m_changed, sender=Meeting.participants.through)
+@receiver(m2m_changed, sender=Meeting.liked_users.through)
+@receiver(m2m_changed, sender=Meeting.languages.through)
+@receiver(m2m_changed, sender=Meeting.nationalities.through)
+@receiver(m2m_changed, sender=Meeting.school_ids.through)
+def invalidate_on_meeting_relation_change(sender, action, **kwargs):
+    # 참여/탈퇴/강퇴, 좋아요, 참여 조건 변경
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_meeting_list_cache()
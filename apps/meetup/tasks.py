@@ -0,0 +1,73 @@
+from celery import shared_task
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.images import generate_renditions_for_urls
+from .models import Meeting, MeetingSearchHistory, MEETING_SEARCH_HISTORY_LIMIT
+
+
+@shared_task
+def record_meeting_search(user_id, keyword):
+    """
+    - 이벤트 검색어 기록 (요청 밖에서 비동기로 처리)
+    - 같은 검색어는 새로 만들지 않고 시간만 갱신해 맨 위로 올림
+    - 유저당 최근 MEETING_SEARCH_HISTORY_LIMIT 개만 유지
+    """
+    keyword = keyword.strip()[:255]
+    if not keyword:
+        return
+
+    histories = MeetingSearchHistory.objects.filter(user_id=user_id)
+
+    if not histories.filter(keyword=keyword).update(created_at=timezone.now()):
+        try:
+            with transaction.atomic():
+                MeetingSearchHistory.objects.create(user_id=user_id, keyword=keyword)
+        except IntegrityError:
+            # 같은 검색어가 동시에 기록된 경우 → 이미 최신 상태
+            pass
+
+    stale_ids = list(
+        histories.order_by('-created_at', '-id')
+        .values_list('id', flat=True)[MEETING_SEARCH_HISTORY_LIMIT:]
+    )
+    if stale_ids:
+        MeetingSearchHistory.objects.filter(id__in=stale_ids).delete()
+
+
+@shared_task
+def generate_meeting_thumbnail_renditions(meeting_id, image_urls):
+    """
+    - 이벤트 썸네일의 WebP 렌디션(full/feed/thumbnail) 생성 후 Meeting.thumbnail_renditions 에 기록
+    - 처리 중 이벤트에서 빠진 썸네일은 기록하지 않음
+    """
+    renditions = generate_renditions_for_urls(image_urls)
+    if not renditions:
+        return
+
+    with transaction.atomic():
+        meeting = Meeting.objects.select_for_update().filter(id=meeting_id).first()
+        if meeting is None:
+            return
+        merged = dict(meeting.thumbnail_renditions or {})
+        merged.update({url: sizes for url, sizes in renditions.items() if url in meeting.thumbnails})
+        # save() 대신 update() → 다른 필드를 덮어쓰지 않고, 목록 캐시 무효화 시그널도 발생하지 않음
+        Meeting.objects.filter(id=meeting_id).update(thumbnail_renditions=merged)
+
+
+def enqueue_meeting_thumbnail_renditions(meeting_id, image_urls):
+    """
+    - 트랜잭션 커밋 후 렌디션 생성 태스크 등록
+    - 브로커 장애가 이벤트 생성/수정 요청을 실패시키지 않도록 예외는 로그만 남김
+    """
+    image_urls = list(image_urls)
+    if not image_urls:
+        return
+
+    def enqueue():
+        try:
+            generate_meeting_thumbnail_renditions.delay(meeting_id, image_urls)
+        except Exception as e:
+            print(f"[WARNING] 이벤트 썸네일 렌디션 태스크 등록 실패: {e}")
+
+    transaction.on_commit(enqueue)
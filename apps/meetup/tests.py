@@ -1,3 +1,211 @@
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, FloatField, Value, When
+from django.http import QueryDict
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.account.models import UserProfile
+from . import cache as list_cache
+from .models import MEETING_SEARCH_HISTORY_LIMIT, Meeting, MeetingSearchHistory
+from .pagination import MeetingCursorPagination, MeetingSearchCursorPagination
+from .tasks import record_meeting_search
+
+
+def create_meeting(creator, title="Hiking", description="Weekend hike", start_time=None, **fields):
+    return Meeting.objects.create(
+        creator=creator,
+        title=title,
+        description=description,
+        start_time=start_time or timezone.now() + timedelta(days=2),
+        capacity=5,
+        category_id=0,
+        lat=0,
+        lng=0,
+        location_name="Seoul Forest",
+        address="Seoul",
+        rlg="Seoul",
+        **fields,
+    )
+
+
+class MeetingSearchPaginationTests(TestCase):
+    def setUp(self):
+        self.creator = User.objects.create_user("creator@example.com")
+
+    def walk(self, queryset, page_size=2):
+        """
+        - 커서를 따라 마지막 페이지까지 읽은 id 목록
+        """
+        factory = APIRequestFactory()
+        paginator = MeetingSearchCursorPagination()
+        paginator.page_size = page_size
+        ids, url = [], "/meetup/?search=hike"
+        while url:
+            page = paginator.paginate_queryset(queryset, Request(factory.get(url)))
+            ids += [meeting.id for meeting in page]
+            url = paginator.get_next_link()
+        return ids
+
+    def test_ties_are_paginated_by_id(self):
+        # 관련도와 시작 시간이 모두 같은 이벤트 → id 로만 순서가 정해져야 페이지 경계에서 중복/누락이 없음
+        start_time = timezone.now() + timedelta(days=2)
+        meetings = [create_meeting(self.creator, start_time=start_time) for _ in range(5)]
+        queryset = Meeting.objects.annotate(search_rank=Value(0.5, output_field=FloatField()))
+
+        self.assertEqual(self.walk(queryset), sorted(meeting.id for meeting in meetings))
+
+    def test_rank_then_start_time(self):
+        now = timezone.now()
+        later = create_meeting(self.creator, start_time=now + timedelta(days=3))
+        sooner = create_meeting(self.creator, start_time=now + timedelta(days=2))
+        best = create_meeting(self.creator, start_time=now + timedelta(days=4))
+        queryset = Meeting.objects.annotate(
+            search_rank=Case(When(id=best.id, then=Value(0.9)), default=Value(0.1), output_field=FloatField())
+        )
+
+        self.assertEqual(self.walk(queryset), [best.id, sooner.id, later.id])
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "전문 검색(tsvector)은 PostgreSQL 전용")
+@mock.patch("apps.meetup.views.record_meeting_search")
+class MeetingSearchViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("searcher@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_ranked_results_and_history(self, record_search):
+        creator = User.objects.create_user("creator@example.com")
+        start_time = timezone.now() + timedelta(days=2)
+        in_description = create_meeting(creator, title="Picnic", description="hike after lunch", start_time=start_time)
+        in_title = create_meeting(creator, title="Hike", description="Mountain", start_time=start_time + timedelta(days=1))
+        ties = [create_meeting(creator, title="Hike", description="Mountain", start_time=start_time) for _ in range(3)]
+        create_meeting(creator, title="Board games", description="Cafe", start_time=start_time)
+
+        ids, url = [], "/meetup/?search=hik"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [meeting["id"] for meeting in response.data["results"]]
+            url = response.data["next"]
+
+        # 제목 일치(가중치 A) > 설명 일치(C), 같은 관련도는 시작 시간 → id 순
+        self.assertEqual(ids, [*sorted(m.id for m in ties), in_title.id, in_description.id])
+        # 검색 기록은 첫 페이지 요청에서만
+        record_search.delay.assert_called_once_with(self.user.id, "hik")
+
+
+class RecordMeetingSearchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("searcher@example.com")
+
+    def keywords(self):
+        return list(MeetingSearchHistory.objects.filter(user=self.user).values_list("keyword", flat=True))
+
+    def test_records_trimmed_keyword(self):
+        record_meeting_search(self.user.id, "  hiking  ")
+        record_meeting_search(self.user.id, "   ")
+
+        self.assertEqual(self.keywords(), ["hiking"])
+
+    def test_repeated_keyword_moves_to_top(self):
+        record_meeting_search(self.user.id, "hiking")
+        record_meeting_search(self.user.id, "cafe")
+        MeetingSearchHistory.objects.filter(keyword="hiking").update(created_at=timezone.now() - timedelta(hours=1))
+
+        record_meeting_search(self.user.id, "hiking")
+
+        self.assertEqual(self.keywords(), ["hiking", "cafe"])
+
+    def test_keeps_latest_keywords(self):
+        for index in range(MEETING_SEARCH_HISTORY_LIMIT + 3):
+            record_meeting_search(self.user.id, f"keyword {index}")
+
+        keywords = self.keywords()
+        self.assertEqual(len(keywords), MEETING_SEARCH_HISTORY_LIMIT)
+        self.assertNotIn("keyword 0", keywords)
+        self.assertIn(f"keyword {MEETING_SEARCH_HISTORY_LIMIT + 2}", keywords)
+
+
+class MeetingListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.creator = User.objects.create_user("creator@example.com")
+
+    def test_filters_are_normalized(self):
+        filters = list_cache.normalize_filters(QueryDict("school_id=3&rlg=Seoul&search=hike&language=&category_id= 1 "))
+
+        self.assertEqual(filters, (("rlg", "Seoul"), ("category_id", "1"), ("school_id", "3")))
+        # 파라미터 순서/빈 값/검색어와 무관하게 같은 키
+        same = list_cache.normalize_filters(QueryDict("rlg=Seoul&category_id=1&school_id=3&end_date="))
+        self.assertEqual(list_cache._cache_key(filters), list_cache._cache_key(same))
+        other = list_cache.normalize_filters(QueryDict("rlg=Busan&category_id=1&school_id=3"))
+        self.assertNotEqual(list_cache._cache_key(filters), list_cache._cache_key(other))
+
+    def test_invalidation(self):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return [len(builds)]
+
+        self.assertEqual(list_cache.get_cached_meetings((), build), [1])
+        self.assertEqual(list_cache.get_cached_meetings((), build), [1])
+
+        list_cache.invalidate_meeting_list_cache()
+        self.assertEqual(list_cache.get_cached_meetings((), build), [2])
+
+        # 이벤트 저장(signals) → 무효화
+        create_meeting(self.creator)
+        self.assertEqual(list_cache.get_cached_meetings((), build), [3])
+
+        # 세대 키가 유실돼도 이전 세대의 키를 다시 쓰지 않음
+        cache.delete(list_cache.GENERATION_KEY)
+        self.assertEqual(list_cache.get_cached_meetings((), build), [4])
+
+    def test_cursor_window_is_capped_to_page(self):
+        start_time = timezone.now() + timedelta(days=2)
+        entries = [(start_time + timedelta(hours=index // 2), index, 0) for index in range(100)]
+
+        self.assertEqual(list_cache.cursor_window(entries, None, 10), list(range(11)))
+        position = str(entries[49][0])
+        # 다음 페이지: 위치(start_time) 이후, 이전 페이지: 위치 이전
+        self.assertEqual(list_cache.cursor_window(entries, (0, False, position), 10), list(range(50, 61)))
+        self.assertEqual(list_cache.cursor_window(entries, (1, False, position), 10), list(range(50, 62)))
+        self.assertEqual(list_cache.cursor_window(entries, (0, True, position), 10), list(range(37, 48)))
+
+    @mock.patch.object(MeetingCursorPagination, "page_size", 2)
+    def test_list_pages_through_cached_meetings(self):
+        viewer = User.objects.create_user("viewer@example.com")
+        UserProfile.objects.create(user=viewer, nickname="viewer")
+        blocked = User.objects.create_user("blocked@example.com")
+        UserProfile.objects.create(user=blocked, nickname="blocked")
+        viewer.profile.blocked_users.add(blocked)
+        start_time = timezone.now() + timedelta(days=2)
+        meetings = [
+            create_meeting(self.creator, start_time=start_time + timedelta(hours=index // 2)) for index in range(7)
+        ]
+        create_meeting(blocked, start_time=start_time)
+        create_meeting(self.creator, start_time=timezone.now() - timedelta(hours=1))
+        client = APIClient()
+        client.force_authenticate(viewer)
+
+        pages, url = [], "/meetup/?rlg=Seoul"
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([meeting["id"] for meeting in response.data["results"]])
+            url = response.data["next"]
 
-# Create your tests here.
+        self.assertEqual(pages, [[m.id for m in meetings[i:i + 2]] for i in range(0, 7, 2)])
+        # 이전 페이지(역방향 커서)
+        previous = client.get(response.data["previous"])
+        self.assertEqual([meeting["id"] for meeting in previous.data["results"]], pages[-2])
@@ -11,6 +11,7 @@ from rest_framework import serializers
 from rest_framework import status
 from django.utils import timezone
 from datetime import datetime, time
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.db import transaction
 from django.db.models import Q, F, Count
@@ -20,9 +21,17 @@ from .serializers import (
     MeetingSearchHistorySerializer, MeetingQnASerializer, MeetingCreateSerializer
 )
 from apps.account.models import Language, Nationality, School
+from apps.account.blocking import exclude_blocked, get_blocked_user_ids, is_blocked
 from django.contrib.auth.models import User
-from .supabase_utils import upload_image_to_supabase, delete_image_from_supabase
-from .pagination import MeetingCursorPagination
+from .pagination import MeetingCursorPagination, MeetingSearchCursorPagination
+from .search import search_meetings
+from .cache import cursor_window, normalize_filters, get_cached_meetings
+from .tasks import record_meeting_search, enqueue_meeting_thumbnail_renditions
+from core.tasks import delete_images_later
+from core.uploads import MEETING_IMAGE_POLICY, upload_files, validate_uploads, uploaded_urls, upload_errors
+from core.storage import get_image_storage
+from core.async_views import AsyncUploadMixin
+from core.replica import ReplicaReadMixin, primary_reads
 
 from apps.notification.utils import (
     handle_join_meeting_notification,
@@ -31,22 +40,55 @@ from apps.notification.utils import (
     handle_qna_comment_notification, 
     handle_kick_participant_notification
 )
-from .supabase_utils import supabase_url, supabase_bucket
+
+# 썸네일 없이 만든 모임의 기본 이미지 (저장소 default_images/ 는 삭제 대상에서 제외)
+DEFAULT_THUMBNAIL_PATH = "default_images/Placeholder%20Image.webp"
 
 class MeetingDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, meeting_id):
         meeting = get_object_or_404(Meeting, id=meeting_id)
+        # 차단 관계(양방향) 유저가 만든 이벤트는 목록과 마찬가지로 상세에서도 보이지 않음
+        if is_blocked(request.user, meeting.creator_id):
+            raise Http404
         serializer = MeetingDetailSerializer(meeting, context={"request": request})
         return Response(serializer.data, status=200)
 
-class MeetingListView(ListAPIView):
+class MeetingListView(ReplicaReadMixin, ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = MeetingDetailSerializer
     pagination_class = MeetingCursorPagination
 
-    def get_queryset(self):
+    def get_search_keyword(self):
+        return self.request.query_params.get("search", "").strip()
+
+    @property
+    def paginator(self):
+        # 검색 중에는 관련도 순으로 페이지네이션
+        if not hasattr(self, '_paginator'):
+            if self.get_search_keyword():
+                self._paginator = MeetingSearchCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def list(self, request, *args, **kwargs):
+        search = self.get_search_keyword()
+        # 첫 페이지 요청일 때만 검색 기록 저장 (다음 페이지 커서 요청은 제외)
+        if search and not request.query_params.get(self.paginator.cursor_query_param):
+            try:
+                record_meeting_search.delay(request.user.id, search)
+            except Exception as e:
+                print(f"[WARNING] 검색 기록 task enqueue 실패: {e}")
+        return super().list(request, *args, **kwargs)
+
+    def filter_meetings(self, filters):
+        """
+        - 모집 중(시작 전 + 정원 미달)인 이벤트에 목록 필터 적용
+        - filters: normalize_filters()로 정규화된 (이름, 값) 튜플
+        """
+        params = dict(filters)
         queryset = Meeting.objects.annotate(
             num_participants=models.Count("participants")
         ).filter(
@@ -54,20 +96,12 @@ class MeetingListView(ListAPIView):
             num_participants__lt=F("capacity")
         )
 
-        rlg = self.request.query_params.get("rlg")
+        rlg = params.get("rlg")
         if rlg:
             queryset = queryset.filter(rlg=rlg)
 
-        search = self.request.query_params.get("search")
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(location_name__icontains=search) |
-                Q(description__icontains=search)
-            )
-
-        start_date = self.request.query_params.get("start_date")
-        end_date = self.request.query_params.get("end_date")
+        start_date = params.get("start_date")
+        end_date = params.get("end_date")
         if start_date and end_date:
             try:
                 start_dt = datetime.strptime(start_date, "%Y-%m-%d")
@@ -77,25 +111,59 @@ class MeetingListView(ListAPIView):
             except ValueError:
                 pass
     
-        category_id = self.request.query_params.get("category_id")
+        category_id = params.get("category_id")
         if category_id is not None:
             queryset = queryset.filter(category_id=category_id)
 
-        language = self.request.query_params.get("language")
+        language = params.get("language")
         if language:
             queryset = queryset.filter(languages__language=language)
 
-        nationality = self.request.query_params.get("nationality")
+        nationality = params.get("nationality")
         if nationality:
             queryset = queryset.filter(nationalities__name=nationality)
 
-        school_id = self.request.query_params.get("school_id")
+        school_id = params.get("school_id")
         if school_id:
             queryset = queryset.filter(
-                Q(schools__id=school_id) | Q(schools__isnull=True)
+                Q(school_ids__id=school_id) | Q(school_ids__isnull=True)
             )
 
-        return queryset.order_by("-like_count", "start_time")
+        return queryset
+
+    def build_meeting_entries(self, filters):
+        # 공유 캐시에 TTL 동안 남는 결과 → 복제 지연으로 빠진 이벤트가 캐시되지 않도록 primary 에서 조회
+        with primary_reads():
+            entries = self.filter_meetings(filters).order_by("start_time", "id").values_list(
+                "start_time", "id", "creator_id"
+            )
+            # M2M 필터 조인으로 생길 수 있는 중복 제거 (순서 유지)
+            return list(dict.fromkeys(entries))
+
+    def get_queryset(self):
+        filters = normalize_filters(self.request.query_params)
+
+        search = self.get_search_keyword()
+        if search:
+            queryset = search_meetings(self.filter_meetings(filters), search)
+            return exclude_blocked(queryset, self.request.user, field="creator")
+
+        # 필터 조합별 목록은 캐시, 유저별 필드(is_liked, 차단 관계 등)는 요청마다 반영
+        # 이미 시작했거나 차단 관계인 이벤트를 먼저 빼고 이번 페이지 범위의 id 만 조회
+        now = timezone.now()
+        blocked_ids = set(get_blocked_user_ids(self.request.user))
+        entries = [
+            entry for entry in get_cached_meetings(filters, lambda: self.build_meeting_entries(filters))
+            if entry[0] >= now and entry[2] not in blocked_ids
+        ]
+        meeting_ids = cursor_window(
+            entries, self.paginator.decode_cursor(self.request), self.paginator.get_page_size(self.request)
+        )
+        queryset = Meeting.objects.filter(
+            id__in=meeting_ids,
+            start_time__gte=now
+        ).order_by("-like_count", "start_time")
+        return exclude_blocked(queryset, self.request.user, field="creator")
 
 class JoinMeetingView(APIView):
     permission_classes = [IsAuthenticated]
@@ -146,8 +214,9 @@ class JoinMeetingView(APIView):
 
         return Response({"message": "Successfully joined the event."}, status=200)
 
-class CreateMeetingView(CreateAPIView):
+class CreateMeetingView(AsyncUploadMixin, CreateAPIView):
     permission_classes = [IsAuthenticated]
+    upload_fields = {"thumbnails": MEETING_IMAGE_POLICY}
     serializer_class   = MeetingCreateSerializer
 
     def create(self, request, *args, **kwargs):
@@ -197,23 +266,25 @@ class CreateMeetingView(CreateAPIView):
             meeting.school_ids.set(School.objects.filter(name__in=schools))
             meeting.is_all_schools = False
 
-        # 썸네일 업로드
-        urls = []
-        for f in thumbs:
-            url = upload_image_to_supabase(f)
-            if url:
-                urls.append(url)
-        
-        if not urls:
-            default_url = f"{supabase_url}/storage/v1/object/public/{supabase_bucket}/default_images/Placeholder%20Image.webp"
-            urls = [default_url]
+        # 썸네일 동시 업로드 (순서 유지)
+        results = upload_files(thumbs, MEETING_IMAGE_POLICY)
+        urls = uploaded_urls(results)
 
-        meeting.thumbnails = urls
+        if urls:
+            meeting.thumbnails = urls
+        else:
+            meeting.thumbnails = [get_image_storage().url(DEFAULT_THUMBNAIL_PATH)]
         meeting.save()
 
-        # 응답
-        output = MeetingDetailSerializer(meeting, context={'request': request})
-        return Response(output.data, status=status.HTTP_201_CREATED)
+        # 업로드한 썸네일의 리사이즈 렌디션은 백그라운드에서 생성
+        enqueue_meeting_thumbnail_renditions(meeting.id, urls)
+
+        # 응답 (일부 썸네일 업로드 실패 시 어떤 파일이 빠졌는지 알림)
+        output = MeetingDetailSerializer(meeting, context={'request': request}).data
+        failures = upload_errors(results)
+        if failures:
+            output["failed_uploads"] = failures
+        return Response(output, status=status.HTTP_201_CREATED)
 
 
 class ToggleMeetingCloseView(APIView):
@@ -279,8 +350,9 @@ class KickParticipantView(APIView):
         handle_kick_participant_notification(meeting, remove_user)
         return Response(status=200)
 
-class UpdateMeetingView(APIView):
+class UpdateMeetingView(AsyncUploadMixin, APIView):
     permission_classes = [IsAuthenticated]
+    upload_fields = {"new_images": MEETING_IMAGE_POLICY}
 
     def patch(self, request, meeting_id):
         meeting = get_object_or_404(Meeting, id=meeting_id)
@@ -302,23 +374,34 @@ class UpdateMeetingView(APIView):
             existing_images = []
 
         new_files = request.FILES.getlist("new_images")
+        # 기존 썸네일을 지우기 전에 새 이미지 확장자/크기 검증
+        errors = validate_uploads(new_files, MEETING_IMAGE_POLICY)
+        if errors:
+            return Response({"new_images": errors}, status=400)
+
         current_images = meeting.thumbnails or []
-        to_delete = set(current_images) - set(existing_images)
-        for url in to_delete:
-            delete_image_from_supabase(url)
+        renditions = meeting.thumbnail_renditions or {}
+        to_delete = [url for url in current_images if url not in existing_images]
 
-        new_urls = []
-        for file in new_files:
-            uploaded = upload_image_to_supabase(file)
-            if uploaded:
-                new_urls.append(uploaded)
+        results = upload_files(new_files, MEETING_IMAGE_POLICY)
+        new_urls = uploaded_urls(results)
 
         meeting.title = title
         meeting.description = description
         meeting.thumbnails = existing_images + new_urls
+        meeting.thumbnail_renditions = {
+            url: sizes for url, sizes in renditions.items() if url in existing_images
+        }
         meeting.save()
+        enqueue_meeting_thumbnail_renditions(meeting.id, new_urls)
+        # 빠진 썸네일은 렌디션과 함께 백그라운드에서 삭제
+        delete_images_later(to_delete, renditions)
 
-        return Response(MeetingDetailSerializer(meeting, context={"request": request}).data, status=200)
+        output = MeetingDetailSerializer(meeting, context={"request": request}).data
+        failures = upload_errors(results)
+        if failures:
+            output["failed_uploads"] = failures
+        return Response(output, status=200)
 
 class DeleteMeetingView(APIView):
     permission_classes = [IsAuthenticated]
@@ -335,10 +418,10 @@ class DeleteMeetingView(APIView):
         if meeting.participants.exclude(id=request.user.id).exists():
             return Response({"error": "Other participants exist."}, status=400)
         
-        for url in meeting.thumbnails:
-            delete_image_from_supabase(url)
-
+        thumbnails = meeting.thumbnails or []
+        renditions = meeting.thumbnail_renditions
         meeting.delete()
+        delete_images_later(thumbnails, renditions)
         return Response(status=204)
 
 class CreateMeetingNoticeView(APIView):
@@ -384,6 +467,7 @@ class DeleteMeetingNoticeView(APIView):
 
 class ToggleMeetingLikeView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = "toggle"
 
     def post(self, request, meeting_id):
         meeting = get_object_or_404(Meeting, id=meeting_id)
@@ -468,7 +552,7 @@ class MeetingQnAListView(APIView):
         user = request.user
 
         if user == meeting.creator:
-            qnas = meeting.qnas.all().order_by('-created_at')
+            qnas = exclude_blocked(meeting.qnas.all(), user).order_by('-created_at')
         else:
             qnas = meeting.qnas.filter(author=user).order_by('-created_at')
 
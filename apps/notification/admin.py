@@ -1,3 +1,24 @@
 from django.contrib import admin
+# fcm_django 의 기본 관리자 등록을 먼저 불러온 뒤 교체
+from fcm_django.admin import DeviceAdmin
+from fcm_django.models import FCMDevice
 
-# Register your models here.
+from core.clients import get_client
+
+
+class FCMDeviceAdmin(DeviceAdmin):
+    """
+    - fcm_django 관리자 (테스트 알림 발송, 토픽 구독 등)
+    - 시작 시 Firebase 를 초기화하지 않으므로 액션 실행 직전에 firebase_admin 기본 앱을 만듦
+    """
+
+    def response_action(self, request, queryset):
+        try:
+            get_client("firebase_app")
+        except Exception as e:
+            print(f"[WARNING] Firebase 앱 초기화 실패: {e}")
+        return super().response_action(request, queryset)
+
+
+admin.site.unregister(FCMDevice)
+admin.site.register(FCMDevice, FCMDeviceAdmin)
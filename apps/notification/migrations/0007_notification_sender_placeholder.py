@@ -0,0 +1,75 @@
+# Generated by Django 5.1.5 on 2026-10-19 14:05
+
+from django.db import migrations
+
+SENDER_PLACEHOLDER = "{sender}"
+BATCH_SIZE = 1000
+
+# 닉네임이 맨 앞에 들어가던 알림 문구 (닉네임 뒷부분)
+TITLE_SUFFIXES = (
+    " replied to your comment!",
+    " commented on your post!",
+    " liked your post!",
+    " liked your comment!",
+    " mentioned you in a comment",
+)
+# 이벤트 알림: 제목 → 메시지에서 닉네임 뒤에 오는 문구
+MESSAGE_PHRASES = {
+    "Someone Joined Your Meetup!": " has joined \"",
+    "New Question for Your Meetup": " asked a question in \"",
+    "New Comment in the Q&A": " commented on Q&A in \"",
+}
+
+
+def _with_placeholder_title(title):
+    for suffix in TITLE_SUFFIXES:
+        if title and title.endswith(suffix) and len(title) > len(suffix):
+            return SENDER_PLACEHOLDER + suffix
+    return title
+
+
+def _with_placeholder_message(title, message):
+    phrase = MESSAGE_PHRASES.get(title)
+    index = message.find(phrase) if phrase and message else -1
+    if index <= 0:
+        return message
+    return SENDER_PLACEHOLDER + message[index:]
+
+
+def use_sender_placeholder(apps, schema_editor):
+    """
+    - 기존 알림의 닉네임(변경 전 닉네임 포함)을 SENDER_PLACEHOLDER 로 교체
+    - sender 가 있는 알림만, pk 순서로 나눠서 처리
+    """
+    Notification = apps.get_model('notification', 'Notification')
+    last_pk = 0
+    while True:
+        batch = list(
+            Notification.objects.filter(pk__gt=last_pk, sender__isnull=False)
+            .order_by('pk')
+            .only('pk', 'title', 'message')[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+
+        changed = []
+        for notification in batch:
+            title = _with_placeholder_title(notification.title)
+            message = _with_placeholder_message(notification.title, notification.message)
+            if title != notification.title or message != notification.message:
+                notification.title = title
+                notification.message = message
+                changed.append(notification)
+        Notification.objects.bulk_update(changed, ['title', 'message'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notification', '0006_notification_meetup_id_notification_notice_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_sender_placeholder, migrations.RunPython.noop),
+    ]
@@ -3,9 +3,28 @@ from django.db import models
 # Create your models here.
 from django.contrib.auth.models import User
 
+# title/message 맨 앞의 이 토큰은 조회/발송 시점에 보낸 사람의 현재 닉네임으로 치환
+# (닉네임을 저장하지 않으므로 닉네임 변경 시 알림을 다시 쓸 필요 없음)
+SENDER_PLACEHOLDER = "{sender}"
+UNKNOWN_SENDER_NICKNAME = "Someone"
+
+
+def render_sender(text, sender):
+    """
+    - 맨 앞의 SENDER_PLACEHOLDER 를 sender 닉네임으로 치환
+    - 본문(유저 입력)에 같은 문자열이 있어도 바꾸지 않도록 앞부분만 확인
+    """
+    if not text or not text.startswith(SENDER_PLACEHOLDER):
+        return text
+    profile = getattr(sender, "profile", None) if sender else None
+    nickname = profile.nickname if profile else UNKNOWN_SENDER_NICKNAME
+    return nickname + text[len(SENDER_PLACEHOLDER):]
+
+
 class Notification(models.Model):
     """
     In-app 알림 저장 (유저가 알림 목록을 볼 수 있도록)
+    - 보낸 사람 닉네임은 sender 로 참조 (title/message 에는 SENDER_PLACEHOLDER)
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
     sender = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='sent_notifications')
@@ -22,4 +41,12 @@ class Notification(models.Model):
     question_id = models.IntegerField(null=True, blank=True)
 
     def __str__(self):
-        return f"Notification for {self.user.username}: {self.message}"
\ No newline at end of file
+        return f"Notification for {self.user.username}: {self.rendered_message}"
+
+    @property
+    def rendered_title(self):
+        return render_sender(self.title, self.sender)
+
+    @property
+    def rendered_message(self):
+        return render_sender(self.message, self.sender)
\ No newline at end of file
@@ -1,7 +1,13 @@
 from rest_framework import serializers
 from .models import Notification
 from apps.board.models import Post
+
+DEFAULT_PROFILE_IMAGE = "https://mjkitubvbpjnzihaaxjo.supabase.co//storage/v1/object/public/kickit_bucket/profile_images/default_profile.png"
+
 class NotificationSerializer(serializers.ModelSerializer):
+    # 보낸 사람 닉네임은 조회 시점의 현재 닉네임으로 채움
+    title = serializers.CharField(source='rendered_title', read_only=True)
+    message = serializers.CharField(source='rendered_message', read_only=True)
     profile_image = serializers.SerializerMethodField()
     sender_nickname = serializers.SerializerMethodField()
     board_id = serializers.SerializerMethodField()
@@ -13,10 +19,8 @@ class NotificationSerializer(serializers.ModelSerializer):
         """
         알림을 보낸 주체(시스템 or 유저)의 프로필 이미지 반환
         """
-        default_image_url = "https://mjkitubvbpjnzihaaxjo.supabase.co//storage/v1/object/public/kickit_bucket/profile_images/default_profile.png"
-
         profile = getattr(obj.sender, 'profile', None)
-        return profile.profile_image if profile and profile.profile_image else default_image_url
+        return profile.profile_image if profile and profile.profile_image else DEFAULT_PROFILE_IMAGE
     
     def get_board_id(self, obj):
         """
@@ -31,6 +35,8 @@ class NotificationSerializer(serializers.ModelSerializer):
         return obj.sender.profile.nickname if obj.sender else "System"
 
 class MeetupNotificationSerializer(serializers.ModelSerializer):
+    title = serializers.CharField(source='rendered_title', read_only=True)
+    message = serializers.CharField(source='rendered_message', read_only=True)
     profile_image = serializers.SerializerMethodField()
 
     class Meta:
@@ -1,63 +1,26 @@
 from django.conf import settings
 from celery import shared_task
 from django.contrib.auth.models import User
-from firebase_admin.messaging import Message, send, Notification as FirebaseNotification
+from django.core.mail import send_mail
+from django.db import transaction
 from fcm_django.models import FCMDevice
 import requests
-import os
 import json
-from google.oauth2 import service_account
-from google.auth.transport.requests import Request
-
-FIREBASE_SCOPES = ["https://www.googleapis.com/auth/firebase.messaging"]
+from core.clients import get_fcm_access_token
+from apps.notification.models import render_sender
 
 FCM_API_URL = f"https://fcm.googleapis.com/v1/projects/{settings.FIREBASE_PROJECT_ID}/messages:send"
 
-def get_firebase_credentials_json():
-    file_path = "/etc/secrets/firebase.json"
-    # 1) 로컬 파일이 있으면 그대로 사용
-    if os.path.exists(file_path):
-        try:
-            with open(file_path, "r") as f:
-                return f.read()
-        except Exception as e:
-            print("Firebase 자격 증명 파일 읽기 실패:", e)
-    # 2) 없거나 읽기 실패 시 Secrets Manager에서 가져오기
-    try:
-        import boto3
-        from django.conf import settings
-        client = boto3.client("secretsmanager", region_name=settings.AWS_REGION)
-        resp = client.get_secret_value(SecretId=settings.FIREBASE_SECRET_NAME)
-        return resp["SecretString"]
-    except Exception as e:
-        print("Secrets Manager에서 자격 증명 읽기 실패:", e)
-        return None
-    
-def get_fcm_access_token():
-    """
-    Firebase Cloud Messaging HTTP v1 API를 사용하기 위한 OAuth 2.0 액세스 토큰 발급
-    (Secrets Manager 등에서 JSON을 로드한 뒤 in-memory로 자격증명을 생성)
-    """
-    # 1) Secrets Manager(또는 다른 안전한 방법)로부터 credentials JSON 불러오기
-    cred_json_str = get_firebase_credentials_json()  # 아래 예시 함수로부터 가져온 문자열
-    if cred_json_str is None:
-        raise ValueError("Firebase 자격 증명을 불러오지 못했습니다.")
-    cred_json_dict = json.loads(cred_json_str)
-
-    credentials = service_account.Credentials.from_service_account_info(
-        cred_json_dict,
-        scopes=FIREBASE_SCOPES
-    )
-
-    credentials.refresh(Request())  # 토큰 갱신
-    return credentials.token
-
+# 대량 알림에서 푸시 태스크 하나가 보내는 최대 사용자 수
+PUSH_BATCH_SIZE = 100
 
-def send_fcm_push_notification(user, title, message, board_id=None, post_id=None, comment_id=None):
+def send_fcm_push_notification(user, title, message, board_id=None, post_id=None, comment_id=None, device=None, session=requests):
     """
     특정 유저에게 FCM Push 알림을 전송하는 함수
+    - device: 미리 조회한 FCMDevice (대량 전송용), session: 연결을 재사용할 requests.Session
     """
-    device = FCMDevice.objects.filter(user=user).first()
+    if device is None:
+        device = FCMDevice.objects.filter(user=user).first()
     if not device:
         print(f"{user.username}의 FCM 기기가 등록되지 않음")
         return
@@ -97,7 +60,7 @@ def send_fcm_push_notification(user, title, message, board_id=None, post_id=None
         }
     }
     
-    response = requests.post(FCM_API_URL, headers=headers, data=json.dumps(payload))
+    response = session.post(FCM_API_URL, headers=headers, data=json.dumps(payload))
 
     if response.status_code == 200:
         print(f"{user.username}에게 푸시 알림 전송 성공")
@@ -111,3 +74,99 @@ def send_push_notification_async(user_id, title, message, board_id=None, post_id
         send_fcm_push_notification(user, title, message, board_id, post_id, comment_id)
     except User.DoesNotExist:
         print(f"[ERROR] User {user_id} not found")
+
+
+@shared_task
+def send_push_notification_batch(user_ids, title, message, board_id=None, post_id=None, comment_id=None):
+    """
+    - 여러 사용자에게 같은 푸시 전송 (fanout 큐 → 실시간 push 큐를 막지 않음)
+    - 기기는 한 번에 조회하고 FCM 연결은 재사용
+    """
+    users = User.objects.filter(id__in=user_ids)
+    devices = {}
+    for device in FCMDevice.objects.filter(user_id__in=user_ids).order_by("pk"):
+        # 사용자당 첫 번째 기기 (send_fcm_push_notification 과 같은 기준)
+        devices.setdefault(device.user_id, device)
+
+    with requests.Session() as session:
+        for user in users:
+            if user.id not in devices:
+                continue
+            try:
+                send_fcm_push_notification(
+                    user, title, message, board_id, post_id, comment_id,
+                    device=devices[user.id], session=session,
+                )
+            except Exception as e:
+                print(f"[WARNING] 푸시 알림 전송 실패 (user {user.id}): {e}")
+
+
+def enqueue_push_batches(user_ids, title, message, board_id=None, post_id=None, comment_id=None):
+    """
+    - user_ids 를 PUSH_BATCH_SIZE 명씩 묶어 send_push_notification_batch 등록
+    """
+    user_ids = list(user_ids)
+    for start in range(0, len(user_ids), PUSH_BATCH_SIZE):
+        try:
+            send_push_notification_batch.delay(
+                user_ids[start:start + PUSH_BATCH_SIZE], title, message, board_id, post_id, comment_id
+            )
+        except Exception as e:
+            print(f"[WARNING] Celery task enqueue 실패: {e}")
+
+
+@shared_task
+def send_meeting_notifications(user_ids, sender_id, title, message, meetup_id=None, notice_id=None):
+    """
+    - 여러 참여자에게 이벤트 알림 (In-app 알림 생성 후 푸시는 묶어서 전송)
+    - 요청 안에서 참여자 수만큼 알림 설정 조회/생성을 하지 않도록 fanout 큐에서 실행
+    """
+    # utils 가 이 모듈을 import 하므로 실행 시점에 가져옴
+    from apps.notification.utils import send_meeting_notification
+
+    sender = User.objects.filter(id=sender_id).first() if sender_id else None
+    notified = [
+        user.id
+        for user in User.objects.filter(id__in=user_ids)
+        if send_meeting_notification(
+            user=user, sender=sender, title=title, message=message,
+            meetup_id=meetup_id, notice_id=notice_id, push=False,
+        )
+    ]
+    enqueue_push_batches(notified, render_sender(title, sender), render_sender(message, sender))
+
+
+def enqueue_meeting_notifications(user_ids, sender, title, message, meetup_id=None, notice_id=None):
+    """
+    - 트랜잭션 커밋 후 대량 이벤트 알림 태스크 등록
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    sender_id = sender.id if sender else None
+
+    def enqueue():
+        try:
+            send_meeting_notifications.delay(user_ids, sender_id, title, message, meetup_id, notice_id)
+        except Exception as e:
+            print(f"[WARNING] Celery task enqueue 실패: {e}")
+
+    transaction.on_commit(enqueue)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_email_async(self, subject, message, recipient_list, from_email="no-reply@squible.net"):
+    """
+    - 이메일 전송 (email 큐: 푸시가 몰려도 인증 메일이 밀리지 않음)
+    """
+    try:
+        send_mail(
+            subject=subject,
+            message=message,
+            from_email=from_email,
+            recipient_list=recipient_list,
+            fail_silently=False,
+        )
+    except Exception as e:
+        print(f"[ERROR] 이메일 전송 실패: {e}")
+        raise self.retry(exc=e)
@@ -1,3 +1,78 @@
-from django.test import TestCase
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TransactionTestCase
+
+from .models import SENDER_PLACEHOLDER, UNKNOWN_SENDER_NICKNAME, render_sender
+
+
+class RenderSenderTests(SimpleTestCase):
+    def setUp(self):
+        self.sender = SimpleNamespace(profile=SimpleNamespace(nickname="kicker"))
+
+    def test_replaces_leading_placeholder(self):
+        self.assertEqual(render_sender(f"{SENDER_PLACEHOLDER} liked your post!", self.sender), "kicker liked your post!")
+
+    def test_unknown_sender(self):
+        text = f"{SENDER_PLACEHOLDER} commented on your post!"
+        # 탈퇴 등으로 sender 가 없거나 프로필이 없는 경우
+        for sender in (None, SimpleNamespace(profile=None)):
+            with self.subTest(sender=sender):
+                self.assertEqual(render_sender(text, sender), f"{UNKNOWN_SENDER_NICKNAME} commented on your post!")
+
+    def test_leaves_other_text(self):
+        # 본문(유저 입력) 중간의 같은 문자열은 바꾸지 않음
+        for text in (None, "", "Welcome!", f'kicker asked "{SENDER_PLACEHOLDER}?"'):
+            with self.subTest(text=text):
+                self.assertEqual(render_sender(text, self.sender), text)
+
+
+class SenderPlaceholderMigrationTests(TransactionTestCase):
+    """
+    - 0006 상태에서 넣은 기존 알림이 0007 적용 후 SENDER_PLACEHOLDER 를 쓰는지 확인
+    """
+    migrate_from = ("notification", "0006_notification_meetup_id_notification_notice_id_and_more")
+    migrate_to = ("notification", "0007_notification_sender_placeholder")
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([target])
+        return executor.loader.project_state([target]).apps
+
+    def setUp(self):
+        self.addCleanup(self.migrate, self.migrate_to)
+        old_apps = self.migrate(self.migrate_from)
+        Notification = old_apps.get_model("notification", "Notification")
+        sender = User.objects.create_user("sender@example.com")
+        receiver = User.objects.create_user("receiver@example.com")
+
+        def create(title, message, sender_id=sender.id):
+            return Notification.objects.create(user_id=receiver.id, sender_id=sender_id, title=title, message=message).pk
+
+        self.ids = {
+            "like": create("old nickname liked your post!", "great post"),
+            "join": create("Someone Joined Your Meetup!", 'old nickname has joined "Hike".'),
+            "qna": create("New Question for Your Meetup", 'old nickname asked a question in "Hike".'),
+            "notice": create("Notice", "Server maintenance"),
+            "no_sender": create("old nickname liked your post!", "great post", sender_id=None),
+            "suffix_only": create(" liked your post!", "great post"),
+        }
+
+    def test_existing_notifications_use_placeholder(self):
+        new_apps = self.migrate(self.migrate_to)
+        Notification = new_apps.get_model("notification", "Notification")
+        rows = {
+            name: Notification.objects.values_list("title", "message").get(pk=pk)
+            for name, pk in self.ids.items()
+        }
+
+        self.assertEqual(rows["like"], (f"{SENDER_PLACEHOLDER} liked your post!", "great post"))
+        self.assertEqual(rows["join"], ("Someone Joined Your Meetup!", f'{SENDER_PLACEHOLDER} has joined "Hike".'))
+        self.assertEqual(rows["qna"], ("New Question for Your Meetup", f'{SENDER_PLACEHOLDER} asked a question in "Hike".'))
+        # 닉네임이 없는 알림, sender 가 없는 알림은 그대로
+        self.assertEqual(rows["notice"], ("Notice", "Server maintenance"))
+        self.assertEqual(rows["no_sender"], ("old nickname liked your post!", "great post"))
+        self.assertEqual(rows["suffix_only"], (" liked your post!", "great post"))
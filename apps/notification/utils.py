@@ -1,22 +1,16 @@
 from django.conf import settings
-from apps.notification.models import Notification
+from apps.notification.models import Notification, SENDER_PLACEHOLDER, render_sender
 from apps.settings_app.models import NotificationType
 from django.contrib.auth.models import User
 from apps.settings_app.models import UserSetting
 import requests
 from fcm_django.models import FCMDevice
-from firebase_admin.messaging import Message, Notification as FirebaseNotification, send
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
 import requests
 import json
-import os
-import boto3
-import base64
-from botocore.exceptions import ClientError
 from django.conf import settings
-from django.core.mail import send_mail
-from apps.notification.tasks import send_push_notification_async, send_fcm_push_notification
+from apps.notification.tasks import (
+    send_push_notification_async, send_fcm_push_notification, send_email_async, enqueue_meeting_notifications,
+)
 
 def send_notification(user, title, message, board_id=None, post_id=None, comment_id=None, sender=None):
     """
@@ -49,7 +43,9 @@ def send_notification(user, title, message, board_id=None, post_id=None, comment
     )
 
     try:
-        send_push_notification_async.delay(user.id, title, message, board_id, post_id, comment_id)
+        send_push_notification_async.delay(
+            user.id, render_sender(title, sender), render_sender(message, sender), board_id, post_id, comment_id
+        )
     except Exception as e:
         print(f"[WARNING] Celery task enqueue 실패: {e}")
 
@@ -67,7 +63,7 @@ def handle_comment_notification(comment, post, board, parent_comment):
             send_notification(
                 user=parent_comment_author,
                 sender=comment_author,
-                title=f"{comment_author.profile.nickname} replied to your comment!",
+                title=f"{SENDER_PLACEHOLDER} replied to your comment!",
                 message=f"{comment.content}",
                 board_id=board.id,
                 post_id=post.id,
@@ -80,7 +76,7 @@ def handle_comment_notification(comment, post, board, parent_comment):
             send_notification(
                 user=post_author,
                 sender=comment_author,
-                title=f"{comment_author.profile.nickname} commented on your post!",
+                title=f"{SENDER_PLACEHOLDER} commented on your post!",
                 message=f"{comment.content}",
                 board_id=board.id,
                 post_id=post.id,
@@ -101,13 +97,13 @@ def handle_like_notification(user, board, post_or_comment, is_post=True):
         return
 
     if is_post:
-        title = f"{user.profile.nickname} liked your post!"
+        title = f"{SENDER_PLACEHOLDER} liked your post!"
         message = f"'{post_or_comment.content}'"
         board_id = board.id
         post_id = post_or_comment.id 
         comment_id = None
     else:
-        title = f"{user.profile.nickname} liked your comment!"
+        title = f"{SENDER_PLACEHOLDER} liked your comment!"
         message = f"'{post_or_comment.content}'"
         board_id = board.id
         post_id = post_or_comment.post.id  
@@ -137,7 +133,7 @@ def handle_mention_notification(board, comment, mention_usernames):
                 send_notification(
                     user=mentioned_user,
                     sender=comment_author, 
-                    title=f"{comment_author.profile.nickname} mentioned you in a comment",
+                    title=f"{SENDER_PLACEHOLDER} mentioned you in a comment",
                     message=f"{comment.content}",
                     board_id = board.id,
                     post_id=comment.post.id,
@@ -174,19 +170,11 @@ def send_verification_notification(user, success=True):
     except Exception as e:
         print("[ERROR] 푸시 알림 실패:", e)
 
-    # ✅ Email 알림 전송
+    # ✅ Email 알림 전송 (email 큐, 실패 시 태스크에서 재시도)
     try:
-        send_mail(
-            subject=title,
-            message=message,
-            from_email="no-reply@squible.net",
-            recipient_list=[user.email],
-            fail_silently=False,  # 여전히 raise 하도록
-        )
-    except ConnectionRefusedError:
-        print("[ERROR] 메일 서버에 연결할 수 없습니다. 이메일 전송 실패")
+        send_email_async.delay(title, message, [user.email])
     except Exception as e:
-        print("[ERROR] 이메일 전송 실패:", e)
+        print(f"[WARNING] Celery task enqueue 실패: {e}")
 
 
 def send_verification_failure_email(user):
@@ -202,17 +190,16 @@ def send_verification_failure_email(user):
     )
 
 
-    send_mail(
-        subject=subject,
-        message=message,
-        from_email="no-reply@squible.net",
-        recipient_list=[user.email],
-        fail_silently=False,
-    )
+    try:
+        send_email_async.delay(subject, message, [user.email])
+    except Exception as e:
+        print(f"[WARNING] Celery task enqueue 실패: {e}")
 
-def send_meeting_notification(user, title, message, meetup_id=None, notice_id=None, question_id=None, comment_id=None, sender=None):
+def send_meeting_notification(user, title, message, meetup_id=None, notice_id=None, question_id=None, comment_id=None, sender=None, push=True):
     """
     이벤트 관련 알림 (In-app + Push)
+    - push=False: In-app 알림만 생성 (대량 알림은 푸시를 묶어서 따로 전송)
+    - 알림을 만들었으면 True
     """
     if sender == user:
         return
@@ -244,10 +231,13 @@ def send_meeting_notification(user, title, message, meetup_id=None, notice_id=No
         comment_id=comment_id,
     )
 
+    if not push:
+        return True
     try:
-        send_push_notification_async.delay(user.id, title, message)
+        send_push_notification_async.delay(user.id, render_sender(title, sender), render_sender(message, sender))
     except Exception as e:
         print(f"[WARNING] 이벤트 푸시 전송 실패: {e}")
+    return True
 
 def handle_join_meeting_notification(meeting, participant):
     """
@@ -261,7 +251,7 @@ def handle_join_meeting_notification(meeting, participant):
         user=meeting.creator,
         sender=participant,
         title="Someone Joined Your Meetup!",
-        message=f"{participant.profile.nickname} has joined \"{meeting.title}\".",
+        message=f"{SENDER_PLACEHOLDER} has joined \"{meeting.title}\".",
         meetup_id=meeting.id
     )
 
@@ -271,17 +261,17 @@ def handle_notice_created_notification(notice):
     """
     meeting = notice.meeting
     sender = meeting.creator
-    participants = meeting.participants.exclude(id=sender.id)
-
-    for user in participants:
-        send_meeting_notification(
-            user=user,
-            sender=sender,
-            title="New Update for Your Meetup",
-            message=f"The host added a new notice to \"{meeting.title}\".",
-            meetup_id=meeting.id,
-            notice_id=notice.id
-        )
+    participant_ids = meeting.participants.exclude(id=sender.id).values_list("id", flat=True)
+
+    # 참여자 수만큼의 알림 생성/푸시는 fanout 큐의 태스크에서 처리
+    enqueue_meeting_notifications(
+        participant_ids,
+        sender=sender,
+        title="New Update for Your Meetup",
+        message=f"The host added a new notice to \"{meeting.title}\".",
+        meetup_id=meeting.id,
+        notice_id=notice.id
+    )
 
 def handle_question_notification(qna):
     """
@@ -291,7 +281,7 @@ def handle_question_notification(qna):
         user=qna.meeting.creator,
         sender=qna.author,
         title="New Question for Your Meetup",
-        message=f"{qna.author.profile.nickname} asked a question in \"{qna.meeting.title}\".",
+        message=f"{SENDER_PLACEHOLDER} asked a question in \"{qna.meeting.title}\".",
         meetup_id=qna.meeting.id,
         question_id=qna.id
     )
@@ -308,7 +298,7 @@ def handle_qna_comment_notification(comment):
         user=receiver,
         sender=sender,
         title="New Comment in the Q&A",
-        message=f"{sender.profile.nickname} commented on Q&A in \"{qna.meeting.title}\".",
+        message=f"{SENDER_PLACEHOLDER} commented on Q&A in \"{qna.meeting.title}\".",
         meetup_id=qna.meeting.id,
         question_id=qna.id,
         comment_id=comment.id
@@ -318,17 +308,11 @@ def handle_meeting_reminder_notification(meeting):
     """
     - 24시간 전 자동 알림: 호스트 + 모든 참여자
     """
-    for user in meeting.participants.all():
-        send_meeting_notification(
-            user=user,
-            sender=None,
-            title="Your Meetup Is Coming Up Soon!",
-            message=f"\"{meeting.title}\" starts in 24 hours!",
-            meetup_id=meeting.id
-        )
-    
-    send_meeting_notification(
-        user=meeting.creator,
+    user_ids = set(meeting.participants.values_list("id", flat=True))
+    user_ids.add(meeting.creator_id)
+
+    enqueue_meeting_notifications(
+        sorted(user_ids),
         sender=None,
         title="Your Meetup Is Coming Up Soon!",
         message=f"\"{meeting.title}\" starts in 24 hours!",
@@ -19,7 +19,11 @@ class NotificationListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Notification.objects.filter(user=self.request.user).order_by('-created_at')
+        return (
+            Notification.objects.filter(user=self.request.user)
+            .select_related('sender__profile')
+            .order_by('-created_at')
+        )
 
 
 class NotificationDetailView(generics.RetrieveUpdateAPIView):
@@ -62,7 +66,7 @@ class MeetupNotificationListView(generics.ListAPIView):
         return Notification.objects.filter(
             user=self.request.user,
             meetup_id__isnull=False
-        ).order_by("-created_at")
+        ).select_related("sender__profile").order_by("-created_at")
 
 
 class MeetupNotificationDetailView(APIView):
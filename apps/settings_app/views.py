@@ -9,13 +9,13 @@ from django.contrib.auth.models import User
 from django.contrib.auth import update_session_auth_hash
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import logout
-from .supabase_utils import upload_image_to_supabase
-from django.db import models
+from core.uploads import PROFILE_IMAGE_POLICY, upload_files, validate_upload
+from core.async_views import AsyncUploadMixin
+from core.replica import ReplicaReadMixin
+from django.db import models, transaction
 from apps.board.pagination import PostCursorPagination
 from django.contrib.admin.views.decorators import staff_member_required
 from django.utils.decorators import method_decorator
-from django.db.models import F, Value
-from django.db.models.functions import Replace
 
 from .models import UserSetting, NotificationType, NotificationCategory, ContactUs, ReportReason, Report
 from .serializers import (
@@ -28,9 +28,11 @@ from .serializers import (
 from apps.board.serializers import PostSerializer, CommentSerializer
 from django.contrib.auth.models import User
 from apps.account.models import UserProfile
+from apps.account.models import AccountDeactivationJob
+from apps.account.tasks import DELETED_USER_NICKNAME, enqueue_account_deactivation, enqueue_nickname_propagation
+from apps.account.tokens import AllowlistRefreshToken, revoke_refresh_tokens
 from apps.board.models import PostLike, Post, Comment
 from apps.notification.models import Notification
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 
 from apps.meetup.serializers import MeetingDetailSerializer
@@ -96,8 +98,9 @@ class NotificationCategoryListView(generics.ListAPIView):
     def get_queryset(self):
         return NotificationCategory.objects.all()
     
-class ProfileUpdateView(views.APIView):
+class ProfileUpdateView(AsyncUploadMixin, views.APIView):
     permission_classes = [permissions.IsAuthenticated]
+    upload_fields = {"image": PROFILE_IMAGE_POLICY}
 
     def patch(self, request):
         serializer = ProfileUpdateSerializer(data=request.data, context={"request": request})
@@ -110,30 +113,32 @@ class ProfileUpdateView(views.APIView):
         image = serializer.validated_data.get("image", None)
         introduce = serializer.validated_data.get("introduce")
 
-        # 닉네임 변경
+        # 이미지 크기/형식은 다른 변경을 반영하기 전에 확인
+        if image:
+            error = validate_upload(image, PROFILE_IMAGE_POLICY)
+            if error:
+                return Response({"error": error}, status=400)
+
+        # 닉네임 변경 (게시글/댓글 반영은 백그라운드 태스크에서 처리)
+        nickname_changed = bool(nickname) and nickname != profile.nickname
         if nickname:
-            old_nickname = profile.nickname
             profile.nickname = nickname
 
-            # 게시글 및 댓글 반영
-            Post.objects.filter(author=user).update(author_nickname=nickname)
-            Comment.objects.filter(author=user).update(author_nickname=nickname)
-            Notification.objects.filter(message__icontains=old_nickname).update(
-                message=Replace(F('message'), Value(old_nickname), Value(nickname))
-            )
-
         # 이미지 변경
         if image:
-            uploaded_url = upload_image_to_supabase(image)
-            if not uploaded_url:
-                return Response({"error": "Image upload failed."}, status=500)
-            profile.profile_image = uploaded_url
+            result = upload_files([image], PROFILE_IMAGE_POLICY)[0]
+            if not result.ok:
+                return Response({"error": result.error}, status=500)
+            profile.profile_image = result.url
         
         if introduce is not None:
             profile.introduce = introduce
 
         profile.save()
 
+        if nickname_changed:
+            enqueue_nickname_propagation(user.id)
+
         return Response({
             "detail": "Profile has been updated.",
             "profile_image": profile.profile_image if image else None,
@@ -225,7 +230,7 @@ class PasswordChangeView(views.APIView):
             user.save()
 
             # JWT 기반에서는 기존 토큰을 폐기하고 새로 발급해야 함.
-            refresh = RefreshToken.for_user(user)
+            refresh = AllowlistRefreshToken.for_user(user)
             response = Response({"detail": "Password has been changed successfully."}, status=status.HTTP_200_OK)
             response.set_cookie('access_token', value=str(refresh.access_token), httponly=True, secure=True, samesite='None')
             response.set_cookie('refresh_token', value=str(refresh), httponly=True, secure=True, samesite='None')
@@ -283,28 +288,26 @@ class UserDeactivateView(views.APIView):
         if not user.check_password(password):
             return Response({"error": "The password is incorrect."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 유저 비활성화 (DB에는 유지)
-        user.is_active = False
-        user.save()
+        with transaction.atomic():
+            # 유저 비활성화 (DB에는 유지)
+            user.is_active = False
+            user.save(update_fields=["is_active"])
 
-        # 닉네임을 "탈퇴한 사용자"로 변경
-        profile = getattr(user, 'profile', None)
-        if profile:
-            profile.nickname = "Deleted User"
-            profile.save()
+            # 닉네임을 "탈퇴한 사용자"로 변경
+            profile = getattr(user, 'profile', None)
+            if profile:
+                profile.nickname = DELETED_USER_NICKNAME
+                profile.save(update_fields=["nickname"])
 
-        # 게시글 & 댓글에서 닉네임을 "탈퇴한 사용자"로 변경
-        Post.objects.filter(author=user).update(author_nickname="Deleted User")
-        Comment.objects.filter(author=user).update(author_nickname="Deleted User")
+            # 모든 기기의 refresh 토큰 무효화 (로그아웃)
+            revoke_refresh_tokens(user)
 
-        # JWT 토큰 블랙리스트 처리 (로그아웃)
-        try:
-            refresh_token = request.COOKIES.get("refresh_token")
-            if refresh_token:
-                token = RefreshToken(refresh_token)
-                token.blacklist()
-        except TokenError:
-            pass
+            # 게시글/댓글 익명화, 기기/모임 참여/좋아요/스크랩/알림 정리는 백그라운드에서 처리
+            job, _ = AccountDeactivationJob.objects.update_or_create(
+                user=user,
+                defaults={"status": AccountDeactivationJob.Status.PENDING, "step": "", "last_error": ""},
+            )
+            enqueue_account_deactivation(job.id)
 
         # 클라이언트 쿠키 삭제 (로그아웃 처리)
         response = Response({"detail": "Your account has been deactivated."}, status=status.HTTP_200_OK)
@@ -314,7 +317,7 @@ class UserDeactivateView(views.APIView):
         return response
 
 
-class LikedPostsView(generics.ListAPIView):
+class LikedPostsView(ReplicaReadMixin, generics.ListAPIView):
     """
     GET: 내가 좋아요(추천)한 게시글 목록
     """
@@ -325,7 +328,7 @@ class LikedPostsView(generics.ListAPIView):
     def get_queryset(self):
         return Post.objects.filter(likes__user=self.request.user).prefetch_related("likes", "comments")
 
-class ScrappedPostsView(generics.ListAPIView):
+class ScrappedPostsView(ReplicaReadMixin, generics.ListAPIView):
     """
     GET: 내가 스크랩한 게시글 목록
     """
@@ -354,7 +357,7 @@ class ContactUsListView(generics.ListAPIView):
     permission_classes = [permissions.IsAdminUser]
     queryset = ContactUs.objects.all().order_by("-created_at")
 
-class MyPostsView(generics.ListAPIView):
+class MyPostsView(ReplicaReadMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = PostSerializer
     pagination_class = PostCursorPagination
@@ -363,7 +366,7 @@ class MyPostsView(generics.ListAPIView):
         return Post.objects.filter(author=self.request.user).prefetch_related('likes', 'comments', 'board')
 
 
-class MyCommentsView(generics.ListAPIView):
+class MyCommentsView(ReplicaReadMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = PostCursorPagination
     serializer_class = MyCommentSerializer
@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from core.db import connect_signals
+        from core.metrics import install_query_recorder
+
+        connect_signals()
+        connection_created.connect(install_query_recorder, dispatch_uid="core.metrics.install_query_recorder")
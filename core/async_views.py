@@ -0,0 +1,87 @@
+import asyncio
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+from rest_framework.exceptions import APIException, ParseError
+
+from .uploads import discard_uploads, prefetch_uploads, reset_prefetched_uploads, use_prefetched_uploads
+
+# 파일 업로드를 미리 처리하는 요청 메서드
+UPLOAD_METHODS = ("POST", "PUT", "PATCH")
+
+
+class AsyncUploadMixin:
+    """
+    - 업로드가 많은 APIView 용 비동기(ASGI) 실행 경로
+    - 인증/권한 확인 후 upload_fields 의 파일을 이벤트 루프에서 동시에 업로드하고,
+      기존 동기 뷰 코드는 sync_to_async 로 실행 (ORM 작업은 그대로)
+    - 뷰 안의 upload_files() 는 미리 올린 결과를 재사용 → 업로드 대기 중 워커/스레드를 점유하지 않음
+    - 뷰가 쓰지 않은 업로드(검증 실패 등)는 응답 후 삭제
+    - 스로틀은 업로드 전에 확인 (제한된 요청은 업로드 없이 동기 뷰가 429 응답)
+    - upload_fields: {multipart 필드 이름: UploadPolicy}
+    """
+    upload_fields = {}
+
+    def check_throttles(self, request):
+        # 업로드 전에 이미 통과한 요청은 다시 계산하지 않음 (토큰을 두 번 쓰지 않도록)
+        if getattr(request._request, "_upload_throttles_passed", False):
+            return
+        super().check_throttles(request)
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        sync_view = sync_to_async(view)
+
+        async def async_view(request, *args, **kwargs):
+            files = None
+            # 파일은 multipart 본문에만 있음 (JSON 등 다른 본문은 미리 읽지 않고 뷰의 파서가 그대로 처리)
+            if request.method in UPLOAD_METHODS and request.content_type == "multipart/form-data":
+                files = await sync_to_async(cls._uploadable_files)(request, args, kwargs, initkwargs)
+            if not files:
+                return await sync_view(request, *args, **kwargs)
+
+            prefetched = {}
+            for field, policy in cls.upload_fields.items():
+                prefetched.update(await prefetch_uploads(files.getlist(field), policy))
+
+            token = use_prefetched_uploads(prefetched)
+            try:
+                return await sync_view(request, *args, **kwargs)
+            finally:
+                reset_prefetched_uploads(token)
+                if prefetched:
+                    await asyncio.to_thread(discard_uploads, [result for _, result in prefetched.values()])
+
+        async_view.cls = view.cls
+        async_view.initkwargs = view.initkwargs
+        async_view.csrf_exempt = True
+        return markcoroutinefunction(async_view)
+
+    @classmethod
+    def _uploadable_files(cls, request, args, kwargs, initkwargs):
+        """
+        - 인증/권한/스로틀을 통과한 요청의 업로드 파일 (MultiValueDict), 아니면 None
+        - 실패 응답은 동기 뷰가 그대로 처리, 통과한 스로틀은 원래 요청에 표시해 동기 뷰에서 다시 계산하지 않음
+        - 본문은 DRF 파서로 읽음 (Django 는 POST 외에는 request.FILES 를 채우지 않음)
+          → 파싱 결과가 원래 요청(_post/_files)에 남아 뷰의 DRF Request 가 같은 파일 객체를 사용
+        """
+        self = cls(**initkwargs)
+        self.args, self.kwargs = args, kwargs
+        drf_request = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        try:
+            self.perform_authentication(drf_request)
+            self.check_permissions(drf_request)
+            self.check_throttles(drf_request)
+        except APIException:
+            return None
+        request._upload_throttles_passed = True
+
+        try:
+            return drf_request.FILES
+        except ParseError:
+            # 본문을 이미 읽었으므로 뷰에는 빈 요청으로 전달 (필수 필드 검증 에러로 응답)
+            request._post, request._files = QueryDict(), MultiValueDict()
+            return None
@@ -0,0 +1,36 @@
+from typing import NamedTuple
+
+# bulk_create 한 번에 INSERT 하는 행 수
+BULK_LOAD_BATCH_SIZE = 1000
+
+
+class BulkLoadResult(NamedTuple):
+    """
+    - inserted: 새로 넣은 행 수
+    - skipped: 이미 있거나 입력 안에서 중복이라 건너뛴 행 수
+    """
+    inserted: int
+    skipped: int
+
+
+def bulk_load(model, rows, key_fields, batch_size=BULK_LOAD_BATCH_SIZE):
+    """
+    - rows(필드 dict 목록)를 key_fields 기준으로 기존 행과 비교해 없는 것만 bulk_create
+    - 기존 키는 첫 번째 키 필드의 IN 조회 한 번으로 가져옴 (행마다 get_or_create 하지 않음)
+    - 동시에 다른 곳에서 넣은 행과 겹치면 ignore_conflicts 로 무시
+    """
+    key_fields = tuple(key_fields)
+    rows_by_key = {}
+    total = 0
+    for row in rows:
+        total += 1
+        rows_by_key.setdefault(tuple(row[field] for field in key_fields), row)
+
+    first_values = {key[0] for key in rows_by_key}
+    existing = set(
+        model.objects.filter(**{f"{key_fields[0]}__in": first_values}).values_list(*key_fields)
+    ) if first_values else set()
+
+    new_objects = [model(**row) for key, row in rows_by_key.items() if key not in existing]
+    model.objects.bulk_create(new_objects, batch_size=batch_size, ignore_conflicts=True)
+    return BulkLoadResult(inserted=len(new_objects), skipped=total - len(new_objects))
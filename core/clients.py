@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+
+from django.conf import settings
+
+# FCM HTTP v1 API 용 OAuth 범위
+FIREBASE_SCOPES = ["https://www.googleapis.com/auth/firebase.messaging"]
+
+
+class ClientRegistry:
+    """
+    - 외부 서비스 클라이언트(Firebase, boto3, Supabase)를 처음 사용할 때 만들어 프로세스 안에서 재사용
+    - import/설정 로딩 시점에는 네트워크 호출 없음 → manage.py 명령, 워커 부팅이 빨라짐
+    - fork 후 자식 프로세스에서는 부모가 만든 클라이언트(소켓/스레드/잠금)를 버리고 다시 만듦
+    - 생성에 실패하면 저장하지 않으므로 다음 호출에서 다시 시도
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._reset()
+
+    def _reset(self):
+        self._clients = {}
+        self._locks = {}
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def register(self, name):
+        """
+        - 데코레이터: @registry.register("이름") 으로 생성 함수 등록
+        """
+        def decorator(factory):
+            self._factories[name] = factory
+            return factory
+        return decorator
+
+    def get(self, name):
+        if self._pid != os.getpid():
+            self._reset()
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        # 생성 함수가 다른 클라이언트를 가져올 수 있도록 재진입 가능한 잠금
+        with self._lock:
+            client = self._clients.get(name)
+            if client is None:
+                client = self._factories[name]()
+                self._clients[name] = client
+            return client
+
+    def lock(self, name):
+        """
+        - 클라이언트를 쓰는 코드용 이름별 잠금 (클라이언트와 함께 fork 후 새로 만듦)
+        """
+        if self._pid != os.getpid():
+            self._reset()
+        with self._lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def created(self):
+        return sorted(self._clients)
+
+
+registry = ClientRegistry()
+# fork 직후 자식에서 바로 초기화 (부모 스레드가 잡고 있던 잠금을 물려받지 않도록)
+os.register_at_fork(after_in_child=registry._reset)
+
+
+def get_client(name):
+    return registry.get(name)
+
+
+@registry.register("secretsmanager")
+def _secretsmanager():
+    import boto3
+
+    return boto3.client("secretsmanager", region_name=settings.AWS_REGION)
+
+
+@registry.register("firebase_credentials_info")
+def _firebase_credentials_info():
+    """
+    - Firebase 서비스 계정 JSON(dict): 로컬 파일 → 없거나 실패하면 Secrets Manager
+    """
+    if os.path.exists(settings.FIREBASE_PATH):
+        try:
+            with open(settings.FIREBASE_PATH, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[WARNING] Firebase 자격 증명 파일 읽기 실패: {e}")
+
+    response = get_client("secretsmanager").get_secret_value(SecretId=settings.FIREBASE_SECRET)
+    return json.loads(response["SecretString"])
+
+
+@registry.register("firebase_app")
+def _firebase_app():
+    """
+    - firebase_admin 기본 앱 (fcm_django 등 firebase_admin 을 쓰는 코드용)
+    - fcm_django 관리자 액션 실행 전에 생성 (apps/notification/admin.py)
+    """
+    import firebase_admin
+    from firebase_admin import credentials
+
+    try:
+        return firebase_admin.get_app()
+    except ValueError:
+        cred = credentials.Certificate(get_client("firebase_credentials_info"))
+        return firebase_admin.initialize_app(cred)
+
+
+@registry.register("fcm_credentials")
+def _fcm_credentials():
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_info(
+        get_client("firebase_credentials_info"),
+        scopes=FIREBASE_SCOPES,
+    )
+
+
+@registry.register("supabase")
+def _supabase():
+    from supabase import create_client
+
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_PUBLIC_KEY)
+
+
+def get_fcm_access_token():
+    """
+    - FCM HTTP v1 API 용 OAuth 액세스 토큰
+    - 자격 증명은 프로세스에서 재사용하고, 토큰은 만료(임박) 시에만 갱신 → 푸시마다 Secrets Manager/토큰 발급 호출 없음
+    """
+    from google.auth.transport.requests import Request
+
+    credentials = get_client("fcm_credentials")
+    with registry.lock("fcm_token"):
+        if not credentials.valid:
+            credentials.refresh(Request())
+        return credentials.token
@@ -0,0 +1,104 @@
+import re
+
+import brotli
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import sync_and_async_middleware
+from django.utils.text import compress_string
+
+# 압축할 응답 Content-Type (이미지 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_CONTENT_TYPES = ("application/json", "text/")
+
+_accept_encoding_re = re.compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*")
+
+
+def accepted_encodings(header):
+    """
+    - Accept-Encoding 헤더 → {인코딩 이름(소문자): q 값}
+    """
+    encodings = {}
+    for part in header.split(","):
+        match = _accept_encoding_re.fullmatch(part)
+        if not match:
+            continue
+        try:
+            encodings[match.group(1).lower()] = float(match.group(2) or 1)
+        except ValueError:
+            continue
+    return encodings
+
+
+def choose_encoding(header):
+    """
+    - 클라이언트가 받는(q > 0) 인코딩 중 br → gzip 순서로 선택, 없으면 None
+    - 명시되지 않은 인코딩은 "*" 의 q 값을 따름
+    """
+    encodings = accepted_encodings(header)
+    for coding in ("br", "gzip"):
+        if encodings.get(coding, encodings.get("*", 0)) > 0:
+            return coding
+    return None
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        # 응답마다 압축하므로 최고 압축률(11) 대신 빠른 품질 사용
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return compress_string(content)
+
+
+@sync_and_async_middleware
+class CompressionMiddleware:
+    """
+    - COMPRESSION_MIN_SIZE 바이트 이상인 JSON/텍스트 응답을 Accept-Encoding 에 따라 brotli 또는 gzip 으로 압축
+    - 스트리밍 응답(파일 등)과 이미 인코딩된 응답(whitenoise 정적 파일)은 그대로 둠
+    - 압축해도 작아지지 않으면 원본 유지
+    - ASGI/WSGI 모두 지원 (빠른 품질이라 응답 하나 압축은 이벤트 루프에서 바로 처리)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if not self._is_compressible(response):
+            return response
+        # 압축 여부가 Accept-Encoding 에 따라 달라지므로 캐시가 구분하도록 (압축하지 않는 경우에도)
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        compressed = compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+        # 본문 바이트가 바뀌므로 강한 ETag 는 약한 ETag 로 (GZipMiddleware 와 같은 처리)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+    @staticmethod
+    def _is_compressible(response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return False
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return False
+        content_type = response.get("Content-Type", "")
+        return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
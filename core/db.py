@@ -0,0 +1,91 @@
+import threading
+import time
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# 연결 방식 (settings.DB_CONNECTION_PROFILE)
+# - pool: Django 5.1 psycopg(3) 연결 풀 (CONN_MAX_AGE 는 0 이어야 함, 기본값)
+# - persistent: 워커(스레드)마다 연결 유지 (CONN_MAX_AGE) + 요청 시작 시 상태 확인 (WSGI 용)
+# - pgbouncer: PgBouncer/Supavisor 트랜잭션 모드 (서버 측 커서 사용 안 함, 연결 유지)
+DB_CONNECTION_PROFILES = ("pool", "persistent", "pgbouncer")
+
+
+def database_settings(profile, base, conn_max_age=60, pool_min_size=2, pool_max_size=10, pool_timeout=10):
+    """
+    - base(ENGINE/NAME/USER/... 공통 값)에 연결 방식별 설정을 더한 DATABASES 항목 반환
+    - settings.py 에서 호출되므로 설정/모델에 접근하지 않음
+    """
+    if profile not in DB_CONNECTION_PROFILES:
+        raise ValueError(f"Unknown DB_CONNECTION_PROFILE: {profile} (choices: {', '.join(DB_CONNECTION_PROFILES)})")
+
+    config = dict(base)
+    options = dict(config.get("OPTIONS", {}))
+    config["CONN_HEALTH_CHECKS"] = True
+
+    if profile == "pool":
+        # 풀이 연결 수명을 관리 → Django 쪽 연결 유지는 끔
+        # 풀에서 꺼낼 때의 상태 확인은 CONN_HEALTH_CHECKS 로 Django 가 check_connection 을 넘김
+        # (OPTIONS["pool"] 에 check 를 함께 주면 ConnectionPool 생성 시 인자 중복 TypeError)
+        config["CONN_MAX_AGE"] = 0
+        options["pool"] = {
+            "min_size": pool_min_size,
+            "max_size": pool_max_size,
+            "timeout": pool_timeout,
+        }
+    elif profile == "pgbouncer":
+        # 트랜잭션 모드에서는 트랜잭션마다 서버 연결이 바뀜 → 서버 측 커서(이름 있는 커서) 사용 불가
+        config["CONN_MAX_AGE"] = conn_max_age
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+    else:
+        config["CONN_MAX_AGE"] = conn_max_age
+
+    config["OPTIONS"] = options
+    return config
+
+
+_stats_lock = threading.Lock()
+_stats = {"connections_created": 0, "started_at": time.time()}
+
+
+def _count_connection(sender, connection, **kwargs):
+    with _stats_lock:
+        _stats["connections_created"] += 1
+
+
+def connect_signals():
+    # CoreConfig.ready() 에서 호출 (settings.py 가 이 모듈을 import 할 때는 연결하지 않음)
+    connection_created.connect(_count_connection, dispatch_uid="core.db.count_connection")
+
+
+def get_connection_stats(alias="default"):
+    """
+    - 이 프로세스의 DB 연결 지표
+    - connections_created: Django 가 연결을 연 횟수 (연결 유지가 잘 동작하면 거의 늘지 않음)
+    - connections_per_minute: 프로세스 시작 이후 분당 연결 횟수 (연결 교체율)
+    - pool 사용 시에는 위 값이 풀에서 꺼낸 횟수이고, 실제 새 연결 수는 pool_connections_opened
+      (pool_wait_ms: 풀에서 연결을 기다린 누적 시간)
+    """
+    with _stats_lock:
+        created = _stats["connections_created"]
+        uptime = time.time() - _stats["started_at"]
+
+    stats = {
+        "connections_created": created,
+        "connections_per_minute": created / (uptime / 60) if uptime > 0 else 0.0,
+    }
+
+    pool = getattr(connections[alias], "pool", None)
+    if pool is not None:
+        pool_stats = pool.get_stats()
+        stats.update({
+            "pool_size": pool_stats.get("pool_size", 0),
+            "pool_available": pool_stats.get("pool_available", 0),
+            "pool_connections_opened": pool_stats.get("connections_num", 0),
+            "pool_requests": pool_stats.get("requests_num", 0),
+            "pool_requests_waiting": pool_stats.get("requests_waiting", 0),
+            "pool_wait_ms": pool_stats.get("requests_wait_ms", 0),
+            "pool_connections_lost": pool_stats.get("connections_lost", 0),
+            "pool_connections_errors": pool_stats.get("connections_errors", 0),
+        })
+    return stats
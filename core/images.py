@@ -0,0 +1,200 @@
+import posixpath
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from .storage import get_image_storage
+
+# 렌디션 이름 → 긴 변 최대 픽셀 (원본보다 크게 늘리지 않음)
+RENDITION_SIZES = {
+    "full": 2048,
+    "feed": 1080,
+    "thumbnail": 320,
+}
+RENDITION_NAMES = tuple(RENDITION_SIZES)
+WEBP_QUALITY = 80
+RENDITION_PREFIX = "renditions"
+
+# 원본 재인코딩: 메타데이터를 지우고 full 렌디션 크기로 줄여 같은 경로에 덮어씀 (URL 유지)
+# 형식 → (content-type, 저장 옵션)
+ORIGINAL_FORMATS = {
+    "JPEG": ("image/jpeg", {"quality": 85, "optimize": True}),
+    "PNG": ("image/png", {"optimize": True}),
+    "WEBP": ("image/webp", {"quality": WEBP_QUALITY, "method": 4}),
+}
+
+
+def _decode(source):
+    """
+    - 이미지를 디코딩해서 (원본 형식, 메타데이터 여부, ICC 프로필, 회전 반영된 RGB/RGBA 이미지) 반환
+    - source: bytes 또는 파일 경로, 애니메이션 이미지(GIF 등)는 None
+    """
+    with Image.open(BytesIO(source) if isinstance(source, bytes) else source) as img:
+        if getattr(img, "is_animated", False):
+            return None
+
+        original_format = img.format
+        has_metadata = bool(img.getexif()) or any(key in img.info for key in ("exif", "xmp", "XML:com.adobe.xmp"))
+        icc_profile = img.info.get("icc_profile")
+        largest = max(RENDITION_SIZES.values())
+        # JPEG 은 디코딩 단계에서 바로 축소 (큰 사진의 디코딩 비용/메모리 절감)
+        img.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(img)
+
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    return original_format, has_metadata, icc_profile, image.convert("RGBA" if has_alpha else "RGB")
+
+
+def _needs_cleaning(original_format, has_metadata, image):
+    return original_format in ORIGINAL_FORMATS and (has_metadata or max(image.size) > max(RENDITION_SIZES.values()))
+
+
+def clean_original(source):
+    """
+    - 업로드 전 원본 정리: 메타데이터(EXIF/GPS/XMP 등)가 있거나 full 크기보다 크면 같은 형식으로 재인코딩
+    - source: bytes 또는 파일 경로
+    - 반환: (content-type, bytes), 정리할 필요가 없으면 None (애니메이션/GIF 포함)
+    """
+    decoded = _decode(source)
+    if decoded is None:
+        return None
+    original_format, has_metadata, icc_profile, image = decoded
+    if not _needs_cleaning(original_format, has_metadata, image):
+        return None
+    return _encode_original(image, original_format, max(RENDITION_SIZES.values()), icc_profile)
+
+
+def build_renditions(data):
+    """
+    - 원본 이미지를 한 번만 디코딩해서 WebP 렌디션과 정리된 원본 생성
+    - EXIF 회전 반영 후 메타데이터(EXIF/GPS/XMP 등)는 저장하지 않음
+    - 큰 렌디션을 다음 렌디션의 소스로 재사용 (원본 재디코딩/재리사이즈 없음)
+    - 반환: (원본, [(렌디션 이름 목록, WebP bytes), ...])
+      - 원본: (content-type, bytes) — 메타데이터가 있거나 full 크기보다 크면 재인코딩, 아니면 None
+        (업로드 시 clean_original() 로 정리되므로 보통 None, 이전에 올라간 원본용)
+      - 원본이 작아 크기가 같은 렌디션은 한 파일을 공유
+    - 애니메이션 이미지(GIF 등)는 변환하지 않음 → (None, [])
+    """
+    decoded = _decode(data)
+    if decoded is None:
+        return None, []
+    original_format, has_metadata, icc_profile, source = decoded
+
+    original = None
+    if _needs_cleaning(original_format, has_metadata, source):
+        original = _encode_original(source, original_format, max(RENDITION_SIZES.values()), icc_profile)
+
+    groups = []
+    for name, size in RENDITION_SIZES.items():
+        if groups and max(source.size) <= size:
+            # 이전(더 큰) 렌디션과 같은 크기 → 같은 파일 사용
+            groups[-1][0].append(name)
+            continue
+
+        resized = source.copy()
+        resized.thumbnail((size, size), Image.LANCZOS)
+
+        buffer = BytesIO()
+        resized.save(buffer, "WEBP", quality=WEBP_QUALITY, method=4)
+        groups.append(([name], buffer.getvalue()))
+        source = resized
+
+    return original, groups
+
+
+def _encode_original(source, original_format, max_size, icc_profile):
+    """
+    - 원본과 같은 형식으로 다시 저장 (긴 변 max_size 이하, ICC 색 프로필만 유지)
+    """
+    content_type, save_options = ORIGINAL_FORMATS[original_format]
+    image = source.copy()
+    image.thumbnail((max_size, max_size), Image.LANCZOS)
+    if original_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+    if icc_profile:
+        save_options = {**save_options, "icc_profile": icc_profile}
+
+    buffer = BytesIO()
+    image.save(buffer, original_format, **save_options)
+    return content_type, buffer.getvalue()
+
+
+def rendition_path(source_path, name):
+    """
+    - 원본 경로 기준으로 결정되는 렌디션 경로 (재시도해도 같은 경로에 덮어씀)
+    - 한 폴더에 평평하게 저장 (버킷 목록 조회가 폴더 단위라 정리 작업 시 호출 수 절약)
+    - 예) "uuid.jpg" → "renditions/uuid_feed.webp"
+    """
+    stem = posixpath.splitext(source_path)[0]
+    return f"{RENDITION_PREFIX}/{stem}_{name}.webp"
+
+
+def generate_image_renditions(image_url):
+    """
+    - 저장소에 올라간 원본 이미지의 렌디션을 만들어 저장
+    - 정리되지 않은 원본(업로드 시 정리 이전에 올라간 이미지)은 렌디션 저장 후 메타데이터를 지운 버전으로
+      같은 경로에 덮어씀 (URL/DB 값 그대로) → 다시 실행해도 메타데이터가 없고 크기가 작아 원본은 재인코딩하지 않음
+    - 반환: {"full": url, "feed": url, "thumbnail": url}
+      (변환하지 않는 이미지는 {}, 이 저장소의 URL이 아니면 None)
+    """
+    storage = get_image_storage()
+    source_path = storage.path_from_url(image_url)
+    if not source_path:
+        return None
+
+    original, groups = build_renditions(storage.read(source_path))
+    urls = {}
+    for names, data in groups:
+        url = storage.save(rendition_path(source_path, names[0]), data, "image/webp")
+        for name in names:
+            urls[name] = url
+    if original is not None:
+        content_type, data = original
+        storage.save(source_path, data, content_type)
+    return urls
+
+
+def generate_renditions_for_urls(image_urls):
+    """
+    - 여러 원본 URL의 렌디션 생성, {원본 URL: 렌디션 dict}
+    - 한 장이 실패해도 나머지는 계속 처리
+    """
+    renditions = {}
+    for url in image_urls:
+        try:
+            result = generate_image_renditions(url)
+        except Exception as e:
+            print(f"[WARNING] 이미지 렌디션 생성 실패 ({url}): {e}")
+            continue
+        if result is not None:
+            renditions[url] = result
+    return renditions
+
+
+def rendition_urls(image_urls, renditions):
+    """
+    - 주어진 원본 이미지들의 렌디션 URL 목록 (같은 파일을 공유하는 사이즈는 한 번만)
+    """
+    renditions = renditions or {}
+    urls = []
+    for image_url in image_urls:
+        for url in (renditions.get(image_url) or {}).values():
+            if url not in urls:
+                urls.append(url)
+    return urls
+
+
+def serialize_renditions(image_urls, renditions):
+    """
+    - API 응답용: 원본 순서대로 사이즈별 URL 목록
+    - 아직 생성 전이거나 변환하지 않는 이미지는 원본 URL로 대체
+    """
+    renditions = renditions or {}
+    items = []
+    for url in image_urls or []:
+        sizes = renditions.get(url) or {}
+        item = {"original": url}
+        for name in RENDITION_NAMES:
+            item[name] = sizes.get(name, url)
+        items.append(item)
+    return items
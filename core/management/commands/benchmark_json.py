@@ -0,0 +1,100 @@
+import gzip
+import json
+import statistics
+import time
+
+import brotli
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.board.models import Post
+from apps.board.views import PostDetailView, PostListView
+from apps.meetup.views import MeetingListView
+from core.compression import compress
+from core.renderers import ORJSONRenderer
+
+
+def _mean_ms(func, iterations):
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return statistics.mean(durations) * 1000
+
+
+class Command(BaseCommand):
+    help = "응답 JSON 직렬화 시간(JSONRenderer vs ORJSONRenderer)과 압축별 전송 크기 측정 (게시글 목록/상세, 모임 목록)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", help="인증 사용자 이메일 (기본: 첫 번째 활성 사용자)")
+        parser.add_argument("--iterations", type=int, default=200, help="측정 반복 횟수")
+
+    def handle(self, *args, **options):
+        user = (
+            User.objects.filter(email=options["email"]).first() if options["email"]
+            else User.objects.filter(is_active=True).order_by("id").first()
+        )
+        if user is None:
+            raise CommandError("No user to authenticate as.")
+
+        for label, data in self._payloads(user):
+            self._report(label, data, options["iterations"])
+
+    def _payloads(self, user):
+        """
+        - 뷰를 직접 호출해 렌더링 전 응답 데이터(response.data)를 얻음 (미들웨어/네트워크 제외)
+        """
+        factory = APIRequestFactory()
+
+        def call(view, path, **kwargs):
+            request = factory.get(path)
+            force_authenticate(request, user=user)
+            response = view.as_view()(request, **kwargs)
+            if response.status_code != 200:
+                raise CommandError(f"{path} returned {response.status_code}")
+            return response.data
+
+        yield "PostListView", call(PostListView, "/board/posts/")
+        post = Post.objects.order_by("-id").first()
+        if post is not None:
+            yield "PostDetailView", call(
+                PostDetailView, f"/board/{post.board_id}/posts/{post.id}/",
+                board_id=post.board_id, post_id=post.id,
+            )
+        else:
+            self.stdout.write("[PostDetailView] skipped (no posts)")
+        yield "MeetingListView", call(MeetingListView, "/meetup/")
+
+    def _report(self, label, data, iterations):
+        stdlib = JSONRenderer()
+        fast = ORJSONRenderer()
+        body = fast.render(data)
+        # 같은 데이터면 두 렌더러 출력이 같아야 함 (형식 호환성 확인)
+        if json.loads(stdlib.render(data)) != json.loads(body):
+            self.stderr.write(f"[{label}] WARNING: renderer outputs differ")
+
+        json_ms = _mean_ms(lambda: stdlib.render(data), iterations)
+        orjson_ms = _mean_ms(lambda: fast.render(data), iterations)
+        self.stdout.write(
+            f"[{label}] render json={json_ms:.3f}ms orjson={orjson_ms:.3f}ms "
+            f"({json_ms / orjson_ms if orjson_ms else 0:.1f}x)"
+        )
+
+        # 전송 크기: 원본 / gzip(CompressionMiddleware 와 같은 설정) / brotli(설정 품질, 참고로 최고 품질)
+        variants = [
+            ("identity", lambda: body),
+            ("gzip", lambda: compress(body, "gzip")),
+            (f"br(q={settings.COMPRESSION_BROTLI_QUALITY})", lambda: compress(body, "br")),
+            ("br(q=11)", lambda: brotli.compress(body, quality=11)),
+            ("gzip(level=9)", lambda: gzip.compress(body, compresslevel=9, mtime=0)),
+        ]
+        for name, func in variants:
+            size = len(func())
+            cost = _mean_ms(func, iterations) if name != "identity" else 0.0
+            self.stdout.write(
+                f"    {name:<14} {size:>9,} bytes ({size / len(body) * 100:5.1f}%) compress={cost:.3f}ms"
+            )
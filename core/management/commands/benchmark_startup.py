@@ -0,0 +1,59 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# (이름, 실행할 명령) — 각각 새 프로세스로 실행해 import/초기화 비용을 그대로 측정
+STARTUP_TARGETS = {
+    "check": ["manage.py", "check"],
+    # 웹 워커 부팅: ASGI 앱 로딩(django.setup + 미들웨어) + URLconf 로딩
+    "web": [
+        "-c",
+        "import kickit.asgi; from django.urls import get_resolver; get_resolver().url_patterns",
+    ],
+    # Celery 워커 부팅: 앱 설정 + 태스크 모듈 import
+    "celery": [
+        "-c",
+        "from kickit.celery import app; app.loader.import_default_modules(); app.finalize()",
+    ],
+}
+
+
+class Command(BaseCommand):
+    help = "프로세스 시작 시간 측정 (manage.py check / 웹 워커 부팅 / Celery 워커 부팅)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="대상별 실행 횟수")
+        parser.add_argument(
+            "--targets", default=",".join(STARTUP_TARGETS),
+            help=f"쉼표로 구분 ({', '.join(STARTUP_TARGETS)})",
+        )
+
+    def handle(self, *args, **options):
+        targets = [name.strip() for name in options["targets"].split(",") if name.strip()]
+        unknown = set(targets) - set(STARTUP_TARGETS)
+        if unknown:
+            raise CommandError(f"Unknown targets: {', '.join(sorted(unknown))}")
+
+        env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        for name in targets:
+            durations = []
+            for _ in range(options["runs"]):
+                started = time.perf_counter()
+                result = subprocess.run(
+                    [sys.executable, *STARTUP_TARGETS[name]],
+                    cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+                )
+                durations.append(time.perf_counter() - started)
+                if result.returncode != 0:
+                    raise CommandError(f"{name} failed:\n{result.stderr[-2000:]}")
+
+            self.stdout.write(
+                f"[{name}] min={min(durations) * 1000:.0f}ms "
+                f"mean={statistics.mean(durations) * 1000:.0f}ms "
+                f"max={max(durations) * 1000:.0f}ms (runs={len(durations)})"
+            )
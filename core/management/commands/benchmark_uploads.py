@@ -0,0 +1,100 @@
+import asyncio
+import io
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image
+
+
+def _sample_image(size):
+    """
+    - 벤치마크용 PNG 바이트 (size x size, 무작위에 가까운 픽셀 → 압축으로 너무 작아지지 않게)
+    """
+    image = Image.frombytes("RGB", (size, size), bytes((i * 7919) % 256 for i in range(size * size * 3)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class Command(BaseCommand):
+    help = (
+        "업로드 엔드포인트 동시 처리량 측정 "
+        "(같은 요청을 동기(kickit.wsgi)/비동기(kickit.asgi + UvicornWorker) 배포에 각각 실행해 비교)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", required=True, help="업로드 엔드포인트 전체 URL (예: https://.../board/1/posts/)")
+        parser.add_argument("--token", default="", help="Access 토큰 (Authorization: Bearer)")
+        parser.add_argument("--method", default="POST", choices=["POST", "PUT", "PATCH"])
+        parser.add_argument("--field", default="images", help="파일 필드 이름")
+        parser.add_argument("--data", action="append", default=[], help="추가 폼 필드 key=value (여러 번 지정 가능)")
+        parser.add_argument("--files-per-request", type=int, default=3)
+        parser.add_argument("--image-size", type=int, default=512, help="이미지 한 변 픽셀 수")
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--timeout", type=float, default=60.0)
+
+    def handle(self, *args, **options):
+        try:
+            data = dict(item.split("=", 1) for item in options["data"])
+        except ValueError:
+            raise CommandError("--data 는 key=value 형식이어야 합니다.")
+
+        image = _sample_image(options["image_size"])
+        self.stdout.write(
+            f"{options['method']} {options['url']} "
+            f"requests={options['requests']} concurrency={options['concurrency']} "
+            f"files/request={options['files_per_request']} image={len(image) // 1024}KB"
+        )
+
+        latencies, statuses, elapsed = asyncio.run(self._run(options, data, image))
+
+        ok = sum(1 for code in statuses if 200 <= code < 300)
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        self.stdout.write(
+            f"elapsed={elapsed:.2f}s throughput={len(latencies) / elapsed:.1f} req/s "
+            f"uploads={ok * options['files_per_request'] / elapsed:.1f} files/s"
+        )
+        self.stdout.write(
+            f"latency p50={quantiles[49] * 1000:.0f}ms p95={quantiles[94] * 1000:.0f}ms "
+            f"max={max(latencies) * 1000:.0f}ms"
+        )
+        summary = f"2xx={ok} other={len(statuses) - ok}"
+        if ok == len(statuses):
+            self.stdout.write(self.style.SUCCESS(summary))
+        else:
+            self.stdout.write(self.style.WARNING(summary))
+
+    async def _run(self, options, data, image):
+        headers = {"Authorization": f"Bearer {options['token']}"} if options["token"] else {}
+        files = [
+            (options["field"], (f"bench-{index}.png", image, "image/png"))
+            for index in range(options["files_per_request"])
+        ]
+        queue = asyncio.Queue()
+        for _ in range(options["requests"]):
+            queue.put_nowait(None)
+
+        latencies, statuses = [], []
+        limits = httpx.Limits(max_connections=options["concurrency"])
+        async with httpx.AsyncClient(headers=headers, timeout=options["timeout"], limits=limits) as client:
+
+            async def worker():
+                while not queue.empty():
+                    queue.get_nowait()
+                    started = time.perf_counter()
+                    try:
+                        response = await client.request(options["method"], options["url"], data=data, files=files)
+                        statuses.append(response.status_code)
+                    except httpx.HTTPError as e:
+                        print(f"[WARNING] 요청 실패: {e}")
+                        statuses.append(0)
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(options["concurrency"])))
+            elapsed = time.perf_counter() - started
+
+        return latencies, statuses, elapsed
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.tasks import find_orphan_images, delete_storage_objects
+
+
+class Command(BaseCommand):
+    help = "DB에서 참조하지 않는 업로드 이미지(유예 기간 경과분)를 저장소에서 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+
+    def handle(self, *args, **options):
+        orphans = find_orphan_images()
+        for path in orphans:
+            self.stdout.write(path)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{len(orphans)} orphan objects found (dry run)."))
+            return
+
+        delete_storage_objects(orphans)
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(orphans)} orphan objects deleted."))
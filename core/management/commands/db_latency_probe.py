@@ -0,0 +1,96 @@
+import copy
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from core.db import get_connection_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "요청 단위 DB 지연 측정: 매 요청 새로 연결(이전 방식) vs 현재 설정(DB_CONNECTION_PROFILE)의 "
+        "연결 유지/풀을 같은 쿼리로 비교"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--requests", type=int, default=100, help="모드별 요청 수")
+        parser.add_argument("--queries", type=int, default=3, help="요청당 쿼리 수")
+        parser.add_argument("--sql", default="SELECT 1")
+        parser.add_argument(
+            "--mode", choices=["both", "fresh", "configured"], default="both",
+            help="fresh: 요청마다 연결을 닫음 (CONN_MAX_AGE=0, 풀 없음) / configured: 현재 설정",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        settings_dict = connection.settings_dict
+        self.stdout.write(
+            f"database={options['database']} host={settings_dict.get('HOST')} "
+            f"CONN_MAX_AGE={settings_dict.get('CONN_MAX_AGE')} "
+            f"pool={'on' if settings_dict.get('OPTIONS', {}).get('pool') else 'off'} "
+            f"requests={options['requests']} queries/request={options['queries']}"
+        )
+
+        modes = ["fresh", "configured"] if options["mode"] == "both" else [options["mode"]]
+        results = {}
+        for mode in modes:
+            if mode == "fresh":
+                results[mode] = self._run_fresh(options)
+            else:
+                results[mode] = self._run(connection, options)
+            self._report(mode, *results[mode])
+
+        if len(results) == 2:
+            fresh, configured = (statistics.median(results[mode][0]) for mode in modes)
+            if configured:
+                self.stdout.write(self.style.SUCCESS(f"p50 speedup: {fresh / configured:.1f}x"))
+
+        for name, value in get_connection_stats(options["database"]).items():
+            self.stdout.write(f"  {name}={value:.2f}" if isinstance(value, float) else f"  {name}={value}")
+
+    def _run_fresh(self, options):
+        """
+        - 이전 방식(요청마다 연결 1개를 새로 열고 닫음)을 임시 alias 로 재현
+        - 설정을 복사해 풀을 빼고 CONN_MAX_AGE=0 → 요청 끝의 close_old_connections() 가 연결을 닫음
+          (기존 alias 의 풀을 닫고 다시 만들면 min_size 개 연결 + 풀 스레드 생성 비용까지 더해짐)
+        """
+        alias = f"{options['database']}__fresh"
+        settings_dict = copy.deepcopy(connections[options["database"]].settings_dict)
+        settings_dict["CONN_MAX_AGE"] = 0
+        settings_dict["OPTIONS"].pop("pool", None)
+        connections.settings[alias] = settings_dict
+        try:
+            return self._run(connections[alias], options)
+        finally:
+            connections[alias].close()
+            del connections[alias]
+            del connections.settings[alias]
+
+    def _run(self, connection, options):
+        """
+        - Django 요청 처리와 같은 순서로 실행: 시작/끝에 close_old_connections() (request_started/finished)
+        """
+        created_before = get_connection_stats(options["database"])["connections_created"]
+        latencies = []
+        for _ in range(options["requests"]):
+            started = time.perf_counter()
+            close_old_connections()
+            with connection.cursor() as cursor:
+                for _ in range(options["queries"]):
+                    cursor.execute(options["sql"])
+                    cursor.fetchall()
+            close_old_connections()
+            latencies.append(time.perf_counter() - started)
+
+        created = get_connection_stats(options["database"])["connections_created"] - created_before
+        return latencies, created
+
+    def _report(self, mode, latencies, created):
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        self.stdout.write(
+            f"[{mode}] p50={quantiles[49] * 1000:.1f}ms p95={quantiles[94] * 1000:.1f}ms "
+            f"mean={statistics.mean(latencies) * 1000:.1f}ms connections_opened={created}"
+        )
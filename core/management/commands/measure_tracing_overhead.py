@@ -0,0 +1,79 @@
+import io
+import statistics
+import time
+from wsgiref.util import setup_testing_defaults
+
+import sentry_sdk
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from sentry_sdk.transport import Transport
+
+
+class _DiscardTransport(Transport):
+    """
+    - 이벤트를 전송하지 않고 버림 (네트워크 비용 없이 계측/직렬화 오버헤드만 측정)
+    """
+
+    def capture_envelope(self, envelope):
+        pass
+
+
+class Command(BaseCommand):
+    help = "Sentry 트레이스 샘플링 비율별 요청 지연 측정 (WSGI 앱에 직접 요청, 이벤트는 전송하지 않음)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/board/posts/", help="측정할 GET 경로 (쿼리스트링 포함 가능)")
+        parser.add_argument("--token", default="", help="Access 토큰 (Authorization: Bearer)")
+        parser.add_argument("--requests", type=int, default=200, help="비율별 요청 수")
+        parser.add_argument("--rates", default="0,0.05,0.25,1.0", help="쉼표로 구분한 샘플링 비율")
+        parser.add_argument("--policy", action="store_true", help="마지막에 traces_sampler(설정값) 도 측정")
+
+    def handle(self, *args, **options):
+        application = get_wsgi_application()
+        path, _, query = options["path"].partition("?")
+
+        levels = [(f"rate={rate}", {"traces_sample_rate": float(rate)}) for rate in options["rates"].split(",")]
+        if options["policy"]:
+            from core.tracing import traces_sampler
+
+            levels.append(("traces_sampler", {"traces_sampler": traces_sampler}))
+
+        baseline = None
+        for label, sampling in levels:
+            sentry_sdk.init(
+                dsn="https://public@sentry.invalid/1",
+                transport=_DiscardTransport,
+                send_default_pii=True,
+                **sampling,
+            )
+            self._request(application, path, query, options["token"])  # 준비 요청 (첫 연결/임포트 제외)
+            latencies = [
+                self._request(application, path, query, options["token"])
+                for _ in range(options["requests"])
+            ]
+            mean = statistics.mean(latencies)
+            quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            baseline = baseline if baseline is not None else mean
+            self.stdout.write(
+                f"[{label}] mean={mean * 1000:.2f}ms p50={quantiles[49] * 1000:.2f}ms "
+                f"p95={quantiles[94] * 1000:.2f}ms overhead={(mean / baseline - 1) * 100:+.1f}%"
+            )
+
+    def _request(self, application, path, query, token):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "wsgi.input": io.BytesIO(),
+        }
+        if token:
+            environ["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+        setup_testing_defaults(environ)
+
+        started = time.perf_counter()
+        body = application(environ, lambda status, headers, exc_info=None: None)
+        for _ in body:
+            pass
+        if hasattr(body, "close"):
+            body.close()
+        return time.perf_counter() - started
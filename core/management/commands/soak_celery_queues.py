@@ -0,0 +1,109 @@
+import statistics
+import time
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+
+from kickit.celery import QUEUE_DEFAULT, QUEUE_FANOUT, QUEUE_PUSH, WORKER_PROFILES, app
+
+
+# 측정 전용 태스크: 운영 태스크 모듈(autodiscover)에 두지 않고 이 명령을 import 한 프로세스에만 등록
+# (--external-workers 로 측정할 때는 워커를 `--include core.management.commands.soak_celery_queues` 로 실행)
+@app.task(name="core.soak_probe")
+def soak_probe(probe_id, sent_at, work_seconds=0.0):
+    """
+    - 등록→실행 시작까지 걸린 시간을 캐시에 기록, work_seconds 동안 작업을 흉내 냄
+    """
+    cache.set(f"soak:{probe_id}", time.time() - sent_at, 3600)
+    if work_seconds:
+        time.sleep(work_seconds)
+
+
+class Command(BaseCommand):
+    help = (
+        "대량 fan-out 중 푸시 큐 대기 시간 측정 (기본 큐 하나만 쓸 때와 비교: --single-queue). "
+        "CELERY_BROKER_URL=memory:// 또는 redis://, 지연 기록용 캐시는 워커와 공유되어야 함"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--probes", type=int, default=50, help="단계별 푸시 프로브 수")
+        parser.add_argument("--interval", type=float, default=0.05, help="프로브 간격(초)")
+        parser.add_argument("--fanout-tasks", type=int, default=200, help="fan-out 태스크 수")
+        parser.add_argument("--fanout-seconds", type=float, default=0.1, help="fan-out 태스크 하나의 작업 시간(초)")
+        parser.add_argument("--single-queue", action="store_true", help="모든 태스크를 기본 큐 하나로 (분리 전 구성)")
+        parser.add_argument(
+            "--external-workers", action="store_true",
+            help=(
+                "이미 실행 중인 워커 사용 (--include core.management.commands.soak_celery_queues 필요, "
+                "기본: 이 프로세스 안에서 큐별 워커 실행, memory:// 브로커용)"
+            ),
+        )
+        parser.add_argument("--timeout", type=float, default=120, help="단계별 최대 대기(초)")
+
+    def handle(self, *args, **options):
+        if settings.CELERY_BROKER_URL.startswith("sqs://"):
+            raise CommandError("Run against a local broker (CELERY_BROKER_URL=memory:// or redis://...).")
+        if app.conf.task_always_eager:
+            raise CommandError("CELERY_TASK_ALWAYS_EAGER is set; tasks would not go through the broker.")
+
+        push_queue = QUEUE_DEFAULT if options["single_queue"] else QUEUE_PUSH
+        fanout_queue = QUEUE_DEFAULT if options["single_queue"] else QUEUE_FANOUT
+
+        with ExitStack() as stack:
+            if not options["external_workers"]:
+                for queue in dict.fromkeys((push_queue, fanout_queue)):
+                    stack.enter_context(self._worker(queue))
+
+            baseline = self._measure(push_queue, options)
+            self._report("baseline", baseline)
+
+            started = time.time()
+            for _ in range(options["fanout_tasks"]):
+                soak_probe.apply_async((f"fanout-{uuid.uuid4()}", time.time(), options["fanout_seconds"]), queue=fanout_queue)
+            during = self._measure(push_queue, options)
+            self._report(f"during fan-out ({options['fanout_tasks']} x {options['fanout_seconds']}s on '{fanout_queue}')", during)
+            self.stdout.write(f"fan-out enqueue+probe phase took {time.time() - started:.1f}s")
+
+    def _worker(self, queue):
+        from celery.contrib.testing.worker import start_worker
+
+        profile = WORKER_PROFILES[queue]
+        app.conf.worker_prefetch_multiplier = profile["prefetch_multiplier"]
+        return start_worker(
+            app, pool="threads", concurrency=profile["concurrency"], queues=[queue],
+            perform_ping_check=False, loglevel="WARNING", hostname=f"soak-{queue}@localhost",
+        )
+
+    def _measure(self, queue, options):
+        """
+        - queue 에 프로브를 일정 간격으로 등록하고, 각 프로브의 대기 시간(초) 목록 반환
+        """
+        ids = []
+        for _ in range(options["probes"]):
+            probe_id = f"probe-{uuid.uuid4()}"
+            soak_probe.apply_async((probe_id, time.time()), queue=queue)
+            ids.append(f"soak:{probe_id}")
+            time.sleep(options["interval"])
+
+        deadline = time.time() + options["timeout"]
+        while True:
+            results = cache.get_many(ids)
+            if len(results) == len(ids) or time.time() > deadline:
+                break
+            time.sleep(0.1)
+        if len(results) < len(ids):
+            self.stderr.write(f"{len(ids) - len(results)} probes did not run within {options['timeout']}s")
+        return list(results.values())
+
+    def _report(self, label, latencies):
+        if not latencies:
+            self.stdout.write(f"[{label}] no probes completed")
+            return
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+        self.stdout.write(
+            f"[{label}] push wait p50={quantiles[49] * 1000:.0f}ms p95={quantiles[94] * 1000:.0f}ms "
+            f"max={max(latencies) * 1000:.0f}ms (n={len(latencies)})"
+        )
@@ -0,0 +1,306 @@
+import hmac
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.utils.decorators import sync_and_async_middleware
+
+from .db import get_connection_stats
+from .tracing import mark_hot
+
+# 요청 지연 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+SERIES_KEY = "metrics:series"
+PROCESSES_KEY = "metrics:processes"
+# 프로세스별 DB 연결 지표 보관 시간 (종료된 워커는 이후 내보내지 않음)
+PROCESS_STATS_TTL = 120
+
+
+class QueryRecorder:
+    """
+    - connection.execute_wrapper 용: 요청 하나의 SQL 수/시간, 같은 SQL(파라미터 제외) 반복 횟수
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] += 1
+
+    @property
+    def duplicates(self):
+        """
+        - 같은 SQL 이 두 번째 이후로 실행된 횟수 (N+1 패턴이면 목록 길이만큼 늘어남)
+        """
+        return sum(count - 1 for count in self.statements.values() if count > 1)
+
+    def most_repeated(self):
+        return self.statements.most_common(1)[0] if self.statements else (None, 0)
+
+
+# 현재 요청의 QueryRecorder (sync_to_async 로 실행되는 뷰의 스레드에도 전달됨)
+_current_recorder = ContextVar("query_recorder", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    - connection_created 시그널: 연결 객체(스레드별)마다 한 번 SQL 기록 래퍼 등록
+    - ASGI 에서는 미들웨어(이벤트 루프)와 뷰(스레드)의 연결 객체가 달라 요청마다 execute_wrapper 를 걸 수 없음
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+_pending = defaultdict(Counter)
+_pending_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def _incr(key, delta):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def record_request(endpoint, method, status_code, duration, recorder):
+    """
+    - 요청 하나의 지표를 프로세스 메모리에 누적 (공유 캐시 반영은 flush_metrics)
+    """
+    bucket = next((index for index, bound in enumerate(LATENCY_BUCKETS) if duration <= bound), len(LATENCY_BUCKETS))
+    with _pending_lock:
+        counters = _pending[(endpoint, method)]
+        counters["requests"] += 1
+        counters["duration_us"] += int(duration * 1_000_000)
+        counters[f"bucket_{bucket}"] += 1
+        counters["sql_queries"] += recorder.count
+        counters["sql_duration_us"] += int(recorder.duration * 1_000_000)
+        counters["duplicate_queries"] += recorder.duplicates
+        if status_code >= 500:
+            counters["server_errors"] += 1
+        if duration >= settings.METRICS_SLOW_REQUEST_SECONDS:
+            counters["slow_requests"] += 1
+
+    if time.monotonic() - _last_flush >= settings.METRICS_FLUSH_INTERVAL:
+        flush_metrics()
+
+
+def flush_metrics():
+    """
+    - 누적한 값을 공유 캐시 카운터에 더함 (METRICS_FLUSH_INTERVAL 마다 한 번 → 요청마다 캐시 왕복 없음)
+    - 여러 워커의 값이 합산되므로 /metrics/ 는 어느 워커가 받아도 같은 결과
+    """
+    global _last_flush
+    with _pending_lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+
+    try:
+        if pending:
+            series = set(cache.get(SERIES_KEY) or ())
+            new_series = {f"{endpoint}|{method}" for endpoint, method in pending} - series
+            if new_series:
+                cache.set(SERIES_KEY, series | new_series, timeout=None)
+            for (endpoint, method), counters in pending.items():
+                for field, value in counters.items():
+                    if value:
+                        _incr(f"metrics:{endpoint}|{method}:{field}", value)
+
+        pid = os.getpid()
+        cache.set(f"metrics:process:{pid}", get_connection_stats(), PROCESS_STATS_TTL)
+        processes = set(cache.get(PROCESSES_KEY) or ())
+        if pid not in processes:
+            # 새 워커가 추가될 때 종료된 워커도 함께 정리 (목록이 계속 늘지 않도록)
+            live, _ = _live_process_stats(processes)
+            cache.set(PROCESSES_KEY, set(live) | {pid}, timeout=None)
+    except Exception as e:
+        print(f"[WARNING] 요청 지표 저장 실패: {e}")
+
+
+def _live_process_stats(processes):
+    """
+    - 지표가 아직 남아 있는(PROCESS_STATS_TTL 안에 flush 한) 워커만: ([pid], {pid: 지표})
+    """
+    stats = cache.get_many([f"metrics:process:{pid}" for pid in processes])
+    live = sorted(pid for pid in processes if f"metrics:process:{pid}" in stats)
+    return live, {pid: stats[f"metrics:process:{pid}"] for pid in live}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric(lines, name, kind, help_text, samples):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels, value in samples:
+        label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels)
+        lines.append(f"{name}{{{label_text}}} {value}")
+
+
+def render_prometheus():
+    """
+    - 공유 캐시의 지표를 Prometheus text format(0.0.4)으로
+    """
+    series = sorted(cache.get(SERIES_KEY) or ())
+    fields = (
+        "requests", "duration_us", "sql_queries", "sql_duration_us",
+        "duplicate_queries", "server_errors", "slow_requests",
+        *(f"bucket_{index}" for index in range(len(LATENCY_BUCKETS) + 1)),
+    )
+    keys = [f"metrics:{name}:{field}" for name in series for field in fields]
+    values = cache.get_many(keys)
+
+    rows = []
+    for name in series:
+        endpoint, method = name.rsplit("|", 1)
+        row = {field: values.get(f"metrics:{name}:{field}", 0) for field in fields}
+        rows.append(((("endpoint", endpoint), ("method", method)), row))
+
+    lines = []
+    _metric(lines, "kickit_http_requests_total", "counter", "Requests by resolved URL name.",
+            [(labels, row["requests"]) for labels, row in rows])
+    _metric(lines, "kickit_http_server_errors_total", "counter", "Responses with status >= 500.",
+            [(labels, row["server_errors"]) for labels, row in rows])
+    _metric(lines, "kickit_http_slow_requests_total", "counter", "Requests slower than METRICS_SLOW_REQUEST_SECONDS.",
+            [(labels, row["slow_requests"]) for labels, row in rows])
+
+    lines.append("# HELP kickit_http_request_duration_seconds Request latency.")
+    lines.append("# TYPE kickit_http_request_duration_seconds histogram")
+    for labels, row in rows:
+        label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels)
+        cumulative = 0
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            cumulative += row[f"bucket_{index}"]
+            lines.append(f'kickit_http_request_duration_seconds_bucket{{{label_text},le="{bound}"}} {cumulative}')
+        lines.append(f'kickit_http_request_duration_seconds_bucket{{{label_text},le="+Inf"}} {row["requests"]}')
+        lines.append(f"kickit_http_request_duration_seconds_sum{{{label_text}}} {row['duration_us'] / 1_000_000}")
+        lines.append(f"kickit_http_request_duration_seconds_count{{{label_text}}} {row['requests']}")
+
+    _metric(lines, "kickit_sql_queries_total", "counter", "SQL queries issued while handling requests.",
+            [(labels, row["sql_queries"]) for labels, row in rows])
+    _metric(lines, "kickit_sql_duration_seconds_total", "counter", "Time spent in SQL while handling requests.",
+            [(labels, row["sql_duration_us"] / 1_000_000) for labels, row in rows])
+    _metric(lines, "kickit_sql_duplicate_queries_total", "counter", "Repeated identical SQL statements (N+1 indicator).",
+            [(labels, row["duplicate_queries"]) for labels, row in rows])
+
+    processes = set(cache.get(PROCESSES_KEY) or ())
+    live, process_stats = _live_process_stats(processes)
+    if len(live) < len(processes):
+        # 종료된 워커 정리 → 수집 때마다 죽은 pid 까지 조회하지 않음
+        cache.set(PROCESSES_KEY, set(live), timeout=None)
+    stat_names = sorted({name for stats in process_stats.values() for name in stats})
+    for stat in stat_names:
+        kind = "counter" if stat in ("connections_created", "pool_requests", "pool_wait_ms",
+                                     "pool_connections_lost", "pool_connections_errors",
+                                     "pool_connections_opened") else "gauge"
+        _metric(lines, f"kickit_db_{stat}", kind, f"DB connection stat '{stat}' per worker process.",
+                [((("pid", pid),), process_stats[pid][stat]) for pid in live if stat in process_stats[pid]])
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """
+    - GET /metrics/ : Prometheus 수집용 (Authorization: Bearer <METRICS_TOKEN>)
+    - METRICS_TOKEN 이 없으면 비활성 (404)
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        raise Http404
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return HttpResponse(status=401)
+
+    flush_metrics()
+    return HttpResponse(render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def _endpoint_name(request):
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "<unresolved>"
+
+
+@sync_and_async_middleware
+class RequestMetricsMiddleware:
+    """
+    - URL 이름별 요청 지연, SQL 수/시간, 중복 SQL(N+1 의심) 기록
+    - 느린 요청(METRICS_SLOW_REQUEST_SECONDS 이상)과 N+1 의심 요청은 로그로 남김
+    - ASGI/WSGI 모두 지원 (비동기 체인에서 동기 어댑터로 감싸지 않도록)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        token = _current_recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_recorder.reset(token)
+        self._finish(request, response, time.perf_counter() - started, recorder)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        token = _current_recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_recorder.reset(token)
+        # 공유 캐시 반영(flush)이 이벤트 루프를 막지 않도록 스레드에서
+        await sync_to_async(self._finish)(request, response, time.perf_counter() - started, recorder)
+        return response
+
+    def _finish(self, request, response, duration, recorder):
+        endpoint = _endpoint_name(request)
+        try:
+            record_request(endpoint, request.method, response.status_code, duration, recorder)
+        except Exception as e:
+            print(f"[WARNING] 요청 지표 기록 실패: {e}")
+
+        statement, repeated = recorder.most_repeated()
+        if repeated >= settings.METRICS_N_PLUS_ONE_THRESHOLD:
+            print(
+                f"[WARNING] N+1 의심: {request.method} {request.path} ({endpoint}) "
+                f"같은 SQL {repeated}회 실행 - {statement[:200]}"
+            )
+        if duration >= settings.METRICS_SLOW_REQUEST_SECONDS or response.status_code >= 500:
+            # 이후 같은 엔드포인트 요청은 Sentry 트레이스를 더 높은 비율로 수집
+            mark_hot(endpoint)
+        if duration >= settings.METRICS_SLOW_REQUEST_SECONDS:
+            print(
+                f"[WARNING] 느린 요청: {request.method} {request.path} ({endpoint}) {duration * 1000:.0f}ms, "
+                f"SQL {recorder.count}개 {recorder.duration * 1000:.0f}ms, 중복 {recorder.duplicates}개"
+            )
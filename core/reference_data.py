@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, NamedTuple
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+# 클라이언트/CDN 이 재검증 없이 재사용할 시간(초) — 이후에는 ETag 로 재검증
+REFERENCE_DATA_MAX_AGE = 60 * 60
+
+
+class ReferenceData(NamedTuple):
+    """
+    - 프로세스 메모리에 보관하는 참조 데이터 한 벌
+    - version: 만들 당시의 버전 스탬프 (공유 캐시 값과 다르면 다시 만듦)
+    """
+    version: int
+    data: Any
+    etag: str
+
+
+_entries = {}
+_lock = threading.Lock()
+
+
+def _version_key(name):
+    return f"reference:{name}:version"
+
+
+def get_version(name):
+    """
+    - 참조 데이터 버전 스탬프 (공유 캐시 → 관리 명령/admin 등 다른 프로세스의 무효화도 반영)
+    - 키가 유실돼도 이전 버전과 겹치지 않도록 현재 시각으로 초기화
+    """
+    key = _version_key(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_reference_data(*names):
+    """
+    - 테이블 변경 시 호출 → 모든 프로세스의 메모리 사본이 다음 요청에서 다시 만들어짐
+    """
+    for name in names:
+        try:
+            cache.incr(_version_key(name))
+        except ValueError:
+            cache.add(_version_key(name), time.time_ns(), timeout=None)
+
+
+def get_reference_data(name, build):
+    """
+    - 이름별 참조 데이터 반환, 버전이 바뀌었거나 처음이면 build() 로 다시 만듦
+    - build(): JSON 으로 직렬화 가능한 응답 데이터 (DB 조회는 여기서만)
+    """
+    version = get_version(name)
+    entry = _entries.get(name)
+    if entry is not None and entry.version == version:
+        return entry
+
+    with _lock:
+        entry = _entries.get(name)
+        if entry is not None and entry.version == version:
+            return entry
+        data = build()
+        body = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":"))
+        etag = quote_etag(hashlib.sha256(body.encode()).hexdigest()[:32])
+        entry = ReferenceData(version, data, etag)
+        _entries[name] = entry
+        return entry
+
+
+class ReferenceDataListMixin:
+    """
+    - ListAPIView 용: 목록 전체를 메모리 사본으로 응답 (캐시 적중 시 DB 조회 없음)
+    - 강한 ETag + Cache-Control, If-None-Match 가 맞으면 304
+    - reference_name: 무효화 때 쓰는 이름 (signals / 관리 명령에서 invalidate_reference_data 호출)
+    """
+    reference_name = None
+
+    def build_reference_data(self):
+        return list(self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data)
+
+    def list(self, request, *args, **kwargs):
+        entry = get_reference_data(self.reference_name, self.build_reference_data)
+
+        # If-None-Match 는 약한 비교 (W/ 접두사 무시)
+        etags = [etag.removeprefix("W/") for etag in parse_etags(request.headers.get("If-None-Match", ""))]
+        if "*" in etags or entry.etag in etags:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(entry.data)
+
+        response["ETag"] = entry.etag
+        response["Cache-Control"] = f"public, max-age={REFERENCE_DATA_MAX_AGE}"
+        return response
@@ -0,0 +1,67 @@
+import math
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson 이 직접 처리하지 않는 타입(Decimal, lazy 번역 문자열, QuerySet 등)과
+# datetime/date/time 은 DRF 인코더에 맡김 → 날짜/시간 문자열 형식이 기존 JSONRenderer 와 같음
+_drf_encoder = JSONEncoder()
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+NON_FINITE_FLOAT_ERROR = "Out of range float values are not JSON compliant"
+
+
+def _check_finite(value):
+    """
+    - NaN/Infinity 가 있으면 ValueError (기존 JSONRenderer(strict) 의 json.dumps(allow_nan=False) 와 같음)
+    """
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"{NON_FINITE_FLOAT_ERROR}: {value!r}")
+    elif isinstance(value, dict):
+        for item in value.values():
+            _check_finite(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _check_finite(item)
+
+
+def _strict_default(obj):
+    value = _drf_encoder.default(obj)
+    # Decimal("NaN") 등 DRF 인코더가 float 로 바꾼 값도 확인
+    _check_finite(value)
+    return value
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    - orjson 으로 직렬화하는 JSONRenderer (같은 media type/format)
+    - 기존 렌더러처럼 UTF-8 그대로(ensure_ascii 없음), 공백 없이 출력하고 U+2028/2029 는 이스케이프
+    - NaN/Infinity 는 기존처럼 거부 (orjson 은 null 로 쓰므로 출력에 null 이 있을 때만 데이터를 확인)
+    - float 표기는 다를 수 있음 (예: 1e16 ↔ 기존 1e+16, 같은 값)
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        default = _strict_default if self.strict else _drf_encoder.default
+        try:
+            ret = orjson.dumps(data, default=default, option=options)
+        except orjson.JSONEncodeError as exc:
+            # default 안에서 난 ValueError(NaN 등)는 TypeError 로 감싸지므로 원래 예외로 전달
+            if isinstance(exc.__cause__, ValueError):
+                raise exc.__cause__
+            raise
+        if self.strict and b"null" in ret:
+            _check_finite(data)
+        # JSON 에서는 허용되지만 JavaScript 문자열 안에서는 줄바꿈으로 처리되는 문자
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -0,0 +1,193 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils.decorators import sync_and_async_middleware
+from rest_framework.permissions import SAFE_METHODS
+
+
+class RoutingState:
+    """
+    - 요청 하나의 DB 라우팅 상태 (kickit.routers.CustomRouter 가 참조)
+    - replica_reads: 복제본 읽기 허용 (ReplicaReadMixin 뷰의 GET 요청만)
+    - wrote: 이 요청에서 쓰기 발생 → 이후 읽기는 모두 primary (read-your-writes)
+    """
+    __slots__ = ("replica_reads", "wrote")
+
+    def __init__(self):
+        self.replica_reads = False
+        self.wrote = False
+
+
+# 요청 밖(Celery, 관리 명령)에서는 None → 모든 읽기/쓰기가 primary
+# 값 자체를 바꾸지 않고 객체를 수정 → sync_to_async/async_to_sync 경계를 넘어도 같은 상태 공유
+_routing_state = ContextVar("db_routing_state", default=None)
+
+
+def get_routing_state():
+    return _routing_state.get()
+
+
+def allow_replica_reads():
+    state = _routing_state.get()
+    if state is not None:
+        state.replica_reads = True
+
+
+def mark_write():
+    state = _routing_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+@contextmanager
+def primary_reads():
+    """
+    - 블록 안의 읽기를 primary 로 (공유 캐시에 저장할 결과 등, 복제 지연이 오래 남으면 안 되는 조회)
+    """
+    state = _routing_state.get()
+    previous = state.replica_reads if state is not None else False
+    if state is not None:
+        state.replica_reads = False
+    try:
+        yield
+    finally:
+        if state is not None:
+            state.replica_reads = previous
+
+
+def _pin_key(user_id):
+    return f"db:pin:{user_id}"
+
+
+def pin_user_to_primary(user_id):
+    """
+    - 쓰기 직후 REPLICA_PIN_SECONDS 동안 같은 유저의 읽기를 primary 로 (다음 요청에서도 자기 쓰기가 보이도록)
+    """
+    cache.set(_pin_key(user_id), 1, settings.REPLICA_PIN_SECONDS)
+
+
+def is_user_pinned(user):
+    return bool(user and user.is_authenticated and cache.get(_pin_key(user.pk)))
+
+
+_lag_checks = {}
+_lag_lock = threading.Lock()
+
+
+def replica_lag_seconds(alias):
+    """
+    - 복제본의 재생 지연(초), 복제본이 아니거나(primary/독립 DB) 따라잡은 상태면 0
+    """
+    connection = connections[alias]
+    if connection.vendor != "postgresql":
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT CASE
+                WHEN NOT pg_is_in_recovery() THEN 0
+                WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+            END
+            """
+        )
+        return float(cursor.fetchone()[0])
+
+
+def replica_is_usable(alias):
+    """
+    - 지연이 REPLICA_MAX_LAG_SECONDS 이하면 True, 초과/연결 실패면 False (primary 로 대체)
+    - 결과는 REPLICA_LAG_CHECK_INTERVAL 초 동안 프로세스 메모리에 보관 (요청마다 확인 쿼리 없음)
+    """
+    now = time.monotonic()
+    checked = _lag_checks.get(alias)
+    if checked is not None and now - checked[0] < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return checked[1]
+
+    with _lag_lock:
+        checked = _lag_checks.get(alias)
+        if checked is not None and now - checked[0] < settings.REPLICA_LAG_CHECK_INTERVAL:
+            return checked[1]
+        try:
+            lag = replica_lag_seconds(alias)
+            usable = lag <= settings.REPLICA_MAX_LAG_SECONDS
+            if not usable:
+                print(f"[WARNING] 복제본 지연 {lag:.1f}s ({alias}) → primary 사용")
+        except Exception as e:
+            print(f"[WARNING] 복제본 상태 확인 실패 ({alias}): {e}")
+            usable = False
+        _lag_checks[alias] = (now, usable)
+        return usable
+
+
+def choose_replica():
+    """
+    - 사용 가능한 첫 복제본 alias, 없으면 None
+    """
+    for alias in settings.DATABASE_REPLICAS:
+        if replica_is_usable(alias):
+            return alias
+    return None
+
+
+@sync_and_async_middleware
+class ReplicaRoutingMiddleware:
+    """
+    - 요청마다 라우팅 상태를 새로 만들고, 쓰기가 있었던 로그인 유저는 잠시 primary 에 고정
+    - ASGI/WSGI 모두 지원 (상태는 ContextVar → sync_to_async 로 실행되는 뷰와 같은 객체 공유)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+        self._pin_writer(request, state)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+        if state.wrote:
+            # request.user(지연 로딩)와 캐시 접근은 스레드에서
+            await sync_to_async(self._pin_writer)(request, state)
+        return response
+
+    @staticmethod
+    def _pin_writer(request, state):
+        # DRF 가 인증한 유저는 원래 요청(request.user)에도 설정됨
+        user = getattr(request, "user", None)
+        if state.wrote and settings.DATABASE_REPLICAS and user is not None and user.is_authenticated:
+            pin_user_to_primary(user.pk)
+
+
+class ReplicaReadMixin:
+    """
+    - 피드/검색/목록 뷰 용: GET/HEAD 요청의 읽기를 복제본으로
+    - 최근에 쓰기를 한 유저, 요청 안에서 쓰기가 있었던 이후의 읽기는 primary
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and settings.DATABASE_REPLICAS and not is_user_pinned(request.user):
+            allow_replica_reads()
@@ -0,0 +1,54 @@
+import asyncio
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.utils.decorators import sync_and_async_middleware
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+async def _read_chunks(file, block_size):
+    """
+    - 정적 파일을 스레드에서 block_size 씩 읽는 비동기 이터레이터 (이벤트 루프에서 파일 I/O 를 하지 않음)
+    """
+    try:
+        while True:
+            chunk = await asyncio.to_thread(file.read, block_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+@sync_and_async_middleware
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    - WhiteNoise 정적 파일 서빙 (ASGI/WSGI 모두 지원)
+    - whitenoise 6 의 미들웨어는 동기 전용 → ASGI 에서 그대로 쓰면 안쪽 미들웨어/뷰 전체가
+      async_to_sync 로 감싸져 요청이 동시에 처리되지 않음
+    - 정적 파일이 아닌 요청은 그대로 다음 단계로, 정적 파일은 파일 열기/읽기를 스레드에서
+    """
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is None:
+            return await self.get_response(request)
+
+        response = await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        file = getattr(response, "file_to_stream", None)
+        if file is not None:
+            response.streaming_content = _read_chunks(file, response.block_size)
+        return response
@@ -0,0 +1,262 @@
+import asyncio
+import json
+import os
+import random
+import shutil
+import time
+import weakref
+from datetime import datetime, timezone
+from urllib.parse import unquote
+
+from django.conf import settings
+
+from .clients import get_client, registry
+
+# 업로드한 객체는 경로(uuid)가 바뀌지 않으므로 길게 캐시
+IMAGE_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+# 목록 조회 1회당 가져올 항목 수
+LIST_PAGE_SIZE = 1000
+
+
+def _is_transient(error):
+    """
+    - 다시 시도하면 성공할 수 있는 오류인지 (연결 실패/타임아웃, 5xx, 429)
+    - 게이트웨이가 JSON 이 아닌 에러 페이지를 주면 storage3 가 JSONDecodeError 를 냄
+    """
+    import httpx
+    from storage3.exceptions import StorageApiError
+
+    if isinstance(error, (httpx.TransportError, json.JSONDecodeError)):
+        return True
+    if isinstance(error, StorageApiError):
+        try:
+            status = int(error.status)
+        except (TypeError, ValueError):
+            return False
+        return status >= 500 or status == 429
+    return False
+
+
+def _retry_delay(attempt):
+    # 지수 백오프 + 지터 (여러 워커가 같은 순간에 다시 몰리지 않도록)
+    return settings.STORAGE_RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+class SupabaseStorage:
+    """
+    - Supabase Storage(public bucket) 백엔드
+    - 클라이언트는 처음 사용할 때 생성 (import 시점 네트워크/환경 변수 의존 제거)
+    """
+
+    def __init__(self):
+        self.base_url = settings.SUPABASE_URL
+        self.bucket = settings.SUPABASE_BUCKET
+        # 비동기 클라이언트(httpx.AsyncClient)는 이벤트 루프에 묶이므로 루프별로 보관
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self):
+        return get_client("supabase")
+
+    def _bucket(self):
+        return self.client.storage.from_(self.bucket)
+
+    def _async_bucket(self):
+        from storage3 import AsyncStorageClient
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            key = settings.SUPABASE_ANON_PUBLIC_KEY
+            client = AsyncStorageClient(
+                f"{self.base_url}/storage/v1",
+                {"apiKey": key, "Authorization": f"Bearer {key}"},
+            )
+            self._async_clients[loop] = client
+        return client.from_(self.bucket)
+
+    @staticmethod
+    def _file_options(content_type):
+        return {
+            "content-type": content_type,
+            "cache-control": str(IMAGE_CACHE_MAX_AGE),
+            "upsert": "true",
+        }
+
+    @staticmethod
+    def _with_retries(operation):
+        """
+        - 일시적 오류면 STORAGE_RETRY_ATTEMPTS 회까지 백오프 후 다시 시도
+        """
+        for attempt in range(settings.STORAGE_RETRY_ATTEMPTS):
+            try:
+                return operation()
+            except Exception as e:
+                if attempt + 1 >= settings.STORAGE_RETRY_ATTEMPTS or not _is_transient(e):
+                    raise
+                print(f"[WARNING] 저장소 요청 재시도 ({attempt + 1}/{settings.STORAGE_RETRY_ATTEMPTS}): {e}")
+                time.sleep(_retry_delay(attempt))
+
+    @staticmethod
+    async def _with_retries_async(operation):
+        for attempt in range(settings.STORAGE_RETRY_ATTEMPTS):
+            try:
+                return await operation()
+            except Exception as e:
+                if attempt + 1 >= settings.STORAGE_RETRY_ATTEMPTS or not _is_transient(e):
+                    raise
+                print(f"[WARNING] 저장소 요청 재시도 ({attempt + 1}/{settings.STORAGE_RETRY_ATTEMPTS}): {e}")
+                await asyncio.sleep(_retry_delay(attempt))
+
+    def save(self, path, data, content_type):
+        """
+        - path 에 data 업로드 후 public URL 반환
+        - data: bytes 또는 로컬 파일 경로(str) → 경로면 파일을 열어 청크 단위로 전송 (메모리에 전부 올리지 않음)
+        - 같은 경로 재업로드(재시도)는 덮어씀
+        """
+        def upload():
+            if isinstance(data, bytes):
+                return self._bucket().upload(path=path, file=data, file_options=self._file_options(content_type))
+            # 재시도마다 파일을 처음부터 다시 엶
+            with open(data, "rb") as f:
+                return self._bucket().upload(path=path, file=f, file_options=self._file_options(content_type))
+
+        self._with_retries(upload)
+        return self.url(path)
+
+    async def asave(self, path, data, content_type):
+        """
+        - save() 의 비동기 버전 (ASGI 에서 업로드 대기 중 워커/스레드를 점유하지 않음)
+        """
+        async def upload():
+            if isinstance(data, bytes):
+                return await self._async_bucket().upload(
+                    path=path, file=data, file_options=self._file_options(content_type)
+                )
+            with open(data, "rb") as f:
+                return await self._async_bucket().upload(
+                    path=path, file=f, file_options=self._file_options(content_type)
+                )
+
+        await self._with_retries_async(upload)
+        return self.url(path)
+
+    def read(self, path):
+        return self._with_retries(lambda: self._bucket().download(path))
+
+    def delete(self, paths):
+        if paths:
+            # 삭제는 여러 번 해도 결과가 같으므로 재시도해도 안전
+            self._with_retries(lambda: self._bucket().remove(list(paths)))
+
+    def list_objects(self, prefix=""):
+        """
+        - prefix(폴더) 아래 모든 파일을 (경로, 마지막 수정 시각)으로 순회 (하위 폴더 포함)
+        - 폴더 항목은 id 가 없음
+        """
+        offset = 0
+        while True:
+            entries = self._with_retries(lambda: self._bucket().list(
+                prefix,
+                {"limit": LIST_PAGE_SIZE, "offset": offset, "sortBy": {"column": "name", "order": "asc"}},
+            ))
+            for entry in entries:
+                path = f"{prefix}/{entry['name']}" if prefix else entry["name"]
+                if entry.get("id") is None:
+                    yield from self.list_objects(path)
+                else:
+                    modified = entry.get("updated_at") or entry.get("created_at")
+                    yield path, datetime.fromisoformat(modified) if modified else None
+            if len(entries) < LIST_PAGE_SIZE:
+                return
+            offset += LIST_PAGE_SIZE
+
+    def url(self, path):
+        return f"{self.base_url}/storage/v1/object/public/{self.bucket}/{path}"
+
+    def path_from_url(self, url):
+        """
+        - public URL → 버킷 내부 경로 (이 버킷의 URL이 아니면 None)
+        """
+        marker = f"/{self.bucket}/"
+        if not url or marker not in url:
+            return None
+        return unquote(url.split(marker, 1)[-1])
+
+
+class LocalFileStorage:
+    """
+    - 로컬 파일시스템 백엔드 (개발/테스트용 Supabase 대체)
+    - MEDIA_ROOT 아래에 저장하고 MEDIA_URL 로 URL 생성
+    """
+
+    def __init__(self):
+        self.root = str(settings.MEDIA_ROOT)
+        self.base_url = settings.MEDIA_URL
+
+    def _full_path(self, path):
+        full_path = os.path.abspath(os.path.join(self.root, path))
+        if not full_path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError(f"Invalid storage path: {path}")
+        return full_path
+
+    def save(self, path, data, content_type):
+        """
+        - data: bytes 또는 로컬 파일 경로(str) (SupabaseStorage.save 와 같음)
+        """
+        full_path = self._full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if isinstance(data, bytes):
+            with open(full_path, "wb") as f:
+                f.write(data)
+        else:
+            shutil.copyfile(data, full_path)
+        return self.url(path)
+
+    async def asave(self, path, data, content_type):
+        return await asyncio.to_thread(self.save, path, data, content_type)
+
+    def read(self, path):
+        with open(self._full_path(path), "rb") as f:
+            return f.read()
+
+    def delete(self, paths):
+        for path in paths:
+            try:
+                os.remove(self._full_path(path))
+            except FileNotFoundError:
+                pass
+
+    def list_objects(self, prefix=""):
+        base = os.path.join(self.root, prefix)
+        for dirpath, _, filenames in os.walk(base):
+            for filename in filenames:
+                full_path = os.path.join(dirpath, filename)
+                path = os.path.relpath(full_path, self.root).replace(os.sep, "/")
+                modified = datetime.fromtimestamp(os.path.getmtime(full_path), tz=timezone.utc)
+                yield path, modified
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
+
+    def path_from_url(self, url):
+        if not url or self.base_url not in url:
+            return None
+        return unquote(url.split(self.base_url, 1)[-1])
+
+
+STORAGE_BACKENDS = {
+    "supabase": SupabaseStorage,
+    "local": LocalFileStorage,
+}
+
+@registry.register("image_storage")
+def _image_storage():
+    return STORAGE_BACKENDS[settings.IMAGE_STORAGE_BACKEND]()
+
+
+def get_image_storage():
+    """
+    - settings.IMAGE_STORAGE_BACKEND 에 맞는 이미지 저장소 반환 (프로세스당 1개, fork 후 다시 생성)
+    """
+    return get_client("image_storage")
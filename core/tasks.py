@@ -0,0 +1,180 @@
+import re
+from datetime import timedelta
+from typing import NamedTuple
+
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+
+from .images import RENDITION_NAMES, RENDITION_PREFIX, rendition_urls
+from .storage import get_image_storage
+
+# storage remove API 1회 호출당 삭제할 객체 수
+STORAGE_DELETE_BATCH_SIZE = 100
+# 업로드 직후(DB 저장 전) 객체를 지우지 않도록 이 시간보다 오래된 객체만 정리
+ORPHAN_IMAGE_GRACE_PERIOD = timedelta(days=1)
+# 코드에서 URL을 직접 쓰는 공용 이미지 폴더 (삭제 금지)
+PROTECTED_PREFIXES = ("default_images/",)
+# 이미지 URL 을 가진 행 중 이 비율 이상이 저장소 경로로 해석되어야 고아 이미지 정리 (나머지는 외부 URL)
+ORPHAN_MIN_RESOLVED_RATIO = 0.5
+
+_UUID = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+# 앱이 직접 업로드한 객체만 정리 대상 (uuid 파일명 + 렌디션)
+# - 렌디션: renditions/<uuid>_<크기>.webp (현재), renditions/<uuid>/<크기>.webp (이전 폴더 방식)
+#   이전 방식 파일도 DB 에 URL 이 남아 있는 동안은 그대로 쓰이고, 참조가 끊기면 함께 정리
+MANAGED_OBJECT_RE = re.compile(
+    rf"^(?:(?:profile_images|verification)/)?{_UUID}\.\w+$"
+    rf"|^{RENDITION_PREFIX}/{_UUID}[_/](?:{'|'.join(RENDITION_NAMES)})\.webp$"
+)
+
+
+def storage_paths(urls):
+    """
+    - URL 목록 → 버킷 내부 경로 목록 (이 저장소 밖의 URL, 공용 이미지는 제외)
+    """
+    storage = get_image_storage()
+    paths = []
+    for url in urls:
+        path = storage.path_from_url(url) if isinstance(url, str) else None
+        if path and not path.startswith(PROTECTED_PREFIXES) and path not in paths:
+            paths.append(path)
+    return paths
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def delete_storage_objects(self, paths):
+    """
+    - 저장소 객체를 STORAGE_DELETE_BATCH_SIZE 개씩 묶어서 삭제
+    - 실패하면 남은 경로만 다시 시도
+    """
+    storage = get_image_storage()
+    for start in range(0, len(paths), STORAGE_DELETE_BATCH_SIZE):
+        try:
+            storage.delete(paths[start:start + STORAGE_DELETE_BATCH_SIZE])
+        except Exception as e:
+            print(f"[WARNING] 저장소 객체 삭제 실패 ({len(paths) - start}개 남음): {e}")
+            raise self.retry(exc=e, args=[paths[start:]])
+
+
+def delete_images_later(image_urls, renditions=None):
+    """
+    - 이미지(와 렌디션) 삭제를 트랜잭션 커밋 후 백그라운드 태스크로 넘김
+    - 태스크 등록이 실패해도 요청은 그대로 진행 (남은 파일은 주기적인 정리 작업이 회수)
+    """
+    image_urls = list(image_urls)
+    paths = storage_paths(image_urls + rendition_urls(image_urls, renditions))
+    if not paths:
+        return
+
+    def enqueue():
+        try:
+            delete_storage_objects.delay(paths)
+        except Exception as e:
+            print(f"[WARNING] 이미지 삭제 태스크 등록 실패: {e}")
+
+    transaction.on_commit(enqueue)
+
+
+class ImageReferences(NamedTuple):
+    """
+    - DB에서 모은 이미지 참조
+    - paths: 참조 중인 버킷 내부 경로
+    - rows: 이미지 URL 을 가진 행 수 (기본 프로필 이미지만 있는 프로필 제외)
+    - resolved_rows: 그중 URL 하나 이상이 이 저장소 경로로 해석된 행 수
+    """
+    paths: set
+    rows: int
+    resolved_rows: int
+
+
+def referenced_image_paths():
+    """
+    - DB에서 참조 중인 모든 이미지 경로
+      (Post.images/image_renditions, Meeting.thumbnails/thumbnail_renditions,
+       UserProfile.profile_image/verification_image)
+    """
+    from apps.account.models import UserProfile
+    from apps.board.models import Post
+    from apps.meetup.models import Meeting
+
+    storage = get_image_storage()
+    referenced = set()
+    rows = resolved_rows = 0
+    default_profile_image = UserProfile._meta.get_field("profile_image").default
+
+    def add(urls):
+        resolved = False
+        for url in urls or []:
+            path = storage.path_from_url(url) if isinstance(url, str) else None
+            if path:
+                referenced.add(path)
+                resolved = True
+        return resolved
+
+    def add_renditions(renditions):
+        for sizes in (renditions or {}).values():
+            add((sizes or {}).values())
+
+    def add_row(urls):
+        nonlocal rows, resolved_rows
+        urls = [url for url in urls if isinstance(url, str) and url]
+        if urls:
+            rows += 1
+            resolved_rows += add(urls)
+
+    for images, renditions in Post.objects.values_list("images", "image_renditions").iterator(chunk_size=2000):
+        add_row(images or [])
+        add_renditions(renditions)
+
+    for thumbnails, renditions in Meeting.objects.values_list("thumbnails", "thumbnail_renditions").iterator(chunk_size=2000):
+        add_row(thumbnails or [])
+        add_renditions(renditions)
+
+    for profile_image, verification_image in UserProfile.objects.values_list(
+        "profile_image", "verification_image"
+    ).iterator(chunk_size=2000):
+        if profile_image == default_profile_image:
+            add([profile_image])
+            profile_image = None
+        add_row([profile_image, *(verification_image or [])])
+
+    return ImageReferences(referenced, rows, resolved_rows)
+
+
+def find_orphan_images(now=None):
+    """
+    - 아무 데이터도 참조하지 않는 업로드 객체 경로 목록
+    - 참조 목록을 먼저 만든 뒤 버킷을 조회하고, 유예 기간 안의 객체는 건너뜀
+    - 참조 목록이 비었거나 이미지 URL 을 가진 행 수에 비해 너무 적으면 (저장소 URL 설정 변경,
+      잘못된 DB 연결 등) 버킷 전체가 고아로 보이므로 정리하지 않고 [] 반환
+    """
+    cutoff = (now or timezone.now()) - ORPHAN_IMAGE_GRACE_PERIOD
+    references = referenced_image_paths()
+    if not references.paths or references.resolved_rows < references.rows * ORPHAN_MIN_RESOLVED_RATIO:
+        print(
+            f"[WARNING] 이미지 참조 목록이 비정상적으로 작아 고아 이미지 정리 중단 "
+            f"(경로 {len(references.paths)}개, 이미지 행 {references.rows}개 중 {references.resolved_rows}개 해석)"
+        )
+        return []
+
+    orphans = []
+    for path, modified in get_image_storage().list_objects():
+        if path.startswith(PROTECTED_PREFIXES) or not MANAGED_OBJECT_RE.match(path):
+            continue
+        if modified is None or modified >= cutoff:
+            continue
+        if path not in references.paths:
+            orphans.append(path)
+    return orphans
+
+
+@shared_task
+def collect_orphan_images():
+    """
+    - 주기 실행(CELERY_BEAT_SCHEDULE): 참조가 끊긴 업로드 이미지를 모아서 일괄 삭제
+    """
+    orphans = find_orphan_images()
+    if orphans:
+        delete_storage_objects.delay(orphans)
+    print(f"[INFO] 고아 이미지 {len(orphans)}개 삭제 예약")
+    return len(orphans)
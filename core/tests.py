@@ -0,0 +1,521 @@
+import importlib.util
+import shutil
+import tempfile
+import unittest
+import uuid
+from datetime import timedelta
+from unittest import mock
+from decimal import Decimal
+from io import BytesIO
+
+from asgiref.sync import iscoroutinefunction
+from celery import Celery
+from django.db.utils import ConnectionHandler
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.contrib.auth.models import User
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+from PIL import Image
+from rest_framework.renderers import JSONRenderer
+
+from core.clients import registry
+from core.db import database_settings
+from core import metrics, replica
+from core.images import RENDITION_SIZES, build_renditions, generate_image_renditions, rendition_path
+from core.renderers import ORJSONRenderer
+from core.storage import get_image_storage
+from core.tasks import MANAGED_OBJECT_RE, find_orphan_images
+from core.uploads import POST_IMAGE_POLICY, upload_files, upload_files_async
+from kickit.celery import (
+    QUEUE_DEFAULT,
+    QUEUE_EMAIL,
+    QUEUE_FANOUT,
+    QUEUE_MAINTENANCE,
+    QUEUE_PUSH,
+    WORKER_PROFILES,
+    app,
+)
+from apps.board.models import Board, Post
+from kickit.routers import CustomRouter
+
+DATABASE_BASE = {
+    "ENGINE": "django.db.backends.postgresql",
+    "NAME": "kickit",
+    "USER": "kickit",
+    "PASSWORD": "kickit",
+    "HOST": "127.0.0.1",
+    "PORT": "5432",
+}
+
+
+@unittest.skipUnless(importlib.util.find_spec("psycopg_pool"), "psycopg_pool 미설치")
+class DatabasePoolSettingsTests(SimpleTestCase):
+    def _wrapper(self, profile):
+        # 실제 DB 에는 연결하지 않음 (풀은 open=False 로 생성됨)
+        handler = ConnectionHandler({"default": {}, "pool_test": database_settings(profile, DATABASE_BASE)})
+        connection = handler["pool_test"]
+        self.addCleanup(connection._connection_pools.pop, "pool_test", None)
+        return connection
+
+    def test_pool_profile_builds_connection_pool(self):
+        from psycopg_pool import ConnectionPool
+
+        pool = self._wrapper("pool").pool
+
+        self.assertIsInstance(pool, ConnectionPool)
+        self.assertEqual((pool.min_size, pool.max_size, pool.timeout), (2, 10, 10))
+        # CONN_HEALTH_CHECKS → Django 가 넘긴 check_connection 으로 꺼낼 때마다 상태 확인
+        self.assertIs(pool._check, ConnectionPool.check_connection)
+
+    def test_other_profiles_do_not_use_pool(self):
+        for profile in ("persistent", "pgbouncer"):
+            with self.subTest(profile=profile):
+                self.assertIsNone(self._wrapper(profile).pool)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            database_settings("unknown", DATABASE_BASE)
+
+
+def make_image(size, fmt="JPEG", metadata=True, mode="RGB", color="red"):
+    """
+    - 테스트용 이미지 bytes (metadata=True: 카메라/GPS EXIF, 회전(Orientation=6), XMP 포함)
+    """
+    image = Image.new(mode, size, color)
+    options = {}
+    if metadata:
+        exif = Image.Exif()
+        exif[0x010F] = "Camera"
+        exif[0x0112] = 6
+        exif[0x8825] = {1: "N", 2: (37.0, 33.0, 0.0)}
+        options["exif"] = exif
+        if fmt == "JPEG":
+            options["xmp"] = b"<x:xmpmeta/>"
+    buffer = BytesIO()
+    image.save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def open_image(data):
+    image = Image.open(BytesIO(data))
+    image.load()
+    return image
+
+
+def assert_no_metadata(test, data):
+    image = open_image(data)
+    test.assertEqual(dict(image.getexif()), {})
+    test.assertNotIn("exif", image.info)
+    test.assertNotIn("xmp", image.info)
+
+
+class BuildRenditionsTests(SimpleTestCase):
+    def test_large_photo(self):
+        data = make_image((3000, 2000))
+
+        original, groups = build_renditions(data)
+
+        self.assertEqual([names for names, _ in groups], [["full"], ["feed"], ["thumbnail"]])
+        for (names, webp), name in zip(groups, RENDITION_SIZES):
+            image = open_image(webp)
+            self.assertEqual(image.format, "WEBP")
+            # Orientation=6 반영 → 세로 사진
+            self.assertEqual(max(image.size), RENDITION_SIZES[name])
+            self.assertLess(image.size[0], image.size[1])
+            assert_no_metadata(self, webp)
+
+        content_type, original_data = original
+        self.assertEqual(content_type, "image/jpeg")
+        image = open_image(original_data)
+        self.assertEqual(image.format, "JPEG")
+        self.assertEqual(image.size, (1365, 2048))
+        assert_no_metadata(self, original_data)
+
+    def test_small_image_shares_rendition(self):
+        original, groups = build_renditions(make_image((200, 100), "PNG", metadata=False, mode="RGBA", color=(255, 0, 0, 128)))
+
+        # 메타데이터 없고 full 크기 이하 → 원본은 그대로
+        self.assertIsNone(original)
+        self.assertEqual([names for names, _ in groups], [["full", "feed", "thumbnail"]])
+        self.assertEqual(open_image(groups[0][1]).mode, "RGBA")
+
+    def test_small_image_with_metadata_is_reencoded(self):
+        content_type, data = build_renditions(make_image((200, 100), "PNG"))[0]
+
+        self.assertEqual(content_type, "image/png")
+        self.assertEqual(open_image(data).size, (100, 200))
+        assert_no_metadata(self, data)
+
+    def test_animated_image_is_skipped(self):
+        frames = [Image.new("RGB", (10, 10), color) for color in ("red", "blue")]
+        buffer = BytesIO()
+        frames[0].save(buffer, "GIF", save_all=True, append_images=frames[1:])
+
+        self.assertEqual(build_renditions(buffer.getvalue()), (None, []))
+
+
+class LocalStorageMixin:
+    """
+    - 이미지 저장소를 임시 폴더의 LocalFileStorage(Supabase 대체)로
+    """
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = self.settings(IMAGE_STORAGE_BACKEND="local", MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        # 프로세스에 캐시된 저장소를 버리고 위 설정으로 다시 생성
+        registry._clients.pop("image_storage", None)
+        self.addCleanup(registry._clients.pop, "image_storage", None)
+        self.storage = get_image_storage()
+
+
+class UploadFilesTests(LocalStorageMixin, SimpleTestCase):
+    """
+    - 업로드 직후(렌디션 태스크 전)에도 공개 원본에 메타데이터가 없어야 함
+    """
+
+    def uploaded_files(self):
+        photo = make_image((3000, 2000))
+        temporary = TemporaryUploadedFile("large.jpg", "image/jpeg", len(photo), None)
+        temporary.write(photo)
+        temporary.seek(0)
+        self.addCleanup(temporary.close)
+        return [
+            SimpleUploadedFile("photo.jpg", make_image((800, 600))),
+            temporary,
+            SimpleUploadedFile("clean.png", make_image((200, 100), "PNG", metadata=False)),
+        ]
+
+    def assert_stored(self, files, results):
+        self.assertTrue(all(result.ok for result in results))
+        photo, large, clean = (self.storage.read(self.storage.path_from_url(result.url)) for result in results)
+
+        assert_no_metadata(self, photo)
+        self.assertEqual(open_image(photo).size, (600, 800))
+        assert_no_metadata(self, large)
+        self.assertEqual(open_image(large).size, (1365, 2048))
+        # 정리할 필요 없는 이미지는 그대로
+        files[2].seek(0)
+        self.assertEqual(clean, files[2].read())
+
+    def test_upload_strips_metadata(self):
+        files = self.uploaded_files()
+        self.assert_stored(files, upload_files(files, POST_IMAGE_POLICY))
+
+    async def test_async_upload_strips_metadata(self):
+        files = self.uploaded_files()
+        self.assert_stored(files, await upload_files_async(files, POST_IMAGE_POLICY))
+
+
+class GenerateImageRenditionsTests(LocalStorageMixin, SimpleTestCase):
+    """
+    - LocalFileStorage 로 업로드 → 렌디션 생성 → 원본 덮어쓰기까지 확인
+    """
+
+    def test_renditions_and_stripped_original(self):
+        path = "0b7c6f7e-4c1e-4f55-9a53-5b8f0f2f8a11.jpg"
+        data = make_image((3000, 2000))
+        url = self.storage.save(path, data, "image/jpeg")
+
+        urls = generate_image_renditions(url)
+
+        self.assertEqual(set(urls), set(RENDITION_SIZES))
+        for name in RENDITION_SIZES:
+            self.assertEqual(urls[name], self.storage.url(rendition_path(path, name)))
+            rendition = self.storage.read(rendition_path(path, name))
+            self.assertLess(len(rendition), len(data))
+            assert_no_metadata(self, rendition)
+
+        stored = self.storage.read(path)
+        self.assertLess(len(stored), len(data))
+        assert_no_metadata(self, stored)
+
+        # 다시 실행해도 원본은 다시 인코딩하지 않음
+        generate_image_renditions(url)
+        self.assertEqual(self.storage.read(path), stored)
+
+    def test_foreign_url(self):
+        self.assertIsNone(generate_image_renditions("https://example.com/image.jpg"))
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_same_output_as_json_renderer(self):
+        data = {"id": 1, "name": "서울\u2028", "price": Decimal("1.50"), "tags": ["a", None], "ratio": 0.25}
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_rejects_non_finite_floats(self):
+        for data in ({"a": float("nan")}, [1, {"b": [float("inf")]}], {"c": None, "d": -float("inf")}):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                ORJSONRenderer().render(data)
+
+
+class CeleryQueueTests(SimpleTestCase):
+    """
+    - 태스크 라우팅/큐별 워커 설정을 memory:// 브로커로 확인 (운영 설정의 브로커와 무관하게 별도 앱 사용)
+    """
+
+    def make_app(self):
+        test_app = Celery("kickit-test", broker="memory://", set_as_current=False)
+        test_app.conf.task_routes = app.conf.task_routes
+        return test_app
+
+    def test_routed_tasks_exist(self):
+        app.loader.import_default_modules()
+        for name in app.conf.task_routes:
+            with self.subTest(task=name):
+                self.assertIn(name, app.tasks)
+
+    def test_tasks_land_on_routed_queues(self):
+        cases = {
+            "apps.notification.tasks.send_push_notification_async": QUEUE_PUSH,
+            "apps.notification.tasks.send_push_notification_batch": QUEUE_FANOUT,
+            "apps.notification.tasks.send_meeting_notifications": QUEUE_FANOUT,
+            "apps.notification.tasks.send_email_async": QUEUE_EMAIL,
+            "core.tasks.collect_orphan_images": QUEUE_MAINTENANCE,
+            "apps.board.tasks.generate_post_image_renditions": QUEUE_DEFAULT,
+        }
+        test_app = self.make_app()
+        with test_app.connection_for_write() as connection:
+            for name, queue in cases.items():
+                with self.subTest(task=name):
+                    test_app.send_task(name, connection=connection)
+                    with connection.SimpleQueue(queue, no_ack=True) as simple_queue:
+                        message = simple_queue.get(timeout=1)
+                    self.assertEqual(message.headers["task"], name)
+
+    def test_worker_profile_for_single_queue(self):
+        for queue, profile in WORKER_PROFILES.items():
+            with self.subTest(queue=queue):
+                worker = self.make_app().Worker(queues=[queue], pool_cls="solo", hostname=f"{queue}@test")
+                self.assertEqual(worker.concurrency, profile["concurrency"])
+                self.assertEqual(worker.app.conf.worker_prefetch_multiplier, profile["prefetch_multiplier"])
+
+    def test_worker_profile_skipped_for_multiple_queues(self):
+        test_app = self.make_app()
+        test_app.conf.worker_concurrency = 3
+        worker = test_app.Worker(queues=[QUEUE_PUSH, QUEUE_EMAIL], pool_cls="solo", hostname="mixed@test")
+
+        self.assertEqual(worker.concurrency, 3)
+
+
+class ProcessMetricsTests(SimpleTestCase):
+    def setUp(self):
+        keys = [metrics.PROCESSES_KEY, *(f"metrics:process:{pid}" for pid in (1, 2, 3))]
+        self.addCleanup(cache.delete_many, keys)
+
+    def test_expired_processes_are_pruned(self):
+        # pid 1, 3 은 지표가 만료된 (종료된) 워커
+        cache.set(metrics.PROCESSES_KEY, {1, 2, 3}, timeout=None)
+        cache.set("metrics:process:2", {"connections_created": 5}, metrics.PROCESS_STATS_TTL)
+
+        output = metrics.render_prometheus()
+
+        self.assertIn('kickit_db_connections_created{pid="2"} 5', output)
+        self.assertNotIn('pid="1"', output)
+        self.assertEqual(cache.get(metrics.PROCESSES_KEY), {2})
+
+
+class ManagedObjectPatternTests(SimpleTestCase):
+    def test_matches_uploaded_objects_and_renditions(self):
+        uuid = "0b7c6f7e-4c1e-4f55-9a53-5b8f0f2f8a11"
+        for path in (
+            f"{uuid}.jpg",
+            f"profile_images/{uuid}.png",
+            f"verification/{uuid}.webp",
+            f"renditions/{uuid}_feed.webp",
+            # 이전 폴더 방식 렌디션
+            f"renditions/{uuid}/thumbnail.webp",
+        ):
+            with self.subTest(path=path):
+                self.assertTrue(MANAGED_OBJECT_RE.match(path))
+
+    def test_ignores_other_objects(self):
+        for path in (
+            "default_images/Placeholder Image.webp",
+            "renditions/not-a-uuid_feed.webp",
+            "renditions/0b7c6f7e-4c1e-4f55-9a53-5b8f0f2f8a11_huge.webp",
+            "notes/0b7c6f7e-4c1e-4f55-9a53-5b8f0f2f8a11.jpg",
+        ):
+            with self.subTest(path=path):
+                self.assertIsNone(MANAGED_OBJECT_RE.match(path))
+
+
+class Model:
+    """
+    - 라우터 확인용 모델 대체 (인스턴스 힌트/ _DATABASE 만 사용)
+    """
+
+
+@mock.patch.object(replica, "print", create=True, new=lambda *args: None)
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    - 실제 복제본 없이 DATABASE_REPLICAS 와 지연 조회(replica_lag_seconds)를 대체해 라우팅만 확인
+    """
+
+    def setUp(self):
+        override = self.settings(DATABASE_REPLICAS=["replica"], REPLICA_MAX_LAG_SECONDS=5, REPLICA_LAG_CHECK_INTERVAL=5)
+        override.enable()
+        self.addCleanup(override.disable)
+        replica._lag_checks.clear()
+        self.addCleanup(replica._lag_checks.clear)
+        self.lag = 0.0
+        self.lag_queries = 0
+        patcher = mock.patch.object(replica, "replica_lag_seconds", self.replica_lag_seconds)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = 1000.0
+        patcher = mock.patch.object(replica.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.router = CustomRouter()
+
+    def replica_lag_seconds(self, alias):
+        self.lag_queries += 1
+        if isinstance(self.lag, Exception):
+            raise self.lag
+        return self.lag
+
+    def routing_state(self, replica_reads=True):
+        state = replica.RoutingState()
+        state.replica_reads = replica_reads
+        token = replica._routing_state.set(state)
+        self.addCleanup(replica._routing_state.reset, token)
+        return state
+
+    def test_outside_request_uses_primary(self):
+        self.assertEqual(self.router.db_for_read(Model), "default")
+        self.assertEqual(self.router.db_for_write(Model), "default")
+
+    def test_replica_reads_only_when_allowed(self):
+        state = self.routing_state(replica_reads=False)
+        self.assertEqual(self.router.db_for_read(Model), "default")
+
+        replica.allow_replica_reads()
+        self.assertEqual(self.router.db_for_read(Model), "replica")
+
+        # 쓰기 이후의 읽기는 primary (read-your-writes)
+        self.assertEqual(self.router.db_for_write(Model), "default")
+        self.assertTrue(state.wrote)
+        self.assertEqual(self.router.db_for_read(Model), "default")
+
+    def test_primary_reads_block(self):
+        state = self.routing_state()
+        with replica.primary_reads():
+            self.assertEqual(self.router.db_for_read(Model), "default")
+        self.assertTrue(state.replica_reads)
+        self.assertEqual(self.router.db_for_read(Model), "replica")
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        self.routing_state()
+        self.lag = 30.0
+        self.assertEqual(self.router.db_for_read(Model), "default")
+
+        # 확인 결과는 REPLICA_LAG_CHECK_INTERVAL 동안 재사용
+        self.lag = 0.0
+        self.now += 4
+        self.assertEqual(self.router.db_for_read(Model), "default")
+        self.assertEqual(self.lag_queries, 1)
+
+        self.now += 1
+        self.assertEqual(self.router.db_for_read(Model), "replica")
+        self.assertEqual(self.lag_queries, 2)
+
+    def test_connection_failure_is_cached_as_unusable(self):
+        self.lag = ConnectionError("replica is down")
+        for _ in range(3):
+            self.assertFalse(replica.replica_is_usable("replica"))
+        self.assertEqual(self.lag_queries, 1)
+        self.assertEqual(replica._lag_checks["replica"], (self.now, False))
+
+        self.lag = 0.0
+        self.now += settings.REPLICA_LAG_CHECK_INTERVAL
+        self.assertTrue(replica.replica_is_usable("replica"))
+        self.assertEqual(self.lag_queries, 2)
+
+    def test_pinned_user(self):
+        user = mock.Mock(pk=4321, is_authenticated=True)
+        self.addCleanup(cache.delete, replica._pin_key(user.pk))
+        self.assertFalse(replica.is_user_pinned(user))
+
+        replica.pin_user_to_primary(user.pk)
+
+        self.assertTrue(replica.is_user_pinned(user))
+        self.assertFalse(replica.is_user_pinned(mock.Mock(pk=4321, is_authenticated=False)))
+        self.assertFalse(replica.is_user_pinned(None))
+
+    def make_request(self, method, pk=1234):
+        request = getattr(RequestFactory(), method)("/")
+        request.user = mock.Mock(pk=pk, is_authenticated=True)
+        self.addCleanup(cache.delete, replica._pin_key(pk))
+        return request
+
+    def test_middleware_pins_user_after_write(self):
+        def get_response(request):
+            self.assertIsNotNone(replica.get_routing_state())
+            if request.method == "POST":
+                self.router.db_for_write(Model)
+            return "response"
+
+        middleware = replica.ReplicaRoutingMiddleware(get_response)
+        reader, writer = self.make_request("get", 1), self.make_request("post", 2)
+
+        self.assertEqual(middleware(reader), "response")
+        self.assertEqual(middleware(writer), "response")
+
+        self.assertFalse(replica.is_user_pinned(reader.user))
+        self.assertTrue(replica.is_user_pinned(writer.user))
+        self.assertIsNone(replica.get_routing_state())
+
+    async def test_async_middleware_pins_user_after_write(self):
+        async def get_response(request):
+            self.router.db_for_write(Model)
+            return "response"
+
+        middleware = replica.ReplicaRoutingMiddleware(get_response)
+        request = self.make_request("post")
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertEqual(await middleware(request), "response")
+        self.assertTrue(replica.is_user_pinned(request.user))
+
+
+@mock.patch("builtins.print")
+class FindOrphanImagesTests(LocalStorageMixin, TestCase):
+    """
+    - 유예 기간이 지난 시점(now)으로 버킷 전체를 정리 대상으로 보고 확인
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.later = timezone.now() + timedelta(days=2)
+        self.kept, self.orphan = (f"{uuid.uuid4()}.jpg" for _ in range(2))
+        for path in (self.kept, self.orphan, "default_images/Placeholder Image.webp"):
+            self.storage.save(path, b"image", "image/jpeg")
+        self.author = User.objects.create_user("orphan@example.com")
+        self.board = Board.objects.create(name="free")
+
+    def create_post(self, *urls):
+        Post.objects.create(board=self.board, author=self.author, author_nickname="orphan", content="post", images=list(urls))
+
+    def test_unreferenced_objects(self, _print):
+        self.create_post(self.storage.url(self.kept))
+
+        self.assertEqual(find_orphan_images(self.later), [self.orphan])
+
+    def test_aborts_without_references(self, _print):
+        self.assertEqual(find_orphan_images(self.later), [])
+
+    def test_aborts_when_urls_do_not_resolve(self, _print):
+        # 저장소 URL 설정이 바뀌어 DB 의 URL 대부분이 경로로 해석되지 않는 경우
+        self.create_post(self.storage.url(self.kept))
+        for _ in range(2):
+            self.create_post(f"https://old-project.supabase.co/storage/v1/object/public/kickit_bucket/{self.kept}")
+
+        self.assertEqual(find_orphan_images(self.later), [])
+        self.assertIn("정리 중단", _print.call_args.args[0])
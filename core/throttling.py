@@ -0,0 +1,134 @@
+import math
+import threading
+import time
+
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+# GCRA(token bucket 과 같은 결과): 키에는 "다음 요청이 허용되는 이론상 시각(TAT)" 하나만 저장
+# - 요청마다 TAT 를 interval(=기간/허용 수)만큼 미루고, TAT 가 지금보다 period 이상 앞서면 거부
+# - 읽기/판단/쓰기를 스크립트 하나로 실행 → Redis 왕복 1회, 여러 워커 동시 요청에도 원자적
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local wait = new_tat - period - now
+if wait > 0 then
+    return tostring(wait)
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return '0'
+"""
+
+# 기간 단위 (DRF 와 같은 표기: "30/min", "100/hour" 등 첫 글자만 봄)
+RATE_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_script = None
+_script_lock = threading.Lock()
+
+
+def parse_rate(rate):
+    """
+    - "횟수/기간" → (횟수, 기간 초), 제한 없음(None)이면 (None, None)
+    """
+    if rate is None:
+        return None, None
+    num, period = rate.split("/")
+    return int(num), RATE_PERIODS[period[0]]
+
+
+def _redis_take(backend, key, capacity, period):
+    """
+    - Redis 캐시: TOKEN_BUCKET_SCRIPT 실행 (EVALSHA 1회), 반환: 기다려야 할 초 (0 이면 허용)
+    """
+    global _script
+    key = backend.make_and_validate_key(key)
+    # Django RedisCache 에는 스크립트 실행 API 가 없어 내부 클라이언트를 직접 사용
+    client = backend._cache.get_client(key, write=True)
+    if _script is None:
+        with _script_lock:
+            if _script is None:
+                _script = client.register_script(TOKEN_BUCKET_SCRIPT)
+    wait = _script(keys=[key], args=[time.time(), period / capacity, period], client=client)
+    return float(wait)
+
+
+def _window_take(backend, key, capacity, period):
+    """
+    - Redis 가 아닌 캐시(로컬 개발의 locmem 등): 기간 단위 고정 창 카운터 (incr 1회)
+    - 창 경계에서 최대 2배까지 몰릴 수 있는 근사치
+    """
+    now = time.time()
+    window = int(now // period)
+    key = f"{key}:{window}"
+    try:
+        count = backend.incr(key)
+    except ValueError:
+        # 창의 첫 요청
+        if backend.add(key, 1, timeout=period):
+            count = 1
+        else:
+            count = backend.incr(key)
+    if count <= capacity:
+        return 0.0
+    return (window + 1) * period - now
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    - 공유 캐시 기반 token bucket 스로틀 (기간 안에 최대 '횟수'만큼 몰아서 요청 가능, 이후 일정 간격으로 회복)
+    - 범위(scope)는 뷰의 throttle_scope, 비율은 REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'][scope]
+    - throttle_scope 가 없거나 None 인 뷰/요청은 제한하지 않음 (뷰에서 property 로 메서드/파라미터별 지정 가능)
+    - 로그인 사용자는 사용자별, 아니면 IP 별로 계산
+    - 캐시 장애 시에는 요청을 막지 않음
+    """
+    cache_format = "throttle:{scope}:{ident}"
+
+    def __init__(self):
+        self._wait = None
+
+    def get_rate(self, scope):
+        try:
+            return api_settings.DEFAULT_THROTTLE_RATES[scope]
+        except KeyError:
+            raise ImproperlyConfigured(f"No default throttle rate set for '{scope}' scope")
+
+    def get_cache_key(self, request, scope):
+        if request.user and request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{self.get_ident(request)}"
+        return self.cache_format.format(scope=scope, ident=ident)
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return True
+        capacity, period = parse_rate(self.get_rate(scope))
+        if capacity is None:
+            return True
+
+        key = self.get_cache_key(request, scope)
+        backend = caches["default"]
+        take = _redis_take if isinstance(backend, RedisCache) else _window_take
+        try:
+            wait = take(backend, key, capacity, period)
+        except Exception as e:
+            print(f"[WARNING] 요청 제한 확인 실패 ({scope}): {e}")
+            return True
+
+        if wait > 0:
+            self._wait = wait
+            return False
+        return True
+
+    def wait(self):
+        return math.ceil(self._wait) if self._wait else None
@@ -0,0 +1,78 @@
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+_hot_endpoints = {}
+_hot_lock = threading.Lock()
+
+
+def mark_hot(endpoint):
+    """
+    - 느리거나 5xx 를 낸 엔드포인트를 SENTRY_TRACES_BOOST_SECONDS 동안 높은 비율로 추적
+    - 샘플링은 요청 시작 시 정해지므로 같은 요청은 못 잡지만, 이후 요청의 트레이스로 원인을 확인
+    - (에러 이벤트 자체는 트레이스 샘플링과 무관하게 항상 전송됨)
+    """
+    with _hot_lock:
+        _hot_endpoints[endpoint] = time.monotonic() + settings.SENTRY_TRACES_BOOST_SECONDS
+
+
+def _is_hot(endpoint):
+    expires = _hot_endpoints.get(endpoint)
+    if expires is None:
+        return False
+    if expires < time.monotonic():
+        with _hot_lock:
+            _hot_endpoints.pop(endpoint, None)
+        return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _endpoint_for_path(path):
+    """
+    - 요청 경로 → URL 이름 (core.metrics 의 endpoint 라벨과 같은 값), 없으면 None
+    """
+    try:
+        return resolve(path).view_name
+    except Resolver404:
+        return None
+
+
+def _request_path(sampling_context):
+    environ = sampling_context.get("wsgi_environ")
+    if environ is not None:
+        return environ.get("PATH_INFO")
+    scope = sampling_context.get("asgi_scope")
+    if scope is not None:
+        return scope.get("path")
+    return None
+
+
+def traces_sampler(sampling_context):
+    """
+    - sentry_sdk.init(traces_sampler=...) 용 트레이스 샘플링 비율
+    - 우선순위: 상위 트레이스 결정 → SENTRY_TRACES_ENDPOINT_RATES(URL 이름/태스크 이름)
+      → 최근 느렸던/5xx 엔드포인트(SENTRY_TRACES_BOOSTED_RATE) → 기본 비율(요청/Celery 태스크)
+    """
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+
+    overrides = settings.SENTRY_TRACES_ENDPOINT_RATES
+
+    celery_job = sampling_context.get("celery_job")
+    if celery_job is not None:
+        return overrides.get(celery_job.get("task"), settings.SENTRY_TRACES_CELERY_RATE)
+
+    path = _request_path(sampling_context)
+    endpoint = _endpoint_for_path(path) if path else None
+    if endpoint is None:
+        return settings.SENTRY_TRACES_SAMPLE_RATE
+    if endpoint in overrides:
+        return overrides[endpoint]
+    if _is_hot(endpoint):
+        return settings.SENTRY_TRACES_BOOSTED_RATE
+    return settings.SENTRY_TRACES_SAMPLE_RATE
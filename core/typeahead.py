@@ -0,0 +1,111 @@
+import threading
+from bisect import bisect_left
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+
+from .reference_data import get_version
+
+DEFAULT_TYPEAHEAD_LIMIT = 10
+MAX_TYPEAHEAD_LIMIT = 50
+
+
+def normalize(text):
+    """
+    - 대소문자/연속 공백 차이를 없앤 검색용 문자열
+    """
+    return " ".join((text or "").casefold().split())
+
+
+class TypeaheadIndex:
+    """
+    - (id, 이름) 목록으로 만드는 메모리 검색 인덱스 (정렬 배열 + 이분 탐색)
+    - 순위: 1) 이름 전체의 접두어 2) 단어 시작 접두어 3) 그 외 부분 문자열(infix)
+    - 각 단계는 정렬된 접미사 배열에서 이분 탐색 후 limit 개만 읽으므로 목록 크기와 무관하게 빠름
+    """
+
+    def __init__(self, entries):
+        self.names = {}
+        tiers = ([], [], [])
+        for entry_id, name in entries:
+            self.names[entry_id] = name
+            key = normalize(name)
+            for start in range(len(key)):
+                if start == 0:
+                    tier = 0
+                elif key[start - 1] in " -(/,.'":
+                    tier = 1
+                else:
+                    tier = 2
+                tiers[tier].append((key[start:], key, entry_id))
+        for tier in tiers:
+            tier.sort()
+        self._tiers = tiers
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query, limit=DEFAULT_TYPEAHEAD_LIMIT):
+        """
+        - 대소문자 무시 접두어/부분 문자열 검색, [(id, 이름)] 최대 limit 개
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        found = []
+        seen = set()
+        for tier in self._tiers:
+            index = bisect_left(tier, (query,))
+            while index < len(tier) and len(found) < limit:
+                suffix, _, entry_id = tier[index]
+                if not suffix.startswith(query):
+                    break
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    found.append((entry_id, self.names[entry_id]))
+                index += 1
+            if len(found) >= limit:
+                break
+        return found
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_typeahead_index(name, build_entries):
+    """
+    - 이름별 인덱스 반환 (프로세스 메모리)
+    - reference_data 의 버전 스탬프를 그대로 사용 → 같은 테이블의 목록 캐시와 함께 무효화
+    - build_entries(): [(id, 이름), ...] (DB 조회는 다시 만들 때만)
+    """
+    version = get_version(name)
+    cached = _indexes.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _lock:
+        cached = _indexes.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        index = TypeaheadIndex(build_entries())
+        _indexes[name] = (version, index)
+        return index
+
+
+def trigram_matches(queryset, field, query, limit, exclude_ids=()):
+    """
+    - Postgres pg_trgm 단어 유사도 검색 (오타 등 메모리 인덱스에 없는 결과 보충)
+    - `<%` 연산자(field__trigram_word_similar)라 trigram GIN 인덱스를 사용
+    - 반환: [(id, 이름)] 유사도 높은 순
+    """
+    if limit <= 0 or connections[queryset.db].vendor != "postgresql":
+        return []
+    return list(
+        queryset.filter(**{f"{field}__trigram_word_similar": query})
+        .exclude(pk__in=list(exclude_ids))
+        .annotate(similarity=TrigramWordSimilarity(query, field))
+        .order_by("-similarity", field)
+        .values_list("pk", field)[:limit]
+    )
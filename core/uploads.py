@@ -0,0 +1,317 @@
+import asyncio
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+from .images import clean_original
+from .storage import get_image_storage
+
+
+class UploadPolicy(NamedTuple):
+    """
+    - 업로드 허용 규칙
+    - allowed_extensions: 소문자 확장자 집합
+    - max_size: 파일당 최대 바이트
+    - prefix: 저장소 경로 접두사 (예: "profile_images/")
+    """
+    allowed_extensions: frozenset
+    max_size: int
+    prefix: str = ""
+
+
+# 앱별 업로드 규칙 (휴대폰 원본 사진 기준 파일당 10MB)
+# 게시글 이미지: JPG, PNG, GIF, WEBP
+POST_IMAGE_POLICY = UploadPolicy(frozenset({"jpg", "jpeg", "png", "gif", "webp"}), 10 * 1024 * 1024)
+# 모임 썸네일: JPG, PNG, WEBP
+MEETING_IMAGE_POLICY = UploadPolicy(frozenset({"jpg", "jpeg", "png", "webp"}), 10 * 1024 * 1024)
+# 프로필 이미지는 `profile_images/` 경로에 저장
+PROFILE_IMAGE_POLICY = UploadPolicy(
+    frozenset({"jpg", "jpeg", "png", "webp"}),
+    10 * 1024 * 1024,
+    prefix="profile_images/",
+)
+# 유학생 인증 사진: JPG, PNG, WEBP / 파일당 5MB
+VERIFICATION_IMAGE_POLICY = UploadPolicy(
+    frozenset({"jpg", "jpeg", "png", "webp"}),
+    5 * 1024 * 1024,
+    prefix="verification/",
+)
+
+# 실제 파일 형식 → (저장할 확장자, 같은 형식으로 보는 확장자들)
+IMAGE_FORMATS = {
+    "image/jpeg": ("jpg", frozenset({"jpg", "jpeg"})),
+    "image/png": ("png", frozenset({"png"})),
+    "image/gif": ("gif", frozenset({"gif"})),
+    "image/webp": ("webp", frozenset({"webp"})),
+}
+
+
+class UploadResult(NamedTuple):
+    """
+    - 파일 하나의 업로드 결과 (성공: url, 실패: error)
+    """
+    name: str
+    url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.url is not None
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# 비동기 뷰가 미리 올려 둔 업로드 {id(파일 객체): (파일 객체, UploadResult)}
+# (sync_to_async 로 실행되는 뷰 코드에도 contextvar 가 전달됨)
+_prefetched_uploads = ContextVar("prefetched_uploads", default=None)
+
+
+def _get_executor():
+    """
+    - 프로세스 전체에서 공유하는 업로드 스레드 풀 (동시 업로드 수 상한)
+    - 처음 사용할 때 생성 → fork 이전(import 시점)에 스레드를 만들지 않음
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_UPLOAD_MAX_WORKERS,
+                    thread_name_prefix="image-upload",
+                )
+    return _executor
+
+
+def _extension(django_file):
+    name = django_file.name or ""
+    return name.rsplit(".", 1)[-1].lower() if "." in name else ""
+
+
+def sniff_content_type(django_file):
+    """
+    - 파일 앞부분(시그니처)으로 실제 이미지 형식 판별, 모르는 형식이면 None
+    - 파일 이름/클라이언트가 보낸 Content-Type 은 믿지 않음
+    """
+    django_file.seek(0)
+    head = django_file.read(12)
+    django_file.seek(0)
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def validate_upload(django_file, policy):
+    """
+    - 확장자/크기 검증 후 파일 앞부분만 읽어 실제 형식이 허용 목록에 있는지 확인
+    - 문제 없으면 None, 있으면 에러 메시지
+    """
+    ext = _extension(django_file)
+    allowed = policy.allowed_extensions
+    if ext not in allowed:
+        return f"Unsupported file format: {django_file.name} (allowed: {', '.join(sorted(allowed)).upper()})"
+    if django_file.size > policy.max_size:
+        return f"File size cannot exceed {policy.max_size // (1024 * 1024)}MB: {django_file.name}"
+    content_type = sniff_content_type(django_file)
+    if content_type is None or not IMAGE_FORMATS[content_type][1] & allowed:
+        return f"File content is not a supported image: {django_file.name}"
+    return None
+
+
+def validate_uploads(django_files, policy):
+    """
+    - 여러 파일 검증, 에러 메시지 목록 반환 (모두 통과하면 [])
+    """
+    errors = []
+    for django_file in django_files:
+        error = validate_upload(django_file, policy)
+        if error:
+            errors.append(error)
+    return errors
+
+
+def _storage_path(django_file, policy):
+    # 확장자/Content-Type 은 파일 이름이 아니라 실제 내용 기준 (validate_upload 를 통과한 파일만 들어옴)
+    mime_type = sniff_content_type(django_file)
+    storage_path = f"{policy.prefix}{uuid.uuid4()}.{IMAGE_FORMATS[mime_type][0]}"
+    return storage_path, mime_type
+
+
+def _read(django_file):
+    # 미리 업로드한 뒤에도 뷰의 검증(ImageField 등)이 처음부터 읽을 수 있도록 위치를 되돌림
+    django_file.seek(0)
+    data = django_file.read()
+    django_file.seek(0)
+    return data
+
+
+def _temporary_path(django_file):
+    # 큰 파일(FILE_UPLOAD_MAX_MEMORY_SIZE 초과)은 Django 가 디스크 임시 파일(TemporaryUploadedFile)에 받아 둠
+    if hasattr(django_file, "temporary_file_path"):
+        return django_file.temporary_file_path()
+    return None
+
+
+def _upload_payload(django_file, mime_type):
+    """
+    - 저장소에 올릴 (데이터, content-type)
+    - 메타데이터(EXIF/GPS 등)가 있거나 너무 큰 원본은 올리기 전에 정리 → 공개 URL 에 위치 정보가 남는 시간이 없음
+    - 정리할 필요가 없는 임시 파일은 경로를 넘겨 저장소가 스트리밍 (메모리에 전부 읽지 않음)
+    """
+    data = _temporary_path(django_file) or _read(django_file)
+    cleaned = clean_original(data)
+    if cleaned is not None:
+        mime_type, data = cleaned
+    return data, mime_type
+
+
+def _upload_one(django_file, policy):
+    storage_path, mime_type = _storage_path(django_file, policy)
+    data, mime_type = _upload_payload(django_file, mime_type)
+    url = get_image_storage().save(storage_path, data, mime_type)
+    return UploadResult(django_file.name, url=url)
+
+
+async def _upload_one_async(django_file, policy, semaphore):
+    storage_path, mime_type = _storage_path(django_file, policy)
+    async with semaphore:
+        # 디코딩/재인코딩은 스레드에서 (이벤트 루프를 막지 않음)
+        data, mime_type = await asyncio.to_thread(_upload_payload, django_file, mime_type)
+        url = await get_image_storage().asave(storage_path, data, mime_type)
+    return UploadResult(django_file.name, url=url)
+
+
+def upload_files(django_files, policy):
+    """
+    - 여러 파일을 스레드 풀에서 동시에 업로드
+    - 검증에 실패한 파일은 업로드하지 않음
+    - 반환: 입력 순서와 같은 UploadResult 목록 (일부 실패 시에도 나머지 결과는 유지)
+    """
+    django_files = list(django_files)
+    results = [None] * len(django_files)
+    prefetched = _prefetched_uploads.get()
+
+    pending = []
+    for index, django_file in enumerate(django_files):
+        if prefetched and id(django_file) in prefetched:
+            # 비동기 뷰에서 이미 올린 파일
+            results[index] = prefetched.pop(id(django_file))[1]
+            continue
+        error = validate_upload(django_file, policy)
+        if error:
+            results[index] = UploadResult(django_file.name, error=error)
+        else:
+            pending.append(index)
+
+    if len(pending) <= 1:
+        # 한 장이면 스레드 풀을 거치지 않음
+        futures = {}
+    else:
+        executor = _get_executor()
+        futures = {
+            index: executor.submit(_upload_one, django_files[index], policy)
+            for index in pending
+        }
+
+    for index in pending:
+        django_file = django_files[index]
+        try:
+            if index in futures:
+                results[index] = futures[index].result()
+            else:
+                results[index] = _upload_one(django_file, policy)
+        except Exception as e:
+            print(f"[WARNING] 이미지 업로드 실패 ({django_file.name}): {e}")
+            results[index] = UploadResult(django_file.name, error="Image upload failed.")
+
+    return results
+
+
+def uploaded_urls(results):
+    """
+    - 성공한 업로드의 URL만 (입력 순서 유지)
+    """
+    return [result.url for result in results if result.ok]
+
+
+def upload_errors(results):
+    """
+    - 실패한 업로드의 {"name", "error"} 목록 (응답/로그용)
+    """
+    return [
+        {"name": result.name, "error": result.error}
+        for result in results if not result.ok
+    ]
+
+
+def discard_uploads(results):
+    """
+    - 성공한 업로드를 저장소에서 삭제 (요청 전체를 실패 처리할 때 정리용)
+    """
+    storage = get_image_storage()
+    paths = [storage.path_from_url(url) for url in uploaded_urls(results)]
+    try:
+        storage.delete([path for path in paths if path])
+    except Exception as e:
+        print(f"[WARNING] 업로드 정리 실패: {e}")
+
+
+async def upload_files_async(django_files, policy):
+    """
+    - upload_files() 의 비동기 버전: 이벤트 루프에서 동시에 업로드 (동시 업로드 수 상한 동일)
+    - 반환 형식/실패 처리는 upload_files() 와 같음
+    """
+    django_files = list(django_files)
+    results = [None] * len(django_files)
+    semaphore = asyncio.Semaphore(settings.IMAGE_UPLOAD_MAX_WORKERS)
+
+    pending = []
+    for index, django_file in enumerate(django_files):
+        error = validate_upload(django_file, policy)
+        if error:
+            results[index] = UploadResult(django_file.name, error=error)
+        else:
+            pending.append(index)
+
+    outcomes = await asyncio.gather(
+        *(_upload_one_async(django_files[index], policy, semaphore) for index in pending),
+        return_exceptions=True,
+    )
+    for index, outcome in zip(pending, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"[WARNING] 이미지 업로드 실패 ({django_files[index].name}): {outcome}")
+            outcome = UploadResult(django_files[index].name, error="Image upload failed.")
+        results[index] = outcome
+    return results
+
+
+async def prefetch_uploads(django_files, policy):
+    """
+    - 검증을 통과한 파일을 미리 비동기로 업로드
+    - 반환: {id(파일 객체): (파일 객체, UploadResult)} → use_prefetched_uploads() 로 뷰 코드에 전달
+    - 검증 실패 파일은 올리지 않음 (뷰의 upload_files() 가 기존대로 에러 처리)
+    """
+    django_files = [f for f in django_files if validate_upload(f, policy) is None]
+    results = await upload_files_async(django_files, policy)
+    return {id(f): (f, result) for f, result in zip(django_files, results)}
+
+
+def use_prefetched_uploads(prefetched):
+    """
+    - 이후 upload_files() 가 prefetched 결과를 재사용하도록 설정, reset 용 토큰 반환
+    """
+    return _prefetched_uploads.set(prefetched)
+
+
+def reset_prefetched_uploads(token):
+    _prefetched_uploads.reset(token)
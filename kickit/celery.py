@@ -1,8 +1,57 @@
 import os
-from celery import Celery
+from celery import Celery, signals
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kickit.settings')
 
 app = Celery('kickit')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+# 큐 (우선순위별로 분리 → 대량 알림/정리 작업이 실시간 푸시와 인증 메일을 밀어내지 않음)
+# - push: 사용자 한 명에게 바로 가는 푸시
+# - fanout: 여러 사용자 대상 알림 생성/묶음 푸시, 대량 행 갱신
+# - email: 인증/비밀번호 재설정 메일
+# - maintenance: 저장소 정리, 토큰 정리, 탈퇴 후처리 등 느려도 되는 작업
+# - celery(기본): 그 외 (이미지 렌디션, 검색 기록 등)
+QUEUE_PUSH = 'push'
+QUEUE_FANOUT = 'fanout'
+QUEUE_EMAIL = 'email'
+QUEUE_MAINTENANCE = 'maintenance'
+QUEUE_DEFAULT = 'celery'
+TASK_QUEUES = (QUEUE_PUSH, QUEUE_FANOUT, QUEUE_EMAIL, QUEUE_MAINTENANCE, QUEUE_DEFAULT)
+
+app.conf.task_routes = {
+    'apps.notification.tasks.send_push_notification_async': {'queue': QUEUE_PUSH},
+    'apps.notification.tasks.send_push_notification_batch': {'queue': QUEUE_FANOUT},
+    'apps.notification.tasks.send_meeting_notifications': {'queue': QUEUE_FANOUT},
+    'apps.account.tasks.propagate_nickname_change': {'queue': QUEUE_FANOUT},
+    'apps.notification.tasks.send_email_async': {'queue': QUEUE_EMAIL},
+    'apps.account.tasks.run_account_deactivation': {'queue': QUEUE_MAINTENANCE},
+    'apps.account.tasks.compact_outstanding_tokens': {'queue': QUEUE_MAINTENANCE},
+    'core.tasks.delete_storage_objects': {'queue': QUEUE_MAINTENANCE},
+    'core.tasks.collect_orphan_images': {'queue': QUEUE_MAINTENANCE},
+}
+
+# 큐별 워커 설정 (워커를 `-Q <큐>` 하나로 실행하면 적용, -c/--prefetch-multiplier 를 주면 그 값 우선)
+# - push/email: 짧은 I/O 작업, 한 번에 하나씩만 가져와 대기 중인 태스크가 한 워커에 묶이지 않도록
+# - fanout/maintenance: 오래 걸리는 작업, 동시 실행 수를 낮게 제한
+WORKER_PROFILES = {
+    QUEUE_PUSH: {'concurrency': 8, 'prefetch_multiplier': 1},
+    QUEUE_FANOUT: {'concurrency': 2, 'prefetch_multiplier': 1},
+    QUEUE_EMAIL: {'concurrency': 2, 'prefetch_multiplier': 1},
+    QUEUE_MAINTENANCE: {'concurrency': 1, 'prefetch_multiplier': 1},
+    QUEUE_DEFAULT: {'concurrency': 4, 'prefetch_multiplier': 2},
+}
+
+
+@signals.celeryd_init.connect
+def apply_worker_profile(sender=None, conf=None, options=None, **kwargs):
+    """
+    - 워커 시작 시 담당 큐의 동시 실행 수/prefetch 적용
+    """
+    queues = options.get('queues') or [conf.task_default_queue]
+    if len(queues) != 1 or queues[0] not in WORKER_PROFILES:
+        return
+    profile = WORKER_PROFILES[queues[0]]
+    conf.worker_concurrency = profile['concurrency']
+    conf.worker_prefetch_multiplier = profile['prefetch_multiplier']
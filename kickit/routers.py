@@ -1,9 +1,36 @@
+from django.conf import settings
+from django.db import connections
+
+from core.replica import choose_replica, get_routing_state, mark_write
+
+
 class CustomRouter(object):
+    """
+    - 쓰기는 항상 primary(default)
+    - 읽기는 ReplicaReadMixin 뷰의 GET 요청에서만 복제본(settings.DATABASE_REPLICAS)
+      (요청 안에서 쓰기 이후, 최근 쓰기 유저, 트랜잭션 안, 복제본 지연 초과 시에는 primary)
+    - 모델에 _DATABASE 가 있으면 그 DB 고정
+    """
 
     def db_for_read(self, model, **hints):
-        return getattr(model, "_DATABASE", "default")
+        database = getattr(model, "_DATABASE", None)
+        if database:
+            return database
+
+        state = get_routing_state()
+        if state is None or not state.replica_reads or state.wrote:
+            return "default"
+        # 열린 트랜잭션 안의 읽기는 같은 연결에서 (쓰기 직전 select 등)
+        if connections["default"].in_atomic_block:
+            return "default"
+
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return choose_replica() or "default"
 
     def db_for_write(self, model, **hints):
+        mark_write()
         return getattr(model, "_DATABASE", "default")
 
     def allow_relation(self, obj1, obj2, **hints):
@@ -11,11 +38,12 @@ class CustomRouter(object):
         Relations between objects are allowed if both objects are
         in the master/slave pool.
         """
-        db_list = ('default', 'remote')
+        db_list = ('default', 'remote', *settings.DATABASE_REPLICAS)
         return obj1._state.db in db_list and obj2._state.db in db_list
 
     def allow_migrate(self, db, app_label, model_name=None, **hints):
         """
         All non-auth models end up in this pool.
+        복제본은 primary 를 그대로 복제하므로 마이그레이션하지 않음
         """
-        return True
\ No newline at end of file
+        return db not in settings.DATABASE_REPLICAS
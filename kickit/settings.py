@@ -17,10 +17,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 import os, environ
 import json
-import boto3
-from firebase_admin import credentials, initialize_app
-from botocore.exceptions import ClientError
 import sentry_sdk
+from celery.schedules import crontab
+from core.db import database_settings
+from core.tracing import traces_sampler
 
 env = environ.Env(
     DEBUG=(bool, True)
@@ -30,11 +30,12 @@ environ.Env.read_env(
     env_file=os.path.join(BASE_DIR, '.env')
 )
 
-import firebase_admin
-from firebase_admin import credentials
-
 GOOGLE_APPLICATION_CREDENTIALS = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
 
+# Google 로그인 ID Token 검증 (JWKS URL 은 로컬 테스트용 대체 서버로 바꿀 수 있음)
+GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID')
+GOOGLE_JWKS_URL = os.environ.get('GOOGLE_JWKS_URL', 'https://www.googleapis.com/oauth2/v3/certs')
+
 
 # FIREBASE_CREDENTIALS_PATH = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "kickit/snulife-international-firebase-adminsdk-fbsvc-44bb43dfba.json")
 # cred = credentials.Certificate(FIREBASE_CREDENTIALS_PATH)
@@ -73,28 +74,7 @@ AWS_REGION      = os.environ.get("AWS_REGION")
 FIREBASE_SECRET = os.environ.get("FIREBASE_SECRET_NAME")
 FIREBASE_PATH   = "/etc/secrets/firebase.json"
 
-def init_firebase():
-    # 1) 로컬에 파일이 있으면 먼저 시도
-    if os.path.exists(FIREBASE_PATH):
-        try:
-            cred = credentials.Certificate(FIREBASE_PATH)
-            initialize_app(cred)
-            print("Firebase initialized from file")
-            return
-        except Exception as e:
-            print("Firebase file init failed:", e)
-    # 2) 없거나 실패하면 Secrets Manager에서 가져오기
-    try:
-        client = boto3.client("secretsmanager", region_name=AWS_REGION)
-        resp   = client.get_secret_value(SecretId=FIREBASE_SECRET)
-        secret_dict = json.loads(resp["SecretString"])
-        cred = credentials.Certificate(secret_dict)
-        initialize_app(cred)
-        print("Firebase initialized from Secrets Manager")
-    except ClientError as e:
-        print("Firebase secret init failed:", e)
-
-init_firebase()
+# Firebase/boto3/Supabase 클라이언트는 처음 사용할 때 생성 (core/clients.py)
 
 # def get_firebase_creds():
 #     session = boto3.session.Session()
@@ -115,25 +95,79 @@ init_firebase()
 # except Exception as e:
 #     print("Failed to initialize Firebase Admin:", e)
 
+# Sentry 트레이스 샘플링 (core/tracing.py, 비율별 오버헤드 측정: python manage.py measure_tracing_overhead)
+# - 기본 비율은 낮게, 최근 느렸던/5xx 엔드포인트는 SENTRY_TRACES_BOOST_SECONDS 동안 높은 비율
+# - SENTRY_TRACES_ENDPOINT_RATES: URL 이름 또는 Celery 태스크 이름별 비율 (JSON 으로 덮어쓰기)
+SENTRY_TRACES_SAMPLE_RATE = float(os.environ.get('SENTRY_TRACES_SAMPLE_RATE', 0.05))
+SENTRY_TRACES_BOOSTED_RATE = float(os.environ.get('SENTRY_TRACES_BOOSTED_RATE', 0.5))
+SENTRY_TRACES_BOOST_SECONDS = int(os.environ.get('SENTRY_TRACES_BOOST_SECONDS', 300))
+SENTRY_TRACES_CELERY_RATE = float(os.environ.get('SENTRY_TRACES_CELERY_RATE', 0.01))
+SENTRY_TRACES_ENDPOINT_RATES = {
+    # 업로드/생성 경로는 외부 저장소 호출이 있어 더 자주 추적
+    'post-list-create': 0.2,
+    'meeting-create': 0.2,
+    'user-signup': 0.2,
+    # 상태 확인/지표 수집은 추적하지 않음
+    'metrics': 0.0,
+    'kickit.urls.index': 0.0,
+    **json.loads(os.environ.get('SENTRY_TRACES_ENDPOINT_RATES', '{}')),
+}
+
 sentry_sdk.init(
     dsn=os.environ.get("SENTRY_DSN", ""), 
-    traces_sample_rate=1.0, 
+    traces_sampler=traces_sampler,
     send_default_pii=True,
 )
 
-CELERY_BROKER_URL = 'sqs://'
+# 브로커: 운영은 SQS, 로컬/테스트는 CELERY_BROKER_URL=redis://localhost:6379/1 또는 memory:// 로 대체
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'sqs://')
 
-CELERY_BROKER_TRANSPORT_OPTIONS = {
-    'region': 'ap-northeast-2',
-    'predefined_queues': {
-        'celery': {
-            'url': 'https://sqs.ap-northeast-2.amazonaws.com/717279717583/celery',
-            'access_key_id': SUPABASE_AWS_ACCESS_KEY_ID,
-            'secret_access_key': SUPABASE_AWS_SECRET_ACCESS_KEY,
+# 큐별 라우팅/워커 설정은 kickit/celery.py (SQS 에는 같은 이름의 큐가 있어야 함)
+CELERY_QUEUE_NAMES = ('celery', 'push', 'fanout', 'email', 'maintenance')
+SQS_QUEUE_URL_PREFIX = os.environ.get(
+    'SQS_QUEUE_URL_PREFIX', 'https://sqs.ap-northeast-2.amazonaws.com/717279717583/'
+)
+
+if CELERY_BROKER_URL.startswith('sqs://'):
+    CELERY_BROKER_TRANSPORT_OPTIONS = {
+        'region': 'ap-northeast-2',
+        # 작업 완료 후 ack(acks_late) 하므로 가장 오래 걸리는 태스크보다 길게 (초과하면 다른 워커가 다시 받음)
+        'visibility_timeout': int(os.environ.get('SQS_VISIBILITY_TIMEOUT', 900)),
+        'predefined_queues': {
+            name: {
+                'url': f'{SQS_QUEUE_URL_PREFIX}{name}',
+                'access_key_id': SUPABASE_AWS_ACCESS_KEY_ID,
+                'secret_access_key': SUPABASE_AWS_SECRET_ACCESS_KEY,
+            }
+            for name in CELERY_QUEUE_NAMES
         }
     }
-}
+else:
+    # memory:// 등 폴링 방식 브로커의 기본 간격(1초)은 큐 대기 시간 측정을 가림
+    CELERY_BROKER_TRANSPORT_OPTIONS = {'polling_interval': 0.05}
 CELERY_TASK_DEFAULT_QUEUE = 'celery'
+# 결과를 쓰는 곳이 없으므로 저장하지 않음
+CELERY_TASK_IGNORE_RESULT = True
+# 태스크가 끝난 뒤 ack → 워커가 중간에 죽으면 다른 워커가 다시 실행 (태스크는 재실행해도 안전하게 작성)
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# 주기 작업 (Procfile 의 beat 프로세스가 실행)
+CELERY_BEAT_SCHEDULE = {
+    'collect-orphan-images': {
+        'task': 'core.tasks.collect_orphan_images',
+        'schedule': crontab(hour=4, minute=0),
+    },
+    'compact-outstanding-tokens': {
+        'task': 'apps.account.tasks.compact_outstanding_tokens',
+        'schedule': crontab(hour=4, minute=30),
+    },
+}
+
+# Cache (예: CACHE_URL=redis://host:6379/0, 미설정 시 프로세스 로컬 메모리)
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = False
@@ -150,6 +184,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # External
     "rest_framework",
     'rest_framework_simplejwt',
@@ -162,17 +197,21 @@ INSTALLED_APPS = [
     'apps.settings_app',
     'fcm_django',
     'apps.firebase',
-    'apps.meetup'
+    'apps.meetup',
+    'core',
 ]
 
 MIDDLEWARE = [
+    'core.metrics.RequestMetricsMiddleware',
+    'core.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.static.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.replica.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -224,23 +263,79 @@ port = os.environ.get('SUPABASE_PORT')
 #     }
 # }
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': name,
-        'USER': user,
-        'PASSWORD': pw, 
-        'HOST': host,
-        'PORT': port,
-        'CERT' : 'kickit.prod-ca-2021.crt',
+# DB 연결 방식: pool(기본, psycopg3 연결 풀) | persistent(연결 유지) | pgbouncer(트랜잭션 모드 풀러)
+# - ASGI 에서는 요청마다 스레드가 달라 Django 연결 유지(CONN_MAX_AGE)가 재사용되지 않음
+#   → pool, 또는 pgbouncer + DB_CONN_MAX_AGE=0 사용
+# (core/db.py 참고, 연결 지연 측정: python manage.py db_latency_probe)
+DB_CONNECTION_PROFILE = os.environ.get('DB_CONNECTION_PROFILE', 'pool')
+
+DATABASE_BASE = {
+    'ENGINE': 'django.db.backends.postgresql',
+    'NAME': name,
+    'USER': user,
+    'PASSWORD': pw, 
+    'HOST': host,
+    'PORT': port,
+    'CERT' : 'kickit.prod-ca-2021.crt',
+    'OPTIONS': {
+        'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
     },
 }
+DATABASE_CONNECTION_OPTIONS = {
+    'conn_max_age': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+    'pool_min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+    'pool_max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+    'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+}
+
+DATABASES = {
+    'default': database_settings(DB_CONNECTION_PROFILE, DATABASE_BASE, **DATABASE_CONNECTION_OPTIONS),
+}
+
+# 읽기 복제본 (SUPABASE_REPLICA_HOST 설정 시 피드/검색/목록 조회를 복제본으로, core/replica.py 참고)
+DATABASE_REPLICAS = []
+replica_host = os.environ.get('SUPABASE_REPLICA_HOST')
+if replica_host:
+    DATABASES['replica'] = database_settings(
+        DB_CONNECTION_PROFILE,
+        {
+            **DATABASE_BASE,
+            'HOST': replica_host,
+            'PORT': os.environ.get('SUPABASE_REPLICA_PORT', port),
+            'TEST': {'MIRROR': 'default'},
+        },
+        **DATABASE_CONNECTION_OPTIONS,
+    )
+    DATABASE_REPLICAS.append('replica')
+# 복제 지연이 이 값(초)을 넘으면 primary 에서 읽음 (확인 결과는 REPLICA_LAG_CHECK_INTERVAL 초 동안 재사용)
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 5))
+REPLICA_LAG_CHECK_INTERVAL = 5
+# 쓰기 후 같은 유저의 읽기를 primary 에 고정하는 시간(초)
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 10))
+
+# 요청 지표 (core/metrics.py): GET /metrics/ 는 METRICS_TOKEN 으로 보호 (미설정 시 비활성)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+# 이 시간(초) 이상 걸린 요청은 로그로 남김
+METRICS_SLOW_REQUEST_SECONDS = float(os.environ.get('METRICS_SLOW_REQUEST_SECONDS', 1.0))
+# 한 요청에서 같은 SQL 이 이 횟수 이상 실행되면 N+1 의심 로그
+METRICS_N_PLUS_ONE_THRESHOLD = int(os.environ.get('METRICS_N_PLUS_ONE_THRESHOLD', 10))
+# 워커 메모리의 지표를 공유 캐시에 반영하는 주기(초)
+METRICS_FLUSH_INTERVAL = 10
 DATABASE_ROUTERS = ['kickit.routers.CustomRouter']
 
 # Static & Media
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# 이미지 저장소 ('supabase' | 'local': MEDIA_ROOT 에 저장, 개발/테스트용)
+IMAGE_STORAGE_BACKEND = os.environ.get('IMAGE_STORAGE_BACKEND', 'supabase')
+# 요청 안에서 이미지를 동시에 업로드할 스레드 수 (프로세스 전체 공유)
+IMAGE_UPLOAD_MAX_WORKERS = int(os.environ.get('IMAGE_UPLOAD_MAX_WORKERS', 8))
+# 저장소 호출이 일시적 오류(연결 실패/타임아웃/5xx/429)로 실패할 때 총 시도 횟수, 첫 재시도 대기(초, 시도마다 2배)
+STORAGE_RETRY_ATTEMPTS = int(os.environ.get('STORAGE_RETRY_ATTEMPTS', 3))
+STORAGE_RETRY_BACKOFF = float(os.environ.get('STORAGE_RETRY_BACKOFF', 0.2))
 
 
 # Password validation
@@ -289,17 +384,48 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': ( 
-        'rest_framework_simplejwt.authentication.JWTAuthentication', 
+        'apps.account.authentication.CachedJWTAuthentication', 
     ),
     "EXCEPTION_HANDLER": "core.exceptions.custom_exception_handler",
+    # JSON 직렬화/파싱은 orjson (출력 형식은 기본 JSONRenderer 와 같음)
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    # 요청 제한 (core/throttling.py): 뷰의 throttle_scope 별 "횟수/기간", 사용자(비로그인은 IP)마다 계산
+    # - 기간 안에 횟수만큼 몰아서 보낼 수 있고 이후 기간/횟수 간격으로 회복 (token bucket)
+    # - THROTTLE_RATES(JSON)로 범위별 덮어쓰기, null 이면 제한 없음
+    'DEFAULT_THROTTLE_CLASSES': (
+        'core.throttling.TokenBucketThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        # 좋아요/스크랩 토글 (행 쓰기 + 알림)
+        'toggle': '60/min',
+        # 게시글 검색 (검색 기록 저장 + 전문 검색 쿼리)
+        'search': '30/min',
+        # 댓글 작성 (멘션/댓글 알림 푸시)
+        'comment': '20/min',
+        **json.loads(os.environ.get('THROTTLE_RATES', '{}')),
+    },
 }
 
+# 응답 압축 (core.compression.CompressionMiddleware): 이 크기(바이트) 이상인 JSON/텍스트 응답만
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+# brotli 품질 (0~11): 요청마다 압축하므로 속도와 압축률의 균형값
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 4))
+
 # CORS
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+# 이보다 큰 업로드 파일은 디스크 임시 파일(TemporaryUploadedFile)로 받아 저장소에 스트리밍 (요청당 메모리 사용 제한)
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.environ.get('FILE_UPLOAD_MAX_MEMORY_SIZE', 2.5 * 1024 * 1024))
 
 from datetime import timedelta 
 REST_USE_JWT = True 
@@ -14,10 +14,14 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.http import HttpResponse, JsonResponse
 
+from core.metrics import metrics_view
+
 def index(request):
     return HttpResponse("OK", status=200)
 
@@ -58,6 +62,7 @@ def assetlinks(request):
 urlpatterns = [
     path('', index),
     path('admin/', admin.site.urls),
+    path('metrics/', metrics_view, name='metrics'),
     path('account/', include('apps.account.urls')),
     path('board/', include('apps.board.urls')),
     path('notification/', include('apps.notification.urls')),
@@ -66,3 +71,7 @@ urlpatterns = [
     path('.well-known/apple-app-site-association', apple_app_site_association),
     path('.well-known/assetlinks.json', assetlinks),
 ]
+
+# 로컬 이미지 저장소 사용 시 업로드 파일 서빙 (DEBUG 에서만 동작)
+if settings.IMAGE_STORAGE_BACKEND == 'local':
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)